@@ -0,0 +1,258 @@
+"""
+Benchmarks RealtimeClient, AsyncClient and ProxyClient end to end against the
+local mock server, across concurrency levels, result sizes and raw/parsed
+results, and writes the measurements as JSON.
+
+Every scenario runs in a fresh process, talking to a mock server in another
+process, so CPU time and peak RSS are those of the client alone.
+
+Usage:
+    python benchmarks/bench_clients.py [--clients realtime,push_pull,proxy]
+        [--concurrency 1,8,32] [--sizes 10240,102400] [--modes raw,parsed]
+        [--jobs N] [--latency SECONDS] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import multiprocessing
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from oxylabs import AsyncClient, ProxyClient, RealtimeClient
+from oxylabs._version import __version__
+from oxylabs.testing import MockServer, html_fixture, search_fixture
+
+CLIENTS = ("realtime", "push_pull", "proxy")
+MODES = ("raw", "parsed")
+
+# The approximate size of one organic result of the parsed fixture.
+ITEM_SIZE = 250
+
+
+def serve(size: int, latency: float, ready, stop) -> None:
+    """
+    Runs a mock server whose results are about `size` bytes until `stop`
+    is set.
+    """
+    server = MockServer(
+        latency=latency,
+        job_duration=latency,
+        fixture=html_fixture(size),
+        parsed_fixture=search_fixture(max(1, size // ITEM_SIZE)),
+    ).start_thread()
+    ready.put(
+        {kind: server.client_kwargs(kind) for kind in CLIENTS},
+    )
+    stop.wait()
+    server.stop_thread()
+
+
+def peak_rss_mib() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / (1024**2 if sys.platform == "darwin" else 1024)
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def timed(job: Callable, latencies: list) -> Callable:
+    def run(i: int) -> bool:
+        started = time.perf_counter()
+        ok = job(i)
+        latencies.append(time.perf_counter() - started)
+        return ok
+
+    return run
+
+
+def run_threads(job: Callable, jobs: int, concurrency: int) -> list:
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(job, range(jobs)))
+
+
+def run_scenario(scenario: dict, kwargs: dict, results) -> None:
+    """
+    Runs the jobs of one scenario and reports its measurements.
+    """
+    logging.getLogger("oxylabs").setLevel(logging.CRITICAL)
+    client, jobs = scenario["client"], scenario["jobs"]
+    concurrency = scenario["concurrency"]
+    parse = scenario["mode"] == "parsed" or None
+    latencies: List[float] = []
+
+    if client == "realtime":
+        c = RealtimeClient("user", "pass", **kwargs["realtime"])
+
+        def job(i: int) -> bool:
+            response = c.ecommerce.universal.scrape_url(
+                f"https://www.example.com/{i}", parse=parse
+            )
+            return bool(response.results)
+
+    elif client == "proxy":
+        proxy = ProxyClient("user", "pass", **kwargs["proxy"])
+
+        def job(i: int) -> bool:
+            response = proxy.get(f"http://www.example.com/{i}", parse=parse)
+            return response is not None
+
+    else:
+        c = AsyncClient("user", "pass", **kwargs["push_pull"])
+
+        async def main() -> list:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def job(i: int) -> bool:
+                async with semaphore:
+                    started = time.perf_counter()
+                    response = await c.ecommerce.universal.scrape_url(
+                        f"https://www.example.com/{i}",
+                        parse=parse,
+                        poll_interval=scenario["latency"],
+                    )
+                    latencies.append(time.perf_counter() - started)
+                    return bool(response.results)
+
+            return await asyncio.gather(*(job(i) for i in range(jobs)))
+
+    cpu = time.process_time()
+    started = time.perf_counter()
+    if client == "push_pull":
+        ok = asyncio.run(main())
+    else:
+        ok = run_threads(timed(job, latencies), jobs, concurrency)
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu
+
+    results.put(
+        {
+            **scenario,
+            "errors": ok.count(False),
+            "elapsed_s": elapsed,
+            "throughput_jobs_s": jobs / elapsed,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "cpu_ms_per_job": cpu / jobs * 1000,
+            "peak_rss_mib": peak_rss_mib(),
+        }
+    )
+
+
+def run(scenario: dict) -> dict:
+    context = multiprocessing.get_context("spawn")
+    ready, stop, results = context.Queue(), context.Event(), context.Queue()
+    server = context.Process(
+        target=serve,
+        args=(scenario["size"], scenario["latency"], ready, stop),
+        daemon=True,
+    )
+    server.start()
+    try:
+        kwargs = ready.get(timeout=30)
+        worker = context.Process(
+            target=run_scenario, args=(scenario, kwargs, results)
+        )
+        worker.start()
+        result = results.get()
+        worker.join()
+        return result
+    finally:
+        stop.set()
+        server.join()
+
+
+def csv(kind: Callable) -> Callable:
+    return lambda value: tuple(kind(v) for v in value.split(","))
+
+
+def scenarios(args: argparse.Namespace) -> List[dict]:
+    grid: List[Tuple] = itertools.product(
+        args.clients, args.concurrency, args.sizes, args.modes
+    )
+    return [
+        {
+            "client": client,
+            "concurrency": concurrency,
+            "size": size,
+            "mode": mode,
+            "jobs": args.jobs,
+            "latency": args.latency,
+        }
+        for client, concurrency, size, mode in grid
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=csv(str), default=CLIENTS)
+    parser.add_argument("--concurrency", type=csv(int), default=(1, 8, 32))
+    parser.add_argument(
+        "--sizes", type=csv(int), default=(10 * 1024, 100 * 1024)
+    )
+    parser.add_argument("--modes", type=csv(str), default=MODES)
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    for name, allowed in (("clients", CLIENTS), ("modes", MODES)):
+        unknown = set(getattr(args, name)) - set(allowed)
+        if unknown:
+            parser.error(f"unknown {name}: {', '.join(sorted(unknown))}")
+
+    results = []
+    print(
+        f"{'client':<10} {'conc':>4} {'size':>7} {'mode':<6} {'jobs/s':>8} "
+        f"{'p50 ms':>8} {'p99 ms':>8} {'cpu ms':>7} {'rss MiB':>8}"
+    )
+    for scenario in scenarios(args):
+        result = run(scenario)
+        results.append(result)
+        print(
+            f"{result['client']:<10} {result['concurrency']:>4} "
+            f"{result['size']:>7} {result['mode']:<6} "
+            f"{result['throughput_jobs_s']:>8.1f} {result['p50_ms']:>8.1f} "
+            f"{result['p99_ms']:>8.1f} {result['cpu_ms_per_job']:>7.2f} "
+            f"{result['peak_rss_mib'] or 0:>8.1f}"
+            + (f"  {result['errors']} errors" if result["errors"] else "")
+        )
+
+    report = {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "args": {k: v for k, v in vars(args).items() if k != "output"},
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
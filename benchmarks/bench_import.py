@@ -0,0 +1,142 @@
+"""
+Measures the time to import the SDK and create clients in fresh
+interpreters, using `-X importtime` to report the modules each scenario
+loads and the slowest of them.
+
+Usage:
+    python benchmarks/bench_import.py [--runs N] [--top N] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import oxylabs": "import oxylabs",
+    "RealtimeClient": "from oxylabs import RealtimeClient\n"
+    "RealtimeClient('user', 'pass')",
+    "RealtimeClient.serp": "from oxylabs import RealtimeClient\n"
+    "RealtimeClient('user', 'pass').serp.google",
+    "AsyncClient": "from oxylabs import AsyncClient\n"
+    "AsyncClient('user', 'pass').ecommerce.amazon",
+    "ProxyClient": "from oxylabs import ProxyClient\n"
+    "ProxyClient('user', 'pass')",
+    # Everything the package used to import up front.
+    "everything": "from oxylabs import AsyncClient, ProxyClient\n"
+    "import aiohttp\n"
+    "c = AsyncClient('user', 'pass')\n"
+    "c.serp, c.ecommerce",
+}
+
+HEAVY = ("aiohttp", "requests", "asyncio")
+
+TIMED = """
+import sys, time
+started = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - started
+print(elapsed, ",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def run(code: str, env: dict) -> tuple:
+    """
+    Runs a scenario in a fresh interpreter and returns its wall time, the
+    heavy modules it loaded and the `-X importtime` report.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            TIMED.format(code=code, heavy=HEAVY),
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    elapsed, loaded = result.stdout.split(" ")
+    return float(elapsed), loaded.strip(), result.stderr
+
+
+def parse_importtime(report: str) -> list:
+    """
+    Returns the (module, self us, cumulative us) entries of an importtime
+    report.
+    """
+    entries = []
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        entries.append((module.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [os.path.abspath(src), env.get("PYTHONPATH")])
+    )
+    # Warm up the bytecode caches so that compilation is not measured.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    run("; ".join(SCENARIOS.values()).replace("\n", "; "), env)
+    baseline = {module for module, _, _ in parse_importtime(run("", env)[2])}
+
+    results = []
+    for name, code in SCENARIOS.items():
+        timings = []
+        for _ in range(args.runs):
+            elapsed, loaded, report = run(code, env)
+            timings.append(elapsed)
+        entries = [e for e in parse_importtime(report) if e[0] not in baseline]
+        slowest = sorted(entries, key=lambda e: e[1], reverse=True)
+        results.append(
+            {
+                "scenario": name,
+                "median_ms": statistics.median(timings) * 1000,
+                "min_ms": min(timings) * 1000,
+                "modules": len(entries),
+                "heavy_modules": loaded.split(",") if loaded else [],
+                "slowest": [
+                    {"module": module, "self_ms": self_us / 1000}
+                    for module, self_us, _ in slowest[: args.top]
+                ],
+            }
+        )
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+    print(
+        f"{'scenario':<20} {'median ms':>10} {'min ms':>8} {'modules':>8}  "
+        "heavy modules"
+    )
+    for result in results:
+        print(
+            f"{result['scenario']:<20} {result['median_ms']:>10.1f} "
+            f"{result['min_ms']:>8.1f} {result['modules']:>8}  "
+            f"{', '.join(result['heavy_modules']) or '-'}"
+        )
+    for result in results:
+        slowest = ", ".join(
+            f"{s['module']} {s['self_ms']:.1f}" for s in result["slowest"]
+        )
+        print(f"\n{result['scenario']}: {slowest}")
+
+
+if __name__ == "__main__":
+    main()
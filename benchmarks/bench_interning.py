@@ -0,0 +1,133 @@
+"""
+Measures the memory held by a batch of Amazon search responses with and
+without an InternPool.
+
+Usage:
+    python benchmarks/bench_interning.py [--responses N]
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_response_models import make_job  # noqa: E402
+
+from oxylabs.sources.ecommerce.response import (  # noqa: E402
+    EcommerceResponse,
+)
+from oxylabs.utils.intern import InternPool  # noqa: E402
+
+MANUFACTURERS = [f"Brand {i}" for i in range(40)]
+MERCHANTS = [f"Merchant {i}" for i in range(25)]
+LADDERS = [
+    ["Electronics", "Headphones", "Over-Ear Headphones"],
+    ["Electronics", "Smart Home", "Smart Speakers"],
+    ["Home & Kitchen", "Kitchen & Dining", "Coffee Machines"],
+]
+
+
+def make_amazon_search(rng: random.Random, organic: int = 48) -> dict:
+    def item(pos: int) -> dict:
+        asin = "B0" + "".join(rng.choices("0123456789ABCDEFGHJK", k=8))
+        return {
+            "pos": pos,
+            "url": f"/dp/{asin}",
+            "asin": asin,
+            "price": round(rng.uniform(5, 500), 2),
+            "title": f"Product {asin} with a descriptive title",
+            "rating": rng.choice([3.5, 4.0, 4.5, 5.0]),
+            "currency": "USD",
+            "url_image": f"https://m.media-amazon.com/images/I/{asin}.jpg",
+            "best_seller": rng.random() < 0.05,
+            "manufacturer": rng.choice(MANUFACTURERS),
+            "reviews_count": rng.randint(0, 50000),
+            "is_prime": rng.random() < 0.6,
+            "sales_volume": "1K+ bought in past month",
+            "type": "search_product",
+            "merchant": {"name": rng.choice(MERCHANTS), "url": "/s?me=1"},
+        }
+
+    ladder = rng.choice(LADDERS)
+    content = {
+        "url": "https://www.amazon.com/s?k=headphones",
+        "page": 1,
+        "pages": 7,
+        "query": "headphones",
+        "results": {
+            "organic": [item(i + 1) for i in range(organic)],
+            "paid": [
+                dict(item(i + 1), url_shown="amazon.com", is_sponsored=True)
+                for i in range(4)
+            ],
+        },
+        "category": [{"ladder": [{"name": name} for name in ladder]}],
+        "currency": "USD",
+        "page_type": "Search",
+        "parse_status_code": 12000,
+    }
+    return {
+        "results": [
+            {
+                "page": 1,
+                "status_code": 200,
+                "parser_type": "amazon_search",
+                "url": content["url"],
+                "content_parsed": content,
+            }
+        ],
+        "job": make_job("amazon_search"),
+    }
+
+
+def measure(bodies: list, pool: InternPool = None) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    if pool is None:
+        responses = [EcommerceResponse(json.loads(body)) for body in bodies]
+    else:
+        with pool:
+            responses = [
+                EcommerceResponse(json.loads(body)) for body in bodies
+            ]
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del responses
+    return held, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--responses", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    bodies = [
+        json.dumps(make_amazon_search(rng)).encode()
+        for _ in range(args.responses)
+    ]
+
+    plain, plain_time = measure(bodies)
+    pool = InternPool()
+    interned, interned_time = measure(bodies, pool)
+    saved = plain - interned
+    print(f"amazon_search x {args.responses}")
+    print(f"  without pool  {plain / 2**20:>8.1f} MiB  {plain_time:.2f} s")
+    print(
+        f"  with pool     {interned / 2**20:>8.1f} MiB  "
+        f"{interned_time:.2f} s  ({len(pool)} pooled strings)"
+    )
+    print(f"  saved         {saved / 2**20:>8.1f} MiB ({saved / plain:.1%})")
+
+
+if __name__ == "__main__":
+    main()
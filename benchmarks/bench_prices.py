@@ -0,0 +1,107 @@
+"""
+Compares batch price normalization against a per-row Python loop.
+
+Usage:
+    python benchmarks/bench_prices.py [--responses N]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_interning import make_amazon_search  # noqa: E402
+
+from oxylabs.sources.ecommerce.prices import (  # noqa: E402
+    COMMA_DECIMAL_DOMAINS,
+    DOMAIN_CURRENCIES,
+    PRICE_FIELDS,
+    normalize_prices,
+)
+
+
+def localize(data: dict, rng: random.Random) -> dict:
+    """
+    Moves a search page to amazon.de and writes half of its prices as
+    strings, as returned for pages that couldn't be fully parsed.
+    """
+    result = data["results"][0]
+    result["url"] = result["url"].replace("amazon.com", "amazon.de")
+    for item in result["content_parsed"]["results"]["organic"]:
+        if rng.random() < 0.5:
+            item["price"] = f"{item['price']:,.2f} €".translate(
+                str.maketrans(",.", ".,")
+            )
+    return data
+
+
+def parse(price, comma: bool) -> float:
+    if isinstance(price, str):
+        text = "".join(c for c in price if c in "0123456789.,")
+        if comma:
+            text = text.replace(".", "").replace(",", ".")
+        else:
+            text = text.replace(",", "")
+        try:
+            return float(text)
+        except ValueError:
+            return math.nan
+    if price is None:
+        return math.nan
+    return float(price)
+
+
+def loop(responses: list) -> dict:
+    columns = {name: [] for name in PRICE_FIELDS}
+    currencies = []
+    for response in responses:
+        for result in response["results"]:
+            domain = result["url"].split("/")[2].split(".", 2)[2]
+            comma = domain in COMMA_DECIMAL_DOMAINS
+            content = result["content_parsed"]
+            for item in content["results"]["organic"]:
+                for name in PRICE_FIELDS:
+                    columns[name].append(parse(item.get(name), comma))
+                currency = item.get("currency") or content.get("currency")
+                currencies.append(
+                    currency.upper()
+                    if currency
+                    else DOMAIN_CURRENCIES.get(domain, "")
+                )
+    columns["currency"] = currencies
+    return columns
+
+
+def timed(fn, *args, repeat: int = 3) -> tuple:
+    elapsed = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = fn(*args)
+        elapsed.append(time.perf_counter() - started)
+    return value, min(elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--responses", type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    responses = [
+        localize(make_amazon_search(rng), rng) for _ in range(args.responses)
+    ]
+
+    columns, loop_time = timed(loop, responses)
+    batch, batch_time = timed(normalize_prices, responses)
+    assert len(batch) == len(columns["price"])
+    print(f"amazon_search x {args.responses} ({len(batch)} rows)")
+    print(f"  python loop        {loop_time:.2f} s")
+    print(f"  normalize_prices   {batch_time:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compares the threaded ProxyClient against AsyncProxyClient on a local mock
+proxy endpoint that answers every request after a fixed latency.
+
+Usage:
+    python benchmarks/bench_proxy.py [--requests N] [--concurrency N]
+        [--latency SECONDS] [--size BYTES]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from oxylabs.proxy import AsyncProxyClient, ProxyClient
+from oxylabs.testing import MockServer, html_fixture
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--size", type=int, default=50 * 1024)
+    args = parser.parse_args()
+
+    logging.getLogger("oxylabs").setLevel(logging.CRITICAL)
+    server = MockServer(
+        latency=args.latency, fixture=html_fixture(args.size)
+    ).start_thread()
+    urls = [f"http://example.test/{i}" for i in range(args.requests)]
+
+    kwargs = server.client_kwargs("proxy")
+    sync = ProxyClient("user", "pass", **kwargs)
+    client = AsyncProxyClient("user", "pass", args.concurrency, **kwargs)
+
+    ideal = args.requests * args.latency / args.concurrency
+    print(
+        f"{args.requests} requests, concurrency {args.concurrency}, "
+        f"latency {args.latency * 1000:.0f} ms (ideal {ideal:.2f} s)"
+    )
+
+    started = time.perf_counter()
+    results = sync.get_many(urls, max_workers=args.concurrency)
+    elapsed = time.perf_counter() - started
+    assert all(r is not None for r in results)
+    print(
+        f"  ProxyClient.get_many       {elapsed:.2f} s "
+        f"{args.requests / elapsed:>8.0f} req/s"
+    )
+
+    async def run() -> list:
+        async with client:
+            return await client.get_many(urls)
+
+    started = time.perf_counter()
+    results = asyncio.run(run())
+    elapsed = time.perf_counter() - started
+    assert all(r is not None for r in results)
+    print(
+        f"  AsyncProxyClient.get_many  {elapsed:.2f} s "
+        f"{args.requests / elapsed:>8.0f} req/s"
+    )
+    server.stop_thread()
+
+
+if __name__ == "__main__":
+    main()
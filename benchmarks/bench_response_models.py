@@ -0,0 +1,220 @@
+"""
+Compares decode-to-typed-object throughput of the schema-compiled response
+models against the previous hand-written classes.
+
+Usage:
+    python benchmarks/bench_response_models.py [--iterations N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from legacy import ecommerce_response as legacy_ecommerce  # noqa: E402
+from legacy import serp_response as legacy_serp  # noqa: E402
+
+from oxylabs.sources.ecommerce.amazon.response import (  # noqa: E402
+    AmazonProductResponse,
+)
+from oxylabs.sources.ecommerce.response import (  # noqa: E402
+    EcommerceResponse,
+)
+from oxylabs.sources.serp.google.response import (  # noqa: E402
+    GoogleSearchResponse,
+)
+from oxylabs.sources.serp.response import SERPResponse  # noqa: E402
+
+
+def make_job(source: str) -> dict:
+    return {
+        "id": "7183748419983513601",
+        "source": source,
+        "status": "done",
+        "domain": "com",
+        "geo_location": "United States",
+        "parse": True,
+        "pages": 1,
+        "start_page": 1,
+        "context": [{"key": "results_language", "value": "en"}],
+        "_links": [
+            {"rel": "self", "href": "https://data.oxylabs.io/v1/queries/1"}
+        ],
+    }
+
+
+def make_google_search(pages: int = 3, organic: int = 50) -> dict:
+    sitelinks = {
+        "expanded": [
+            {"url": f"https://example.com/{i}", "title": f"Link {i}"}
+            for i in range(4)
+        ],
+        "inline": [
+            {"url": f"https://example.com/i{i}", "title": f"Inline {i}"}
+            for i in range(3)
+        ],
+    }
+    results = []
+    for page in range(1, pages + 1):
+        results.append(
+            {
+                "page": page,
+                "url": "https://www.google.com/search?q=adidas",
+                "status_code": 200,
+                "parser_type": "",
+                "content_parsed": {
+                    "url": "https://www.google.com/search?q=adidas",
+                    "page": page,
+                    "parse_status_code": 12000,
+                    "results": {
+                        "organic": [
+                            {
+                                "pos": i + 1,
+                                "url": f"https://www.adidas.com/{i}",
+                                "desc": "Shop the latest adidas " * 4,
+                                "title": f"adidas Official Website {i}",
+                                "url_shown": "https://www.adidas.com",
+                                "pos_overall": i + 3,
+                                "sitelinks": sitelinks,
+                            }
+                            for i in range(organic)
+                        ],
+                        "paid": [
+                            {
+                                "pos": i + 1,
+                                "url": f"https://ads.example.com/{i}",
+                                "title": f"Ad {i}",
+                                "desc": "Buy now " * 6,
+                                "url_shown": "ads.example.com",
+                                "pos_overall": i + 1,
+                                "sitelinks": sitelinks,
+                            }
+                            for i in range(4)
+                        ],
+                        "related_questions": {
+                            "pos_overall": 10,
+                            "related_questions": [
+                                {"pos": i, "question": f"Question {i}?"}
+                                for i in range(4)
+                            ],
+                        },
+                        "total_results_count": 1230000000,
+                    },
+                },
+            }
+        )
+    return {"results": results, "job": make_job("google_search")}
+
+
+def make_amazon_product(reviews: int = 20, pricing: int = 20) -> dict:
+    content = {
+        "url": "https://www.amazon.com/dp/B07FZ8S74R",
+        "asin": "B07FZ8S74R",
+        "title": "Echo Dot (3rd Gen) - Smart speaker with Alexa",
+        "price": 39.99,
+        "price_upper": 49.99,
+        "currency": "USD",
+        "rating": 4.7,
+        "reviews_count": 951212,
+        "stock": "In Stock",
+        "bullet_points": "Meet Echo Dot " * 20,
+        "category": [
+            {
+                "ladder": [
+                    {"url": "/electronics", "name": "Electronics"},
+                    {"url": "/smart-speakers", "name": "Smart Speakers"},
+                ]
+            }
+        ],
+        "sales_rank": [
+            {"rank": 1, "ladder": [{"url": "/x", "name": "Electronics"}]}
+        ],
+        "reviews": [
+            {
+                "id": f"R{i}",
+                "title": f"Review {i}",
+                "author": "Customer",
+                "rating": 5,
+                "content": "Great speaker " * 15,
+                "timestamp": "Reviewed in the United States on May 1, 2021",
+                "is_verified": True,
+            }
+            for i in range(reviews)
+        ],
+        "pricing": [
+            {
+                "price": 39.99 + i,
+                "seller": f"Seller {i}",
+                "currency": "USD",
+                "condition": "New",
+                "price_shipping": 0,
+            }
+            for i in range(pricing)
+        ],
+        "rating_star_distribution": [
+            {"rating": i, "percentage": 20} for i in range(1, 6)
+        ],
+        "product_details": {"asin": "B07FZ8S74R", "item_weight": "10.6 oz"},
+        "parse_status_code": 12000,
+    }
+    return {
+        "results": [
+            {
+                "page": 1,
+                "status_code": 200,
+                "url": content["url"],
+                "content_parsed": content,
+            }
+        ],
+        "job": make_job("amazon_product"),
+    }
+
+
+def best(fn, iterations: int) -> float:
+    return min(timeit.repeat(fn, number=iterations, repeat=7)) / iterations
+
+
+def bench(name: str, body: bytes, models: dict, iterations: int) -> None:
+    data = json.loads(body)
+    decode = best(lambda: json.loads(body), iterations)
+    print(f"{name} ({len(body) / 1024:.0f} KiB, decode {decode * 1e6:.0f} us)")
+    for label, model in models.items():
+        build = best(lambda: model(data), iterations)
+        print(
+            f"  {label:<32}build {build * 1e6:>8.1f} us"
+            f"  decode+build {1 / (decode + build):>8.0f} docs/s"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    bench(
+        "google_search",
+        json.dumps(make_google_search()).encode(),
+        {
+            "hand-written SERPResponse": legacy_serp.SERPResponse,
+            "compiled SERPResponse": SERPResponse,
+            "compiled GoogleSearchResponse": GoogleSearchResponse,
+        },
+        args.iterations,
+    )
+    bench(
+        "amazon_product",
+        json.dumps(make_amazon_product()).encode(),
+        {
+            "hand-written EcommerceResponse": legacy_ecommerce.EcommerceResponse,
+            "compiled EcommerceResponse": EcommerceResponse,
+            "compiled AmazonProductResponse": AmazonProductResponse,
+        },
+        args.iterations,
+    )
+
+
+if __name__ == "__main__":
+    main()
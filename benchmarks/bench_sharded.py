@@ -0,0 +1,189 @@
+"""
+Benchmarks how `oxylabs run --processes N` scales with the number of worker
+processes against local mock servers, and writes the measurements as JSON.
+
+Each worker process talks to a mock server of its own, in another process,
+so that the servers do not bound the throughput. Run it on a machine with at
+least as many cores as twice the largest process count for the scaling to be
+meaningful.
+
+Usage:
+    python benchmarks/bench_sharded.py [--processes 1,2,4,8,16] [--jobs N]
+        [--concurrency N] [--size BYTES] [--mode raw|parsed]
+        [--latency SECONDS] [--output results.json]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from bench_clients import serve
+
+from oxylabs._version import __version__
+
+
+def children_cpu_s() -> float:
+    if resource is None:
+        return float("nan")
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def run(processes: int, args: argparse.Namespace, workdir: str) -> dict:
+    """
+    Runs the command with the given number of processes against one mock
+    server per process and returns its measurements.
+    """
+    context = multiprocessing.get_context("spawn")
+    ready, stop = context.Queue(), context.Event()
+    servers = [
+        context.Process(
+            target=serve,
+            args=(args.size, args.latency, ready, stop),
+            daemon=True,
+        )
+        for _ in range(processes)
+    ]
+    for server in servers:
+        server.start()
+    try:
+        urls = [
+            ready.get(timeout=30)["push_pull"]["base_url"] for _ in servers
+        ]
+        out = os.path.join(workdir, f"results-{processes}.jsonl")
+        command = [
+            sys.executable,
+            "-m",
+            "oxylabs",
+            "run",
+            "--source",
+            "google_search",
+            "--input",
+            os.path.join(workdir, "queries.jsonl"),
+            "--out",
+            out,
+            "--concurrency",
+            str(args.concurrency),
+            "--processes",
+            str(processes),
+            "--username",
+            "user",
+            "--password",
+            "pass",
+            "--base-url",
+            ",".join(urls),
+            "--poll-interval",
+            str(max(args.latency, 0.05)),
+            "--progress",
+            "0",
+        ]
+        if args.mode == "parsed":
+            command += ["-p", "parse=true"]
+        cpu = children_cpu_s()
+        started = time.perf_counter()
+        result = subprocess.run(command, capture_output=True, text=True)
+        elapsed = time.perf_counter() - started
+        cpu = children_cpu_s() - cpu
+    finally:
+        stop.set()
+        for server in servers:
+            server.join()
+
+    with open(out, "rb") as file:
+        written = sum(1 for _ in file)
+    for path in (out, out + ".checkpoint"):
+        os.remove(path)
+    return {
+        "processes": processes,
+        "jobs": args.jobs,
+        "written": written,
+        "exit_code": result.returncode,
+        "wall_s": elapsed,
+        "throughput_jobs_s": written / elapsed,
+        "cpu_s": cpu,
+        "cpu_ms_per_job": cpu * 1000 / max(written, 1),
+    }
+
+
+def csv(value: str) -> tuple:
+    return tuple(int(v) for v in value.split(","))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--processes", type=csv, default=(1, 2, 4, 8, 16))
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=256)
+    parser.add_argument("--size", type=int, default=100 * 1024)
+    parser.add_argument("--mode", choices=("raw", "parsed"), default="raw")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    # The command runs in fresh interpreters, which import this checkout.
+    src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+    os.environ["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [os.path.abspath(src), os.environ.get("PYTHONPATH")])
+    )
+
+    results = []
+    print(
+        f"{'procs':>5} {'jobs/s':>8} {'speedup':>8} {'wall s':>7} "
+        f"{'cpu ms/job':>10}"
+    )
+    with tempfile.TemporaryDirectory() as workdir:
+        with open(os.path.join(workdir, "queries.jsonl"), "w") as file:
+            for i in range(args.jobs):
+                file.write(json.dumps(f"query {i}") + "\n")
+        for processes in args.processes:
+            result = run(processes, args, workdir)
+            result["speedup"] = (
+                result["throughput_jobs_s"] / results[0]["throughput_jobs_s"]
+                if results
+                else 1.0
+            )
+            results.append(result)
+            print(
+                f"{processes:>5} {result['throughput_jobs_s']:>8.1f} "
+                f"{result['speedup']:>8.2f} {result['wall_s']:>7.2f} "
+                f"{result['cpu_ms_per_job']:>10.2f}"
+                + (
+                    f"  {args.jobs - result['written']} missing"
+                    if result["written"] != args.jobs
+                    else ""
+                )
+            )
+
+    report = {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "args": {k: v for k, v in vars(args).items() if k != "output"},
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Measures the time to build and encode the payloads of a batch of Google
+search jobs that only differ in their query, per call and from a
+PayloadTemplate.
+
+Usage:
+    python benchmarks/bench_template.py [--jobs N]
+"""
+
+import argparse
+import json
+import time
+
+from oxylabs import PayloadTemplate
+from oxylabs.sources import registry
+from oxylabs.utils.utils import prepare_config
+
+COMMON = {
+    "domain": "de",
+    "start_page": 1,
+    "pages": 1,
+    "limit": 10,
+    "locale": None,
+    "geo_location": "Berlin,Germany",
+    "user_agent_type": "desktop",
+    "render": None,
+    "callback_url": None,
+    "parse": True,
+    "context": [{"key": "filter", "value": 1}],
+    "parsing_instructions": None,
+}
+
+
+def per_call(queries: list) -> float:
+    """
+    Builds each payload as a scrape method call does: from all of its
+    parameters, dropping None values, with its own config.
+    """
+    spec = registry.get("google_search")
+    started = time.perf_counter()
+    for query in queries:
+        payload = spec.payload({"query": query, **COMMON})
+        payload = {k: v for k, v in payload.items() if v is not None}
+        prepare_config(request_timeout=None)
+        json.dumps(payload).encode()
+    return time.perf_counter() - started
+
+
+def templated(queries: list) -> float:
+    started = time.perf_counter()
+    template = PayloadTemplate("google_search", **COMMON)
+    prepare_config(request_timeout=None)
+    for query in queries:
+        template.stamp(query=query)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=100000)
+    args = parser.parse_args()
+
+    queries = [f"query {i}" for i in range(args.jobs)]
+    plain = per_call(queries)
+    stamped = templated(queries)
+    print(f"google_search x {args.jobs}")
+    print(f"  per call   {plain:.3f} s  {plain / args.jobs * 1e6:.2f} us/job")
+    print(
+        f"  template   {stamped:.3f} s  "
+        f"{stamped / args.jobs * 1e6:.2f} us/job  ({plain / stamped:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
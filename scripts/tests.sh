@@ -11,6 +11,46 @@ python -m unittest tests.sources.ecommerce.test_wayfair.TestWayfairSearchSync
 python -m unittest tests.sources.ecommerce.test_wayfair.TestWayfairSearchAsync
 python -m unittest tests.sources.ecommerce.test_wayfair.TestWayfairUrlSync
 python -m unittest tests.sources.ecommerce.test_wayfair.TestWayfairUrlAsync
+python -m unittest tests.sources.ecommerce.test_prices.TestNormalizePrices
+
+# Run response model tests
+python -m unittest tests.sources.test_response.TestResponseModels
+python -m unittest tests.sources.test_router.TestRouter
+
+# Run internal tests
+python -m unittest tests.internal.test_credentials.TestCredentialPool
+python -m unittest tests.internal.test_credentials.TestPooledClients
+python -m unittest tests.internal.test_credentials.TestPooledPushPull
 
 # Run proxy tests
 python -m unittest tests.proxy.test_proxy.TestProxyGet
+python -m unittest tests.proxy.test_proxy.TestProxyOptions
+python -m unittest tests.proxy.test_proxy.TestProxyStream
+python -m unittest tests.proxy.test_proxy.TestAsyncProxyClient
+
+# Run mock server tests
+python -m unittest tests.testing.test_mock_server.TestMockServerSync
+python -m unittest tests.testing.test_mock_server.TestMockServerAsync
+
+# Run utils tests
+python -m unittest tests.utils.test_stream.TestResultsStreamParser
+python -m unittest tests.utils.test_stream.TestRealtimeStream
+python -m unittest tests.utils.test_serialization.TestSerialization
+python -m unittest tests.utils.test_intern.TestInternPool
+python -m unittest tests.utils.test_hosts.TestHostIndex
+python -m unittest tests.utils.test_metrics.TestMetricsRegistry
+python -m unittest tests.utils.test_metrics.TestClientMetrics
+python -m unittest tests.utils.test_tracing.TestHooks
+python -m unittest tests.utils.test_tracing.TestClientHooks
+python -m unittest tests.utils.test_lazy.TestLazyImports
+python -m unittest tests.utils.test_log.TestLogging
+python -m unittest tests.test_cli.TestCLI
+python -m unittest tests.internal.test_batch.TestRealtimeBatch
+python -m unittest tests.sources.test_registry.TestRegistry
+python -m unittest tests.sources.test_registry.TestRegistryAsync
+python -m unittest tests.internal.test_pages.TestParallelPages
+python -m unittest tests.internal.test_pages.TestParallelPagesAsync
+python -m unittest tests.sources.test_fanout.TestFanOut
+python -m unittest tests.sources.test_fanout.TestFanOutAsync
+python -m unittest tests.sources.test_template.TestPayloadTemplate
+python -m unittest tests.sources.test_template.TestPayloadTemplateAsync
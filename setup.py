@@ -30,4 +30,10 @@ setup(
     package_dir={"": "src"},
     packages=find_packages(where="src"),
     install_requires=["aiohttp", "requests"],
+    extras_require={
+        "numpy": ["numpy"],
+        "serialization": ["msgpack", "zstandard"],
+        "parquet": ["pyarrow"],
+    },
+    entry_points={"console_scripts": ["oxylabs=oxylabs.cli:main"]},
 )
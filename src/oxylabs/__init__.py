@@ -1,2 +1,32 @@
-from .internal import AsyncClient, RealtimeClient
-from .proxy.proxy import ProxyClient
+from typing import TYPE_CHECKING
+
+from .utils.lazy import lazy_attributes
+
+# The clients are imported on first access, so that importing the package
+# does not import aiohttp, requests and every source module.
+_ATTRIBUTES = {
+    "AsyncClient": "oxylabs.internal.internal",
+    "RealtimeClient": "oxylabs.internal.internal",
+    "CredentialPool": "oxylabs.internal.credentials",
+    "AsyncProxyClient": "oxylabs.proxy.proxy",
+    "ProxyClient": "oxylabs.proxy.proxy",
+    "MetricsRegistry": "oxylabs.utils.metrics",
+    "Hooks": "oxylabs.utils.tracing",
+    "InMemoryExporter": "oxylabs.utils.tracing",
+    "PayloadTemplate": "oxylabs.sources.template",
+}
+
+__all__ = list(_ATTRIBUTES)
+__getattr__ = lazy_attributes(__name__, _ATTRIBUTES, globals())
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ATTRIBUTES))
+
+
+if TYPE_CHECKING:
+    from .internal import AsyncClient, CredentialPool, RealtimeClient
+    from .proxy.proxy import AsyncProxyClient, ProxyClient
+    from .sources.template import PayloadTemplate
+    from .utils.metrics import MetricsRegistry
+    from .utils.tracing import Hooks, InMemoryExporter
@@ -0,0 +1,5 @@
+import sys
+
+from oxylabs.cli import main
+
+sys.exit(main())
@@ -0,0 +1,910 @@
+import argparse
+import asyncio
+import csv
+import io
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+from collections import deque
+from queue import Empty
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Container,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from oxylabs.sources.template import PayloadTemplate
+from oxylabs.utils.defaults import (
+    BULK_CONCURRENCY,
+    BULK_FLUSH_INTERVAL,
+    BULK_PARQUET_ROWS,
+)
+from oxylabs.utils.lazy import lazy_import
+from oxylabs.utils.log import get_logger
+from oxylabs.utils.utils import prepare_config
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from oxylabs.internal.internal import AsyncClient
+    from oxylabs.utils.metrics import MetricsRegistry
+else:
+    aiohttp = lazy_import("aiohttp")
+
+logger = get_logger(__name__)
+
+# CSV values are strings; these parameters are converted to the types the
+# API expects. Other values, e.g. numeric queries, stay strings.
+_INT_FIELDS = frozenset(("start_page", "pages", "limit"))
+_BOOL_FIELDS = frozenset(("parse",))
+_JSON_FIELDS = frozenset(("context", "parsing_instructions"))
+
+
+def _coerce(row: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Converts the values of a CSV row, dropping empty ones.
+    """
+    params = {}
+    for key, value in row.items():
+        if key is None or value is None or value == "":
+            continue
+        if key in _INT_FIELDS:
+            params[key] = int(value)
+        elif key in _BOOL_FIELDS:
+            params[key] = value.strip().lower() in ("1", "true", "yes")
+        elif key in _JSON_FIELDS:
+            params[key] = json.loads(value)
+        else:
+            params[key] = value
+    return params
+
+
+class InvalidInput(dict):
+    """
+    An input that could not be read, e.g. a CSV row with a bad number,
+    yielded in its place so that the indices of the other inputs stay the
+    same. Its job fails with `error` without being submitted.
+    """
+
+    def __init__(self, row: Dict[str, Any], error: Exception) -> None:
+        super().__init__(row)
+        self.error = error
+
+
+def read_inputs(path: str, fmt: Optional[str] = None) -> Iterator[dict]:
+    """
+    Streams the query parameters of each job from a CSV file with a header
+    row or a JSON lines file of objects, or of strings taken as queries.
+
+    Args:
+        path (str): The file to read, or "-" for the standard input.
+        fmt (Optional[str]): "csv" or "jsonl". Defaults to the format of
+        the file extension.
+
+    Yields:
+        dict: The parameters of one job, or an `InvalidInput` for a row or
+        line that could not be read.
+    """
+    fmt = fmt or ("csv" if path.endswith(".csv") else "jsonl")
+    file = (
+        io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+        if path == "-"
+        else open(path, encoding="utf-8", newline="")
+    )
+    with file:
+        if fmt == "csv":
+            for row in csv.DictReader(file):
+                try:
+                    yield _coerce(row)
+                except ValueError as e:
+                    yield InvalidInput(row, e)
+            return
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except ValueError as e:
+                yield InvalidInput({}, e)
+                continue
+            if isinstance(item, str):
+                item = {"query": item}
+            elif not isinstance(item, dict):
+                yield InvalidInput(
+                    {}, ValueError(f"Expected an object: {line.strip()}")
+                )
+                continue
+            yield {k: v for k, v in item.items() if v is not None}
+
+
+class Checkpoint:
+    """
+    Records the inputs whose results were written, so that an interrupted
+    run resumes without resubmitting them.
+
+    The indices of written inputs are appended to the file, each batch
+    followed by the position of the output once flushed, e.g. "@1048576".
+    Indices without a position after them may belong to results that were
+    never flushed, so they are dropped on resume and the output is cut back
+    to the last position.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.done = set()
+        self.position = 0
+        committed = 0
+        pending = []
+        if os.path.exists(path):
+            with open(path, "rb") as file:
+                offset = 0
+                for line in file:
+                    offset += len(line)
+                    if not line.endswith(b"\n"):
+                        break
+                    if line.startswith(b"@"):
+                        self.done.update(pending)
+                        pending.clear()
+                        self.position = int(line[1:])
+                        committed = offset
+                    else:
+                        pending.append(int(line))
+        self._file = open(path, "ab")
+        self._file.truncate(committed)
+
+    def commit(self, indices: List[int], position: int) -> None:
+        """
+        Records written inputs along with the position of the output after
+        them.
+        """
+        if not indices:
+            return
+        lines = "".join(f"{index}\n" for index in indices)
+        self._file.write(f"{lines}@{position}\n".encode("ascii"))
+        self._file.flush()
+        self.done.update(indices)
+        self.position = position
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class JsonlWriter:
+    """
+    Writes one JSON object per result, resuming at a checkpointed byte
+    offset.
+    """
+
+    def __init__(self, path: str, position: int = 0) -> None:
+        self._file = open(path, "r+b" if position else "wb")
+        self._file.truncate(position)
+        self._file.seek(position)
+        self._indices: List[int] = []
+
+    @staticmethod
+    def encode(record: dict) -> bytes:
+        """
+        Encodes a result, e.g. in a worker process, for `write_encoded`.
+        """
+        return json.dumps(record, ensure_ascii=False).encode() + b"\n"
+
+    def write(self, index: int, record: dict) -> None:
+        self.write_encoded(index, self.encode(record))
+
+    def write_encoded(self, index: int, line: bytes) -> None:
+        self._file.write(line)
+        self._indices.append(index)
+
+    def flush(self, final: bool = False) -> Tuple[List[int], int]:
+        """
+        Flushes the written results and returns their inputs and the
+        position of the output after them.
+        """
+        self._file.flush()
+        indices, self._indices = self._indices, []
+        return indices, self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter:
+    """
+    Writes the results to a directory of Parquet files of `rows` results
+    each, with the index and input of each job and its JSON response.
+
+    Files are renamed into place once complete, and the position of the
+    output is the number of files, so that files written after the last
+    checkpoint are removed on resume.
+    """
+
+    def __init__(
+        self, path: str, position: int = 0, rows: int = BULK_PARQUET_ROWS
+    ) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError(
+                "Parquet output requires the pyarrow package. Install it "
+                "with `pip install oxylabs[parquet]`."
+            ) from None
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self._schema = pyarrow.schema(
+            [
+                ("index", pyarrow.int64()),
+                ("input", pyarrow.string()),
+                ("response", pyarrow.string()),
+            ]
+        )
+        self._path = path
+        self._rows = rows
+        self._position = position
+        self._buffer: List[dict] = []
+        os.makedirs(path, exist_ok=True)
+        for name in os.listdir(path):
+            if name.startswith("part-") and int(name[5:10]) >= position:
+                os.remove(os.path.join(path, name))
+
+    @staticmethod
+    def encode(record: dict) -> dict:
+        """
+        Encodes a result, e.g. in a worker process, for `write_encoded`.
+        """
+        return {
+            "index": record["index"],
+            "input": json.dumps(record["input"], ensure_ascii=False),
+            "response": json.dumps(record["response"], ensure_ascii=False),
+        }
+
+    def write(self, index: int, record: dict) -> None:
+        self.write_encoded(index, self.encode(record))
+
+    def write_encoded(self, index: int, row: dict) -> None:
+        self._buffer.append(row)
+
+    def flush(self, final: bool = False) -> Tuple[List[int], int]:
+        """
+        Writes a file once enough results are buffered, or the rest of them
+        if `final` is set, and returns their inputs and the number of files.
+        """
+        if not self._buffer or (len(self._buffer) < self._rows and not final):
+            return [], self._position
+        name = os.path.join(self._path, f"part-{self._position:05d}.parquet")
+        table = self._pa.Table.from_pylist(self._buffer, schema=self._schema)
+        self._pq.write_table(table, name + ".tmp")
+        os.replace(name + ".tmp", name)
+        indices = [row["index"] for row in self._buffer]
+        self._buffer = []
+        self._position += 1
+        return indices, self._position
+
+    def close(self) -> None:
+        pass
+
+
+class Stats:
+    """
+    The throughput, latency and errors of a run, for its live summary.
+    """
+
+    def __init__(self, window: int = 10000) -> None:
+        self.started = time.perf_counter()
+        self.done = 0
+        self.errors = 0
+        self.skipped = 0
+        self._latencies = deque(maxlen=window)
+
+    def record(self, latency: float, ok: bool) -> None:
+        if ok:
+            self.done += 1
+        else:
+            self.errors += 1
+        self._latencies.append(latency)
+
+    def merge(self, done: int, errors: int, latencies: List[float]) -> None:
+        """
+        Adds the statistics of a shard run by a worker process.
+        """
+        self.done += done
+        self.errors += errors
+        self._latencies.extend(latencies)
+
+    def summary(self) -> str:
+        elapsed = time.perf_counter() - self.started
+        finished = self.done + self.errors
+        line = (
+            f"{self.done} done, {self.errors} failed, "
+            f"{self.skipped} skipped | {finished / elapsed:.1f} jobs/s"
+        )
+        if self._latencies:
+            latencies = sorted(self._latencies)
+            p50 = latencies[len(latencies) // 2]
+            p99 = latencies[
+                min(len(latencies) - 1, len(latencies) * 99 // 100)
+            ]
+            line += f" | latency p50 {p50:.2f}s p99 {p99:.2f}s"
+        return line
+
+
+async def run_jobs(
+    client: "AsyncClient",
+    source: Optional[str],
+    inputs: Iterator[dict],
+    writer,
+    checkpoint: Optional[Checkpoint] = None,
+    concurrency: int = BULK_CONCURRENCY,
+    params: Optional[dict] = None,
+    config: Optional[dict] = None,
+    stats: Optional[Stats] = None,
+    progress: Optional[float] = None,
+    flush_interval: float = BULK_FLUSH_INTERVAL,
+    shard: Tuple[int, int] = (0, 1),
+    skip: Optional[Container[int]] = None,
+) -> Stats:
+    """
+    Runs a push-pull job for each input, at most `concurrency` at a time,
+    writing the results as they arrive. Inputs are read as jobs finish, so
+    memory is bounded by the jobs in flight and not the size of the input.
+
+    Inputs recorded in the checkpoint are skipped. Failed jobs are not
+    recorded, so a rerun retries them. Inputs that could not be read fail
+    their job without stopping the run.
+
+    Args:
+        client (AsyncClient): The client submitting the jobs.
+        source (Optional[str]): The source of the jobs, unless given by the
+        inputs.
+        inputs (Iterator[dict]): The query parameters of each job.
+        writer: A `JsonlWriter` or `ParquetWriter`.
+        checkpoint (Optional[Checkpoint]): The progress of the run,
+        committed whenever the writer is flushed.
+        concurrency (int): The maximum number of jobs in flight.
+        params (Optional[dict]): Parameters shared by every job.
+        config (Optional[dict]): The timeouts and poll interval of the jobs.
+        stats (Optional[Stats]): Collects the statistics of the run.
+        progress (Optional[float]): The interval in seconds to print the
+        live summary to stderr at. Defaults to None, printing nothing.
+        flush_interval (float): The interval in seconds to flush the output
+        and checkpoint at.
+        shard (Tuple[int, int]): The shard of the inputs to run and the
+        number of shards, e.g. (2, 8) runs every 8th input from the third.
+        skip (Optional[Container[int]]): The indices of the inputs to skip.
+        Defaults to those recorded in the checkpoint.
+
+    Returns:
+        Stats: The statistics of the run.
+    """
+    stats = stats or Stats()
+    config = config or prepare_config(async_integration=True)
+    template = PayloadTemplate(source, **(params or {}))
+    if skip is None:
+        skip = checkpoint.done if checkpoint is not None else ()
+    number, shards = shard
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=concurrency)
+    )
+
+    async def job(index: int, row: dict) -> Tuple[int, dict, Any]:
+        started = time.perf_counter()
+        try:
+            if isinstance(row, InvalidInput):
+                raise row.error
+            payload = template.stamp(**row)
+            data = await client._execute_with_timeout(payload, config, session)
+        except Exception as e:
+            logger.error("bulk_error", "Job failed: %s", e, index=index)
+            data = None
+        stats.record(time.perf_counter() - started, data is not None)
+        return index, row, data
+
+    def handle(finished) -> None:
+        for task in finished:
+            index, row, data = task.result()
+            if data is not None:
+                writer.write(
+                    index, {"index": index, "input": row, "response": data}
+                )
+
+    def flush(final: bool = False) -> None:
+        indices, position = writer.flush(final)
+        if checkpoint is not None:
+            checkpoint.commit(indices, position)
+
+    async def tick() -> None:
+        elapsed = 0.0
+        while True:
+            await asyncio.sleep(flush_interval)
+            elapsed += flush_interval
+            flush()
+            if progress is not None and elapsed >= progress:
+                elapsed = 0.0
+                _report(stats)
+
+    pending = set()
+    ticker = asyncio.ensure_future(tick())
+    try:
+        for index, row in enumerate(inputs):
+            if index % shards != number:
+                continue
+            if index in skip:
+                stats.skipped += 1
+                continue
+            if len(pending) >= concurrency:
+                finished, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                handle(finished)
+            pending.add(asyncio.ensure_future(job(index, row)))
+        while pending:
+            finished, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            handle(finished)
+    finally:
+        ticker.cancel()
+        for task in pending:
+            task.cancel()
+        # Keep the jobs that finished before an interruption.
+        handle([t for t in pending if t.done() and not t.cancelled()])
+        flush(final=True)
+        await session.close()
+    if progress is not None:
+        _report(stats)
+    return stats
+
+
+def _report(stats: Stats) -> None:
+    end = "\r" if sys.stderr.isatty() else "\n"
+    sys.stderr.write(stats.summary() + end)
+    sys.stderr.flush()
+
+
+_WRITERS = {"jsonl": JsonlWriter, "parquet": ParquetWriter}
+
+
+class _ShardStats(Stats):
+    """
+    The statistics of a shard, keeping the latencies recorded since they
+    were last sent to the driver.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.recent: List[float] = []
+
+    def record(self, latency: float, ok: bool) -> None:
+        super().record(latency, ok)
+        self.recent.append(latency)
+
+
+class _QueueWriter:
+    """
+    Sends the results of a shard, encoded for the writer of the driver, to
+    the driver process in batches, along with the statistics of the shard.
+    """
+
+    def __init__(
+        self,
+        queue,
+        shard: int,
+        encode: Callable[[dict], Any],
+        stats: _ShardStats,
+        batch: int = 100,
+    ) -> None:
+        self._queue = queue
+        self._shard = shard
+        self._encode = encode
+        self._stats = stats
+        self._batch = batch
+        self._items: List[tuple] = []
+        self._sent = (0, 0)
+
+    def write(self, index: int, record: dict) -> None:
+        self._items.append((index, self._encode(record)))
+        if len(self._items) >= self._batch:
+            self._send()
+
+    def _send(self) -> None:
+        stats = self._stats
+        done, errors = self._sent
+        if not self._items and (stats.done, stats.errors) == self._sent:
+            return
+        # Blocks the event loop while the queue is full, which holds back
+        # the shard until the driver catches up with writing.
+        self._queue.put(
+            (
+                "batch",
+                self._shard,
+                self._items,
+                stats.done - done,
+                stats.errors - errors,
+                stats.recent,
+            )
+        )
+        self._items = []
+        self._sent = (stats.done, stats.errors)
+        stats.recent = []
+
+    def flush(self, final: bool = False) -> Tuple[List[int], int]:
+        self._send()
+        return [], 0
+
+
+def _shard_worker(
+    shard: int,
+    shards: int,
+    options: dict,
+    skip: Container[int],
+    queue,
+    stop,
+) -> None:
+    """
+    Runs one shard of `run_sharded` in a worker process.
+    """
+    # The driver stops the workers through `stop` on interruption.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    from oxylabs.internal.internal import AsyncClient
+    from oxylabs.utils.metrics import MetricsRegistry
+
+    metrics = MetricsRegistry() if options["metrics"] else None
+    urls = options["base_urls"]
+    client = AsyncClient(
+        options["username"],
+        options["password"],
+        base_url=urls[shard % len(urls)] if urls else None,
+        metrics=metrics,
+    )
+    stats = _ShardStats()
+    writer = _QueueWriter(
+        queue, shard, _WRITERS[options["format"]].encode, stats
+    )
+
+    async def main() -> None:
+        task = asyncio.ensure_future(
+            run_jobs(
+                client,
+                options["source"],
+                read_inputs(options["input"], options["input_format"]),
+                writer,
+                concurrency=options["concurrency"],
+                params=options["params"],
+                config=options["config"],
+                stats=stats,
+                flush_interval=options["flush_interval"],
+                shard=(shard, shards),
+                skip=skip,
+            )
+        )
+        while not task.done():
+            await asyncio.wait([task], timeout=0.1)
+            if stop.is_set() and not task.done():
+                task.cancel()
+                await asyncio.wait([task])
+        if not task.cancelled():
+            task.result()
+
+    error = None
+    try:
+        asyncio.run(main())
+    except Exception as e:
+        error = repr(e)
+    finally:
+        queue.put(("done", shard, metrics, error))
+
+
+def run_sharded(
+    options: dict,
+    processes: int,
+    writer,
+    checkpoint: Checkpoint,
+    stats: Stats,
+    progress: Optional[float] = None,
+    metrics: Optional["MetricsRegistry"] = None,
+) -> bool:
+    """
+    Runs the jobs of `run_jobs` in worker processes, each with its own event
+    loop, client and connection pool, so that decoding the results is not
+    bound to one core. Worker `i` runs every `processes`th input from the
+    `i`th.
+
+    Workers encode their results and send them through a bounded queue to
+    this process, which writes them and the checkpoint, so the output and
+    resuming do not depend on the number of processes. The first SIGINT
+    stops the workers gracefully: jobs in flight are cancelled and the
+    results already received are written.
+
+    Args:
+        options (dict): The client, input and job options of the workers.
+        processes (int): The number of worker processes.
+        writer: The `JsonlWriter` or `ParquetWriter` of the output.
+        checkpoint (Checkpoint): The progress of the run.
+        stats (Stats): Aggregates the statistics of the workers.
+        progress (Optional[float]): The interval in seconds to print the
+        live summary to stderr at. Defaults to None, printing nothing.
+        metrics (Optional[MetricsRegistry]): Aggregates the client metrics
+        of the workers.
+
+    Returns:
+        bool: Whether the run was interrupted.
+    """
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue(maxsize=4 * processes)
+    stop = context.Event()
+    workers = [
+        context.Process(
+            target=_shard_worker,
+            args=(shard, processes, options, checkpoint.done, queue, stop),
+            daemon=True,
+        )
+        for shard in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    handler = threading.current_thread() is threading.main_thread()
+    if handler:
+        previous = signal.signal(signal.SIGINT, lambda *_: stop.set())
+    stats.skipped = len(checkpoint.done)
+
+    interval = options["flush_interval"]
+    running = set(range(processes))
+    flush_at = report_at = time.monotonic()
+    try:
+        while running:
+            try:
+                message = queue.get(timeout=interval)
+            except Empty:
+                # Drop workers that died without saying so, e.g. killed.
+                running = {s for s in running if workers[s].is_alive()}
+                message = None
+            if message is not None and message[0] == "batch":
+                _, _, items, done, errors, latencies = message
+                for index, item in items:
+                    writer.write_encoded(index, item)
+                stats.merge(done, errors, latencies)
+            elif message is not None:
+                _, shard, registry, error = message
+                running.discard(shard)
+                if metrics is not None and registry is not None:
+                    metrics.merge(registry)
+                if error is not None:
+                    logger.error(
+                        "shard_error", "Worker failed: %s", error, shard=shard
+                    )
+            now = time.monotonic()
+            if now >= flush_at:
+                checkpoint.commit(*writer.flush())
+                flush_at = now + interval
+            if progress and now >= report_at:
+                _report(stats)
+                report_at = now + progress
+        if progress:
+            _report(stats)
+        return stop.is_set()
+    finally:
+        stop.set()
+        if handler:
+            signal.signal(signal.SIGINT, previous)
+        checkpoint.commit(*writer.flush(final=True))
+        for worker in workers:
+            worker.join()
+
+
+def _param(value: str) -> Tuple[str, Any]:
+    key, sep, text = value.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got {value!r}")
+    try:
+        return key, json.loads(text)
+    except ValueError:
+        return key, text
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="oxylabs", description="Oxylabs Scraper API command line tools."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser(
+        "run",
+        help="Scrape every query of a CSV or JSON lines file.",
+        description="Runs a push-pull job for every row of a CSV or JSON "
+        "lines file and writes the responses to JSON lines or Parquet. "
+        "Rerunning an interrupted command resumes it.",
+    )
+    run.add_argument(
+        "--source",
+        help="The source of the jobs, e.g. google_search. Rows may set "
+        "their own.",
+    )
+    run.add_argument(
+        "--input", required=True, help="A .csv or .jsonl file, or - for stdin."
+    )
+    run.add_argument("--input-format", choices=("csv", "jsonl"))
+    run.add_argument(
+        "--out",
+        required=True,
+        help="A .jsonl file, or a .parquet directory of Parquet files.",
+    )
+    run.add_argument("--format", choices=("jsonl", "parquet"))
+    run.add_argument(
+        "--param",
+        "-p",
+        action="append",
+        type=_param,
+        default=[],
+        metavar="KEY=VALUE",
+        help="A parameter of every job, e.g. -p parse=true. Values are "
+        "read as JSON, or as strings if they are not valid JSON.",
+    )
+    run.add_argument(
+        "--concurrency",
+        type=int,
+        default=BULK_CONCURRENCY,
+        help="The maximum number of jobs in flight, across processes.",
+    )
+    run.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="The number of worker processes to shard the input across.",
+    )
+    run.add_argument(
+        "--checkpoint", help="Defaults to the output path + .checkpoint."
+    )
+    run.add_argument("--username", default=os.environ.get("OXYLABS_USERNAME"))
+    run.add_argument("--password", default=os.environ.get("OXYLABS_PASSWORD"))
+    run.add_argument("--base-url", help=argparse.SUPPRESS)
+    run.add_argument("--poll-interval", type=float)
+    run.add_argument("--request-timeout", type=float)
+    run.add_argument("--job-timeout", type=float)
+    run.add_argument(
+        "--parquet-rows",
+        type=int,
+        default=BULK_PARQUET_ROWS,
+        help="The number of results per Parquet file.",
+    )
+    run.add_argument(
+        "--metrics",
+        help="A file to write the client metrics to, in the Prometheus text "
+        "format.",
+    )
+    run.add_argument(
+        "--progress",
+        type=float,
+        default=1.0,
+        help="The interval in seconds of the live summary, 0 to disable.",
+    )
+    return parser
+
+
+def _run(args: argparse.Namespace) -> int:
+    from oxylabs.internal.internal import AsyncClient
+    from oxylabs.utils.metrics import MetricsRegistry
+
+    if not args.username or not args.password:
+        sys.stderr.write(
+            "oxylabs: set --username and --password, or the OXYLABS_USERNAME "
+            "and OXYLABS_PASSWORD environment variables\n"
+        )
+        return 2
+
+    if args.processes > 1 and args.input == "-":
+        sys.stderr.write("oxylabs: --processes needs an input file\n")
+        return 2
+
+    fmt = args.format or (
+        "parquet" if args.out.endswith(".parquet") else "jsonl"
+    )
+    checkpoint = Checkpoint(args.checkpoint or args.out + ".checkpoint")
+    if fmt == "parquet":
+        writer = ParquetWriter(
+            args.out, checkpoint.position, args.parquet_rows
+        )
+    else:
+        writer = JsonlWriter(args.out, checkpoint.position)
+    # Several base URLs, e.g. of mock servers, are spread across processes.
+    base_urls = args.base_url.split(",") if args.base_url else []
+    metrics = MetricsRegistry() if args.metrics else None
+    config = prepare_config(
+        request_timeout=args.request_timeout,
+        poll_interval=args.poll_interval,
+        job_completion_timeout=args.job_timeout,
+        async_integration=True,
+    )
+    stats = Stats()
+    interrupted = False
+    try:
+        if args.processes > 1:
+            options = {
+                "username": args.username,
+                "password": args.password,
+                "base_urls": base_urls,
+                "metrics": metrics is not None,
+                "source": args.source,
+                "input": args.input,
+                "input_format": args.input_format,
+                "format": fmt,
+                "concurrency": -(-args.concurrency // args.processes),
+                "params": dict(args.param),
+                "config": config,
+                "flush_interval": BULK_FLUSH_INTERVAL,
+            }
+            interrupted = run_sharded(
+                options,
+                args.processes,
+                writer,
+                checkpoint,
+                stats,
+                progress=args.progress or None,
+                metrics=metrics,
+            )
+        else:
+            client = AsyncClient(
+                args.username,
+                args.password,
+                base_url=base_urls[0] if base_urls else None,
+                metrics=metrics,
+            )
+            asyncio.run(
+                run_jobs(
+                    client,
+                    args.source,
+                    read_inputs(args.input, args.input_format),
+                    writer,
+                    checkpoint,
+                    concurrency=args.concurrency,
+                    params=dict(args.param),
+                    config=config,
+                    stats=stats,
+                    progress=args.progress or None,
+                )
+            )
+    except KeyboardInterrupt:
+        interrupted = True
+    finally:
+        writer.close()
+        checkpoint.close()
+        if metrics is not None:
+            with open(args.metrics, "w") as file:
+                file.write(metrics.to_prometheus())
+    if interrupted:
+        sys.stderr.write(
+            f"\n{stats.summary()}\nInterrupted, rerun the same command to "
+            "resume.\n"
+        )
+        return 130
+    if args.progress:
+        sys.stderr.write("\n")
+    if stats.errors:
+        sys.stderr.write(
+            f"{stats.errors} jobs failed, rerun the same command to retry "
+            "them.\n"
+        )
+        return 1
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    The entry point of the `oxylabs` command.
+    """
+    args = _parser().parse_args(argv)
+    if args.command == "run":
+        return _run(args)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1,16 @@
-from .internal import AsyncClient, RealtimeClient
+from typing import TYPE_CHECKING
+
+from oxylabs.utils.lazy import lazy_attributes
+
+_ATTRIBUTES = {
+    "AsyncClient": "oxylabs.internal.internal",
+    "RealtimeClient": "oxylabs.internal.internal",
+    "CredentialPool": "oxylabs.internal.credentials",
+}
+
+__all__ = list(_ATTRIBUTES)
+__getattr__ = lazy_attributes(__name__, _ATTRIBUTES, globals())
+
+if TYPE_CHECKING:
+    from .credentials import CredentialPool
+    from .internal import AsyncClient, RealtimeClient
@@ -0,0 +1,207 @@
+import base64
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple, Union
+from urllib.parse import quote
+
+from oxylabs.utils.utils import sdk_header
+
+LEAST_LOADED = "least_loaded"
+ROUND_ROBIN = "round_robin"
+
+CredentialSpec = Union[Tuple[str, str], Tuple[str, str, int]]
+
+
+class Credential:
+    """
+    One account of a credential pool with its precomputed authentication
+    headers and its load and throttling statistics.
+    """
+
+    __slots__ = (
+        "username",
+        "password",
+        "weight",
+        "headers",
+        "proxy_auth",
+        "in_flight",
+        "requests",
+        "throttled",
+        "_backoff",
+        "_backoff_until",
+        "_current_weight",
+    )
+
+    def __init__(self, username: str, password: str, weight: int = 1) -> None:
+        if weight < 1:
+            raise ValueError(f"Invalid weight for {username}: {weight}")
+        self.username = username
+        self.password = password
+        self.weight = weight
+        encoded = base64.b64encode(f"{username}:{password}".encode()).decode()
+        self.headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Basic {encoded}",
+            "x-oxylabs-sdk": sdk_header(),
+        }
+        self.proxy_auth = f"{quote(username)}:{quote(password)}"
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self._backoff = 0.0
+        self._backoff_until = 0.0
+        self._current_weight = 0
+
+    @property
+    def throttle_rate(self) -> float:
+        """
+        The share of requests rejected with HTTP 429.
+        """
+        return self.throttled / self.requests if self.requests else 0.0
+
+    @property
+    def wait(self) -> float:
+        """
+        The seconds left until the account is no longer backed off.
+        """
+        return max(0.0, self._backoff_until - time.monotonic())
+
+    def __repr__(self) -> str:
+        return (
+            f"Credential({self.username!r}, in_flight={self.in_flight}, "
+            f"requests={self.requests}, throttled={self.throttled})"
+        )
+
+
+class CredentialPool:
+    def __init__(
+        self,
+        credentials: Iterable[CredentialSpec],
+        strategy: str = LEAST_LOADED,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        """
+        Spreads requests across several accounts, e.g. sub-users, to scale
+        beyond the concurrency and rate limits of one account.
+
+        Accounts answering with HTTP 429 are backed off exponentially and
+        skipped until their backoff ends, or the `Retry-After` delay of the
+        response passes.
+
+        Args:
+            credentials (Iterable[Tuple]): (username, password) or
+            (username, password, weight) tuples.
+            strategy (str): How accounts are picked: "least_loaded" for the
+            one with the fewest requests in flight relative to its weight,
+            or "round_robin" for a weighted round robin. Defaults to
+            "least_loaded".
+            backoff (float): The first backoff in seconds, doubled on each
+            consecutive 429 response. Defaults to 1.
+            max_backoff (float): The longest backoff in seconds. Defaults to
+            60.
+
+        Raises:
+            ValueError: If no credentials or an unknown strategy are given.
+        """
+        self.credentials: List[Credential] = [
+            Credential(*spec) for spec in credentials
+        ]
+        if not self.credentials:
+            raise ValueError("A credential pool needs at least one credential")
+        if strategy not in (LEAST_LOADED, ROUND_ROBIN):
+            raise ValueError(f"Unknown strategy: {strategy}")
+        self._strategy = strategy
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.credentials)
+
+    def acquire(self) -> Credential:
+        """
+        Picks an account for a request and counts it as in flight until it
+        is released. Accounts that are backed off are skipped unless all
+        are, in which case the one available soonest is picked and its
+        `wait` should be slept first.
+        """
+        now = time.monotonic()
+        with self._lock:
+            available = [
+                c for c in self.credentials if c._backoff_until <= now
+            ]
+            if not available:
+                credential = min(
+                    self.credentials, key=lambda c: c._backoff_until
+                )
+            elif self._strategy == LEAST_LOADED:
+                credential = min(
+                    available, key=lambda c: c.in_flight / c.weight
+                )
+            else:
+                # Smooth weighted round robin: every account gains its
+                # weight and the leader pays back the total, which spreads
+                # the picks of heavy accounts evenly.
+                total = 0
+                for c in available:
+                    c._current_weight += c.weight
+                    total += c.weight
+                credential = max(available, key=lambda c: c._current_weight)
+                credential._current_weight -= total
+            credential.in_flight += 1
+        return credential
+
+    def release(self, credential: Credential) -> None:
+        """
+        Marks a request of an account as no longer in flight.
+        """
+        with self._lock:
+            credential.in_flight -= 1
+
+    def record(
+        self,
+        credential: Credential,
+        status: int,
+        retry_after: Optional[str] = None,
+    ) -> None:
+        """
+        Records the status of a response, backing the account off on HTTP
+        429 and clearing its backoff on any other status.
+
+        Args:
+            credential (Credential): The account the request was sent with.
+            status (int): The HTTP status of the response.
+            retry_after (Optional[str]): The `Retry-After` header of the
+            response, in seconds.
+        """
+        with self._lock:
+            credential.requests += 1
+            if status != 429:
+                credential._backoff = 0.0
+                return
+            credential.throttled += 1
+            credential._backoff = min(
+                self._max_backoff, credential._backoff * 2 or self._backoff
+            )
+            delay = credential._backoff
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            credential._backoff_until = time.monotonic() + delay
+
+    def stats(self) -> List[dict]:
+        """
+        Returns the load and throttling statistics of every account.
+        """
+        return [
+            {
+                "username": c.username,
+                "weight": c.weight,
+                "in_flight": c.in_flight,
+                "requests": c.requests,
+                "throttled": c.throttled,
+                "throttle_rate": c.throttle_rate,
+                "backoff": c.wait,
+            }
+            for c in self.credentials
+        ]
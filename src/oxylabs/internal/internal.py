@@ -1,19 +1,70 @@
-import asyncio
 import base64
-import logging
-from platform import python_version, architecture
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import ContextVar, copy_context
+from functools import cached_property
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-import aiohttp
-import requests
+from oxylabs.internal.credentials import Credential, CredentialPool
+from oxylabs.internal.pages import merge_pages, split_pages
+from oxylabs.sources import fanout, registry
+from oxylabs.sources.template import PayloadTemplate, request_body
+from oxylabs.utils.defaults import (
+    ASYNC_BASE_URL,
+    BULK_CONCURRENCY,
+    DEFAULT_REQUEST_TIMEOUT,
+    LOG_MAX_BODY,
+    REALTIME_MAX_CONCURRENCY,
+    REALTIME_MAX_WORKERS,
+    STREAM_CHUNK_SIZE,
+    SYNC_BASE_URL,
+)
+from oxylabs.utils.intern import InternPool
+from oxylabs.utils.lazy import lazy_import
+from oxylabs.utils.log import Body, get_logger
+from oxylabs.utils.metrics import MetricsRegistry, client_metrics
+from oxylabs.utils.stream import ResultsStreamParser
+from oxylabs.utils.tracing import NO_HOOKS, Hooks, Span
+from oxylabs.utils.utils import prepare_config, sdk_header
 
-from oxylabs.sources.ecommerce.ecommerce import Ecommerce, EcommerceAsync
-from oxylabs.sources.serp.serp import SERP, SERPAsync
-from oxylabs.utils.defaults import ASYNC_BASE_URL, SYNC_BASE_URL
-from oxylabs._version import __version__
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+    from oxylabs.sources.ecommerce.ecommerce import Ecommerce, EcommerceAsync
+    from oxylabs.sources.ecommerce.response import EcommerceResponse
+    from oxylabs.sources.fanout import Cell
+    from oxylabs.sources.serp.response import SERPResponse
+    from oxylabs.sources.serp.serp import SERP, SERPAsync
+else:
+    # Imported on first use, as a client only needs one HTTP library.
+    aiohttp = lazy_import("aiohttp")
+    asyncio = lazy_import("asyncio")
+    requests = lazy_import("requests")
+
+logger = get_logger(__name__)
+
+_END = object()
+
+# The pooled session of the batch job running in the current thread, if
+# any. Other requests of the realtime client are sent without a session.
+_batch_session: ContextVar[Optional["requests.Session"]] = ContextVar(
+    "oxylabs_batch_session", default=None
+)
 
 
 class APICredentials:
@@ -38,24 +89,148 @@ class APICredentials:
 
 
 class BaseClient:
-    def __init__(self, base_url: str, api_credentials: APICredentials) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        api_credentials: Optional[APICredentials],
+        credential_pool: Optional[CredentialPool] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        hooks: Optional[Hooks] = None,
+    ) -> None:
+        if api_credentials is None:
+            if credential_pool is None:
+                raise ValueError(
+                    "Either a username and password or a credential pool "
+                    "are required"
+                )
+            first = credential_pool.credentials[0]
+            api_credentials = APICredentials(first.username, first.password)
         self._base_url = base_url
         self._api_credentials = api_credentials
-        bits, _ = architecture()
+        self._credential_pool = credential_pool
+        self._metrics = client_metrics(metrics)
+        self._hooks = hooks if hooks is not None else NO_HOOKS
         self._headers = {
             "Content-Type": "application/json",
             "Authorization": f"Basic {self._api_credentials.get_encoded_credentials()}",
-            "x-oxylabs-sdk": f"oxylabs-sdk-python/{__version__} ({python_version()}; {bits})",
+            "x-oxylabs-sdk": sdk_header(),
         }
 
+    def _headers_for(self, credential: Optional[Credential]) -> dict:
+        """
+        Returns the headers of requests sent with a pooled credential, or
+        with the credentials of the client.
+        """
+        return self._headers if credential is None else credential.headers
+
+    def _record(
+        self, credential: Optional[Credential], status: int, headers
+    ) -> None:
+        """
+        Records the response status of a pooled credential.
+        """
+        if credential is not None:
+            self._credential_pool.record(
+                credential, status, headers.get("Retry-After")
+            )
+
+    def _release(self, credential: Optional[Credential]) -> None:
+        if credential is not None:
+            self._credential_pool.release(credential)
+
+    def _decode(self, body: bytes, integration: str, source: str) -> dict:
+        """
+        Decodes a result body, recording its size and decode time.
+        """
+        if self._metrics is None:
+            return json.loads(body)
+        started = time.perf_counter()
+        data = json.loads(body)
+        self._metrics.json_decode_seconds.observe(
+            time.perf_counter() - started, integration, source
+        )
+        self._metrics.result_bytes.observe(len(body), integration, source)
+        return data
+
+    def _observe_model(self, source: str, started: float) -> None:
+        """
+        Records the time taken to build a response model since `started`.
+        """
+        elapsed = time.perf_counter() - started
+        if self._metrics is not None:
+            self._metrics.model_build_seconds.observe(elapsed, source)
+        self._hooks.annotate(
+            self._hooks.current(), {"oxylabs.model_build.duration_s": elapsed}
+        )
+
 
 class RealtimeClient(BaseClient):
-    def __init__(self, username: str, password: str) -> None:
-        super().__init__(SYNC_BASE_URL, APICredentials(username, password))
-        self.serp = SERP(self)
-        self.ecommerce = Ecommerce(self)
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        intern_pool: Optional[InternPool] = None,
+        credential_pool: Optional[CredentialPool] = None,
+        base_url: Optional[str] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        hooks: Optional[Hooks] = None,
+        max_concurrency: int = REALTIME_MAX_CONCURRENCY,
+    ) -> None:
+        """
+        Initializes an instance of RealtimeClient.
+
+        Args:
+            username (Optional[str]): The username for API authentication.
+            password (Optional[str]): The password for API authentication.
+            intern_pool (Optional[InternPool]): The pool deduplicating
+            repeated strings of the responses built by this client.
+            Defaults to None, which disables interning.
+            credential_pool (Optional[CredentialPool]): Several accounts to
+            spread the requests across, in place of the username and
+            password. Defaults to None.
+            base_url (Optional[str]): The URL of the API, e.g. of a
+            `MockServer`. Defaults to the Oxylabs API.
+            metrics (Optional[MetricsRegistry]): The registry recording the
+            latency of each phase of the jobs. Defaults to None.
+            hooks (Optional[Hooks]): The callbacks and span exporter of the
+            lifecycle events of the jobs. Defaults to None.
+            max_concurrency (int): The maximum number of batch jobs in
+            flight across every `map`, `iter_map` and `scrape_*_many` call
+            of the client, and the size of their connection pool. Defaults
+            to 32.
+        """
+        super().__init__(
+            base_url or SYNC_BASE_URL,
+            (
+                APICredentials(username, password)
+                if username is not None
+                else None
+            ),
+            credential_pool,
+            metrics,
+            hooks,
+        )
+        self._intern_pool = intern_pool
+        self._max_concurrency = max_concurrency
+        self._batch_slots = threading.BoundedSemaphore(max_concurrency)
+        self._session: Optional["requests.Session"] = None
+        self._session_lock = threading.Lock()
+
+    @cached_property
+    def serp(self) -> "SERP":
+        from oxylabs.sources.serp.serp import SERP
+
+        return SERP(self)
+
+    @cached_property
+    def ecommerce(self) -> "Ecommerce":
+        from oxylabs.sources.ecommerce.ecommerce import Ecommerce
+
+        return Ecommerce(self)
 
-    def _req(self, payload: dict, method: str, config: dict) -> dict:
+    def _req(
+        self, payload: dict, method: str, config: dict, stream: bool = False
+    ) -> dict:
         """
         Sends a HTTP request to the specified URL with the given payload
         and method.
@@ -66,10 +241,14 @@ class RealtimeClient(BaseClient):
             (e.g., "POST", "GET").
             config (dict): Additional configuration options for the
             request.
+            stream (bool): Whether to parse the response body incrementally
+            and return an iterator over its result pages instead of the
+            whole decoded body. Defaults to False.
 
         Returns:
             dict: The JSON response from the server, if the request is
             successful.
+                  An iterator over the result pages, if `stream` is set.
                   None, if an error occurs during the request.
 
         Raises:
@@ -78,107 +257,863 @@ class RealtimeClient(BaseClient):
             requests.exceptions.RequestException: If a general request
             error occurs.
         """
+        source = payload.get("source", "")
+        # A streamed job is still running once this returns, so its span is
+        # ended by the iterator over its results instead of being made
+        # current in the context of the caller.
+        span = (self._hooks.start if stream else self._hooks.begin)(
+            "oxylabs.realtime",
+            **{"oxylabs.integration": "realtime", "oxylabs.source": source},
+        )
+        credential = self._acquire(span)
+        outcome = "error"
+        results = None
+        started = time.perf_counter()
+        received = None
         try:
             if method == "POST":
-                response = requests.post(
+                self._hooks.emit("on_submit", span, source=source)
+                response = (_batch_session.get() or requests).post(
                     self._base_url,
-                    headers=self._headers,
-                    json=payload,
+                    headers=self._headers_for(credential),
+                    **request_body(payload),
                     timeout=config["request_timeout"],
+                    stream=stream,
                 )
             else:
-                logger.error(f"Unsupported method: {method}")
+                logger.error(
+                    "unsupported_method", "Unsupported method: %s", method
+                )
+                self._hooks.emit("on_error", span, error=method)
                 return None
+            self._record(credential, response.status_code, response.headers)
+            self._hooks.emit("on_done", span, status_code=response.status_code)
             response.raise_for_status()
 
             if response.status_code == 200:
-                return response.json()
+                outcome = "ok"
+                if stream:
+                    results = self._iter_results(response, source, span)
+                    return results
+                body = response.content
+                received = time.perf_counter()
+                self._hooks.annotate(
+                    span,
+                    {
+                        "http.response.status_code": response.status_code,
+                        "http.response.body.size": len(body),
+                        "oxylabs.submit.duration_s": received - started,
+                    },
+                )
+                self._hooks.emit("on_fetch", span, bytes=len(body))
+                return self._decode(body, "realtime", source)
             else:
-                logger.error(f"Error occurred: {response.status_code}")
+                logger.error(
+                    "http_error",
+                    "Error occurred: %s",
+                    response.status_code,
+                    source=source,
+                )
+                self._hooks.emit("on_error", span, error=response.status_code)
                 return None
 
-        except requests.exceptions.Timeout:
+        except requests.exceptions.Timeout as err:
+            outcome = "timeout"
             logger.error(
-                f"Timeout error. The request to {self._base_url} with method {method} has timed out."
+                "timeout",
+                "Timeout error. The request to %s with method %s has timed "
+                "out.",
+                self._base_url,
+                method,
+                source=source,
             )
+            self._hooks.emit("on_error", span, error=err)
             return None
         except requests.exceptions.HTTPError as err:
-            logger.error(f"HTTP error occurred: {err}")
-            logger.error(response.text)
+            outcome = "http_error"
+            logger.error(
+                "http_error",
+                "HTTP error occurred: %s",
+                err,
+                source=source,
+                body=Body(response.content),
+            )
+            self._hooks.emit("on_error", span, error=err)
             return None
         except requests.exceptions.RequestException as err:
-            logger.error(f"Error occurred: {err}")
+            logger.error(
+                "request_error", "Error occurred: %s", err, source=source
+            )
+            self._hooks.emit("on_error", span, error=err)
+            return None
+        except ValueError as err:
+            outcome = "error"
+            logger.error(
+                "decode_error",
+                "Failed to decode the response body: %s",
+                err,
+                source=source,
+            )
+            self._hooks.emit("on_error", span, error=err)
+            return None
+        finally:
+            self._release(credential)
+            if results is None:
+                self._hooks.end(span)
+            if self._metrics is not None:
+                elapsed = (received or time.perf_counter()) - started
+                self._metrics.requests.inc("realtime", source, outcome)
+                self._metrics.submit_seconds.observe(
+                    elapsed, "realtime", source, outcome
+                )
+
+    def _acquire(self, span: Optional[Span] = None) -> Optional[Credential]:
+        """
+        Picks a pooled credential for a request, waiting for its backoff to
+        end if every credential is backed off.
+        """
+        if self._credential_pool is None:
             return None
+        credential = self._credential_pool.acquire()
+        if credential.wait:
+            self._hooks.emit("on_retry", span, delay=credential.wait)
+            time.sleep(credential.wait)
+        return credential
+
+    def _iter_results(
+        self,
+        response: "requests.Response",
+        source: str = "",
+        span: Optional[Span] = None,
+    ) -> Iterator[dict]:
+        """
+        Yields the result pages of a response while its body is being read.
+
+        Args:
+            response (requests.Response): A response opened with
+            `stream=True`.
+            source (str): The source of the job, labelling its metrics.
+            span (Optional[Span]): The span of the job, ended once the body
+            is read or the iterator is closed.
+
+        Yields:
+            dict: One result page at a time.
+        """
+        parser = ResultsStreamParser()
+        size = 0
+        error = None
+        try:
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                size += len(chunk)
+                yield from parser.feed(chunk)
+            parser.close()
+            if self._metrics is not None:
+                self._metrics.result_bytes.observe(size, "realtime", source)
+            self._hooks.emit("on_fetch", span, bytes=size)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            response.close()
+            self._hooks.end(span, error)
+
+    def _pooled_session(self) -> "requests.Session":
+        """
+        Returns the session shared by the batch jobs of the client, whose
+        connection pool holds a connection per job in flight.
+        """
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_maxsize=self._max_concurrency
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    def _run_batched(
+        self, call: Callable[[Any], Any], item: Any, nested: bool = False
+    ) -> tuple:
+        """
+        Runs a batch job once a slot of the client is free, sending its
+        requests through the pooled session.
+
+        Jobs of a batch started by a batch job, such as the pages of a job
+        in `map`, run in the slot of that job, as waiting for slots of
+        their own could deadlock once every slot is held by their parents.
+        """
+        token = _batch_session.set(self._pooled_session())
+        try:
+            if nested:
+                return item, call(item)
+            with self._batch_slots:
+                return item, call(item)
+        finally:
+            _batch_session.reset(token)
+
+    def _iter_calls(
+        self,
+        items: Iterable[Any],
+        call: Callable[[Any], Any],
+        max_workers: int,
+        ordered: bool,
+    ) -> Iterator[Tuple[Any, Any]]:
+        """
+        Calls `call` with each item in a thread pool and yields the items
+        with their results.
+
+        Items are read lazily, and at most twice `max_workers` results are
+        pending at a time, so memory stays bounded however many items
+        there are. Each call runs in a copy of the caller's context, so the
+        pages of a job record onto its span.
+        """
+        items = iter(items)
+        pending = deque()
+        window = 2 * max_workers
+        nested = _batch_session.get() is not None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                while True:
+                    while len(pending) < window:
+                        item = next(items, _END)
+                        if item is _END:
+                            break
+                        pending.append(
+                            executor.submit(
+                                copy_context().run,
+                                self._run_batched,
+                                call,
+                                item,
+                                nested,
+                            )
+                        )
+                    if not pending:
+                        break
+
+                    if ordered:
+                        yield pending.popleft().result()
+                        continue
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                        yield future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def scrape(
+        self,
+        source: str,
+        request_timeout: Optional[int] = DEFAULT_REQUEST_TIMEOUT,
+        parallel_pages: bool = False,
+        **params,
+    ) -> Union["SERPResponse", "EcommerceResponse"]:
+        """
+        Scrapes any registered source, building the payload straight from
+        its declaration in `oxylabs.sources.registry` instead of going
+        through a scrape method. Meant for code dispatching on the source
+        name, such as bulk jobs.
+
+        Example:
+            response = c.scrape("google_search", query="shoes", pages=2)
+
+        Args:
+            source (str): The source to scrape, e.g. "google_search".
+            request_timeout (Optional[int]): The interval in seconds for
+            the request to time out if no response is returned. Defaults
+            to 165.
+            parallel_pages (bool): Whether to split a multi-page job into
+            concurrent jobs of a page each, merged into one response in
+            page order. Pages whose job failed are left out and listed in
+            `job.missing_pages`. Defaults to False.
+            **params: The query parameters of the source. Parameters set
+            to None are ignored.
+
+        Returns:
+            Union[SERPResponse, EcommerceResponse]: The response of the job,
+            a `SERPResponse` for SERP API sources.
+
+        Raises:
+            ValueError: If the source is not registered.
+        """
+        spec = registry.get(source)
+        config = prepare_config(request_timeout=request_timeout)
+        config["parallel_pages"] = parallel_pages
+        return getattr(self, spec.api)._get_resp(spec.payload(params), config)
+
+    def _req_pages(self, payload: dict, config: dict) -> Optional[dict]:
+        """
+        Runs a multi-page job as a job per page in the thread pool of the
+        batch jobs and merges their results in page order.
+        """
+        pages = split_pages(payload)
+        if pages is None:
+            return self._req(payload, "POST", config)
+        if _batch_session.get() is None:
+            workers = min(len(pages), self._max_concurrency)
+            return self._merge_page_calls(payload, pages, config, workers)
+
+        # The pages of a batch job run in the slot of the job and in the
+        # slots free right now, or one after another if none is, so the
+        # batch stays within `max_concurrency`.
+        borrowed = 0
+        while borrowed < len(pages) - 1 and self._batch_slots.acquire(
+            blocking=False
+        ):
+            borrowed += 1
+        try:
+            return self._merge_page_calls(payload, pages, config, borrowed + 1)
+        finally:
+            for _ in range(borrowed):
+                self._batch_slots.release()
+
+    def _merge_page_calls(
+        self, payload: dict, pages: List[dict], config: dict, workers: int
+    ) -> Optional[dict]:
+        """
+        Runs the page jobs of a multi-page job with up to `workers` at a
+        time and merges their results in page order.
+        """
+        bodies = self._iter_calls(
+            pages,
+            lambda page: self._req(page, "POST", config),
+            workers,
+            ordered=True,
+        )
+        return merge_pages(payload, (body for _, body in bodies))
+
+    def _scrape_spec(
+        self, spec: dict, request_timeout: Optional[int]
+    ) -> Union["SERPResponse", "EcommerceResponse"]:
+        params = dict(spec)
+        source = params.pop("source", None)
+        if source is None:
+            raise ValueError(f"The spec has no source: {spec}")
+        params.setdefault("request_timeout", request_timeout)
+        return self.scrape(source, **params)
+
+    def map(
+        self,
+        specs: Iterable[dict],
+        max_workers: int = REALTIME_MAX_WORKERS,
+        request_timeout: Optional[int] = None,
+    ) -> List[Union["SERPResponse", "EcommerceResponse"]]:
+        """
+        Runs many realtime jobs in parallel threads sharing a pooled
+        session, for code that cannot use `AsyncClient`.
+
+        Example:
+            responses = c.map(
+                [
+                    {"source": "google_search", "query": "shoes"},
+                    {"source": "amazon_product", "query": "B07FZ8S74R"},
+                ],
+                max_workers=16,
+            )
+
+        Args:
+            specs (Iterable[dict]): The source and query parameters of each
+            job, and optionally its `request_timeout`.
+            max_workers (int): The maximum number of parallel jobs of this
+            call, within the `max_concurrency` of the client. Defaults to 8.
+            request_timeout (Optional[int]): The request timeout in seconds
+            of the jobs that do not set their own.
+
+        Returns:
+            List[Union[SERPResponse, EcommerceResponse]]: The responses in
+            the order of the specs, with SERP API sources returning
+            `SERPResponse`s.
+
+        Raises:
+            ValueError: If a spec has no source.
+        """
+        return [
+            response
+            for _, response in self.iter_map(
+                specs,
+                max_workers,
+                ordered=True,
+                request_timeout=request_timeout,
+            )
+        ]
+
+    def iter_map(
+        self,
+        specs: Iterable[dict],
+        max_workers: int = REALTIME_MAX_WORKERS,
+        ordered: bool = False,
+        request_timeout: Optional[int] = None,
+    ) -> Iterator[Tuple[dict, Union["SERPResponse", "EcommerceResponse"]]]:
+        """
+        Runs many realtime jobs as in `map` and yields each response as soon
+        as it is available.
+
+        Specs are read lazily, so only twice `max_workers` jobs are pending
+        at a time however many specs there are.
+
+        Args:
+            specs (Iterable[dict]): The source and query parameters of each
+            job, and optionally its `request_timeout`.
+            max_workers (int): The maximum number of parallel jobs of this
+            call. Defaults to 8.
+            ordered (bool): Whether to yield the responses in the order of
+            the specs instead of as they complete. Defaults to False.
+            request_timeout (Optional[int]): The request timeout in seconds
+            of the jobs that do not set their own.
+
+        Yields:
+            Tuple[dict, Union[SERPResponse, EcommerceResponse]]: The spec
+            and its response.
+        """
+        return self._iter_calls(
+            specs,
+            lambda spec: self._scrape_spec(spec, request_timeout),
+            max_workers,
+            ordered,
+        )
+
+    def fan_out(
+        self,
+        source: str,
+        queries: Iterable[str],
+        geo_locations: Optional[Iterable[str]] = None,
+        domains: Optional[Iterable[str]] = None,
+        locales: Optional[Iterable[str]] = None,
+        max_workers: int = REALTIME_MAX_WORKERS,
+        ordered: bool = False,
+        request_timeout: Optional[int] = None,
+        **params,
+    ) -> Iterator[Tuple["Cell", Union["SERPResponse", "EcommerceResponse"]]]:
+        """
+        Scrapes every query from every combination of locations, domains
+        and locales, e.g. to track rankings, and yields each response with
+        its cell as soon as it is available.
+
+        The cells are generated lazily and deduplicated, and only twice
+        `max_workers` jobs are pending at a time, so memory stays bounded
+        for matrices of millions of cells. For small ones, `dict(...)`
+        indexes the responses by cell.
+
+        Example:
+            for cell, response in c.fan_out(
+                "google_search",
+                ["shoes", "boots"],
+                geo_locations=["Berlin,Germany", "Paris,France"],
+                domains=["de", "fr"],
+                parse=True,
+            ):
+                print(cell.query, cell.geo_location, cell.domain)
+
+        Args:
+            source (str): The source to scrape, e.g. "google_search".
+            queries (Iterable[str]): The queries, read lazily.
+            geo_locations (Optional[Iterable[str]]): The locations to scrape
+            each query from. Defaults to None, leaving the axis out.
+            domains (Optional[Iterable[str]]): The domains to scrape each
+            query from. Defaults to None, leaving the axis out.
+            locales (Optional[Iterable[str]]): The locales to scrape each
+            query with. Defaults to None, leaving the axis out.
+            max_workers (int): The maximum number of parallel jobs of this
+            call, within the `max_concurrency` of the client. Defaults to 8.
+            ordered (bool): Whether to yield the responses in the order of
+            the cells instead of as they complete. Defaults to False.
+            request_timeout (Optional[int]): The request timeout in seconds
+            of each job.
+            **params: The other query parameters of every job.
+
+        Yields:
+            Tuple[Cell, Union[SERPResponse, EcommerceResponse]]: The cell,
+            a (query, geo_location, domain, locale) named tuple, and its
+            response.
+
+        Raises:
+            ValueError: If the source is not registered or does not take a
+            query or one of the axes given.
+        """
+        fanout.check_axes(source, geo_locations, domains, locales)
+        dispatcher = getattr(self, registry.get(source).api)
+        config = prepare_config(request_timeout=request_timeout)
+        config["parallel_pages"] = params.pop("parallel_pages", False)
+        template = PayloadTemplate(source, **params)
+        return self._iter_calls(
+            fanout.cells(queries, geo_locations, domains, locales),
+            lambda cell: dispatcher._get_resp(
+                template.stamp(**cell.params()), config
+            ),
+            max_workers,
+            ordered,
+        )
 
 
 class AsyncClient(BaseClient):
-    def __init__(self, username: str, password: str) -> None:
-        super().__init__(ASYNC_BASE_URL, APICredentials(username, password))
-        self.serp = SERPAsync(self)
-        self.ecommerce = EcommerceAsync(self)
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        intern_pool: Optional[InternPool] = None,
+        credential_pool: Optional[CredentialPool] = None,
+        base_url: Optional[str] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        hooks: Optional[Hooks] = None,
+    ) -> None:
+        """
+        Initializes an instance of AsyncClient.
+
+        Args:
+            username (Optional[str]): The username for API authentication.
+            password (Optional[str]): The password for API authentication.
+            intern_pool (Optional[InternPool]): The pool deduplicating
+            repeated strings of the responses built by this client.
+            Defaults to None, which disables interning.
+            credential_pool (Optional[CredentialPool]): Several accounts to
+            spread the requests across, in place of the username and
+            password. Defaults to None.
+            base_url (Optional[str]): The URL of the API, e.g. of a
+            `MockServer`. Defaults to the Oxylabs API.
+            metrics (Optional[MetricsRegistry]): The registry recording the
+            latency of each phase of the jobs. Defaults to None.
+            hooks (Optional[Hooks]): The callbacks and span exporter of the
+            lifecycle events of the jobs. Defaults to None.
+        """
+        super().__init__(
+            base_url or ASYNC_BASE_URL,
+            (
+                APICredentials(username, password)
+                if username is not None
+                else None
+            ),
+            credential_pool,
+            metrics,
+            hooks,
+        )
+        self._intern_pool = intern_pool
+
+    @cached_property
+    def serp(self) -> "SERPAsync":
+        from oxylabs.sources.serp.serp import SERPAsync
+
+        return SERPAsync(self)
+
+    @cached_property
+    def ecommerce(self) -> "EcommerceAsync":
+        from oxylabs.sources.ecommerce.ecommerce import EcommerceAsync
+
+        return EcommerceAsync(self)
+
+    async def scrape(
+        self,
+        source: str,
+        request_timeout: Optional[int] = None,
+        job_completion_timeout: Optional[int] = None,
+        poll_interval: Optional[int] = None,
+        parallel_pages: bool = False,
+        **params,
+    ) -> Union["SERPResponse", "EcommerceResponse"]:
+        """
+        Asynchronously scrapes any registered source, building the payload
+        straight from its declaration in `oxylabs.sources.registry` instead
+        of going through a scrape method.
+
+        Example:
+            response = await c.scrape("amazon_product", query="B07FZ8S74R")
+
+        Args:
+            source (str): The source to scrape, e.g. "google_search".
+            request_timeout (Optional[int]): The interval in seconds for
+            the request to time out if no response is returned. Defaults
+            to 105.
+            job_completion_timeout (Optional[int]): The interval in seconds
+            for the job to time out if no response is returned.
+            poll_interval (Optional[int]): The interval in seconds to poll
+            the server for a response.
+            parallel_pages (bool): Whether to split a multi-page job into
+            concurrent jobs of a page each, merged into one response in
+            page order. Pages whose job failed are left out and listed in
+            `job.missing_pages`. Defaults to False.
+            **params: The query parameters of the source. Parameters set
+            to None are ignored.
+
+        Returns:
+            Union[SERPResponse, EcommerceResponse]: The response of the job,
+            a `SERPResponse` for SERP API sources.
+
+        Raises:
+            ValueError: If the source is not registered.
+        """
+        spec = registry.get(source)
+        config = prepare_config(
+            request_timeout=request_timeout,
+            poll_interval=poll_interval,
+            job_completion_timeout=job_completion_timeout,
+            async_integration=True,
+        )
+        config["parallel_pages"] = parallel_pages
+        return await getattr(self, spec.api)._get_resp(
+            spec.payload(params), config
+        )
+
+    async def fan_out(
+        self,
+        source: str,
+        queries: Iterable[str],
+        geo_locations: Optional[Iterable[str]] = None,
+        domains: Optional[Iterable[str]] = None,
+        locales: Optional[Iterable[str]] = None,
+        concurrency: int = BULK_CONCURRENCY,
+        request_timeout: Optional[int] = None,
+        job_completion_timeout: Optional[int] = None,
+        poll_interval: Optional[int] = None,
+        **params,
+    ) -> AsyncIterator[
+        Tuple["Cell", Union["SERPResponse", "EcommerceResponse"]]
+    ]:
+        """
+        Asynchronously scrapes every query from every combination of
+        locations, domains and locales, as in `RealtimeClient.fan_out`, and
+        yields each response with its cell as soon as it is available.
+
+        Example:
+            async for cell, response in c.fan_out(
+                "google_search", queries, domains=["de", "fr"]
+            ):
+                ...
+
+        Args:
+            source (str): The source to scrape, e.g. "google_search".
+            queries (Iterable[str]): The queries, read lazily.
+            geo_locations (Optional[Iterable[str]]): The locations to scrape
+            each query from. Defaults to None, leaving the axis out.
+            domains (Optional[Iterable[str]]): The domains to scrape each
+            query from. Defaults to None, leaving the axis out.
+            locales (Optional[Iterable[str]]): The locales to scrape each
+            query with. Defaults to None, leaving the axis out.
+            concurrency (int): The maximum number of jobs in flight, which
+            is also the number of cells held in memory. Defaults to 100.
+            request_timeout (Optional[int]): The interval in seconds for
+            the request to time out if no response is returned. Defaults
+            to 105.
+            job_completion_timeout (Optional[int]): The interval in seconds
+            for the job to time out if no response is returned.
+            poll_interval (Optional[int]): The interval in seconds to poll
+            the server for a response.
+            **params: The other query parameters of every job.
+
+        Yields:
+            Tuple[Cell, Union[SERPResponse, EcommerceResponse]]: The cell
+            and its response.
+
+        Raises:
+            ValueError: If the source is not registered or does not take a
+            query or one of the axes given.
+        """
+        fanout.check_axes(source, geo_locations, domains, locales)
+        cells = fanout.cells(queries, geo_locations, domains, locales)
+        dispatcher = getattr(self, registry.get(source).api)
+        config = prepare_config(
+            request_timeout=request_timeout,
+            poll_interval=poll_interval,
+            job_completion_timeout=job_completion_timeout,
+            async_integration=True,
+        )
+        config["parallel_pages"] = params.pop("parallel_pages", False)
+        template = PayloadTemplate(source, **params)
+
+        async def run(cell: "Cell") -> tuple:
+            payload = template.stamp(**cell.params())
+            return cell, await dispatcher._get_resp(payload, config)
+
+        pending = set()
+        try:
+            while True:
+                while len(pending) < concurrency:
+                    cell = next(cells, _END)
+                    if cell is _END:
+                        break
+                    pending.add(asyncio.ensure_future(run(cell)))
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _acquire(
+        self, span: Optional[Span] = None
+    ) -> Optional[Credential]:
+        """
+        Picks a pooled credential for a job, waiting for its backoff to end
+        if every credential is backed off.
+        """
+        if self._credential_pool is None:
+            return None
+        credential = self._credential_pool.acquire()
+        if credential.wait:
+            self._hooks.emit("on_retry", span, delay=credential.wait)
+            await asyncio.sleep(credential.wait)
+        return credential
 
     async def _get_job_id(
         self,
         payload: dict,
-        user_session: aiohttp.ClientSession,
+        user_session: "aiohttp.ClientSession",
         request_timeout: int,
+        credential: Optional[Credential] = None,
+        span: Optional[Span] = None,
     ) -> str:
+        source = payload.get("source", "")
+        outcome = "error"
+        started = time.perf_counter()
+        self._hooks.emit("on_submit", span, source=source)
         try:
             async with user_session.post(
                 self._base_url,
-                headers=self._headers,
-                json=payload,
+                headers=self._headers_for(credential),
+                **request_body(payload),
                 timeout=request_timeout,
             ) as response:
+                self._record(credential, response.status, response.headers)
                 data = await response.json()
                 response.raise_for_status()
+                outcome = "ok"
+                self._hooks.annotate(
+                    span,
+                    {
+                        "oxylabs.job_id": data["id"],
+                        "oxylabs.submit.duration_s": time.perf_counter()
+                        - started,
+                    },
+                )
                 return data["id"]
         except aiohttp.ClientResponseError as e:
+            outcome = "http_error"
+            self._hooks.emit("on_error", span, error=e)
             logger.error(
-                f"HTTP error occurred: {e.status} - {e.message} - {data['message']}"
+                "http_error",
+                "HTTP error occurred: %s - %s - %s",
+                e.status,
+                e.message,
+                data["message"],
+                source=source,
             )
         except aiohttp.ClientConnectionError as e:
-            logger.error(f"Connection error occurred: {e}")
-        except asyncio.TimeoutError:
+            outcome = "connection_error"
+            self._hooks.emit("on_error", span, error=e)
+            logger.error(
+                "connection_error",
+                "Connection error occurred: %s",
+                e,
+                source=source,
+            )
+        except asyncio.TimeoutError as e:
+            outcome = "timeout"
+            self._hooks.emit("on_error", span, error=e)
             logger.error(
-                f"Timeout error. The request to {self._base_url} has timed out."
+                "timeout",
+                "Timeout error. The request to %s has timed out.",
+                self._base_url,
+                source=source,
             )
         except Exception as e:
-            logger.error(f"Error occurred: {str(e)}")
+            self._hooks.emit("on_error", span, error=e)
+            logger.error("error", "Error occurred: %s", e, source=source)
             return None
+        finally:
+            if self._metrics is not None:
+                self._metrics.requests.inc("push_pull", source, outcome)
+                self._metrics.submit_seconds.observe(
+                    time.perf_counter() - started, "push_pull", source, outcome
+                )
 
     async def _poll_job_status(
         self,
         job_id: str,
         poll_interval: int,
-        user_session: aiohttp.ClientSession,
+        user_session: "aiohttp.ClientSession",
         timeout: int,
+        credential: Optional[Credential] = None,
+        source: str = "",
+        span: Optional[Span] = None,
     ) -> bool:
         job_status_url = f"{self._base_url}/{job_id}"
         end_time = asyncio.get_event_loop().time() + timeout
-        while asyncio.get_event_loop().time() < end_time:
-            try:
-                async with user_session.get(
-                    job_status_url,
-                    headers=self._headers,
-                    timeout=poll_interval,
-                ) as response:
-                    data = await response.json()
-                    response.raise_for_status()
-                    if data["status"] == "done":
-                        return True
-                    elif data["status"] == "faulted":
-                        raise Exception("Job faulted")
-            except Exception as e:
-                logger.error(f"Error occurred: {str(e)}")
-                return False
-            await asyncio.sleep(poll_interval)
-
-        logger.info("Job completion timeout exceeded")
-        return False
+        outcome = "timeout"
+        started = time.perf_counter()
+        polls, slept = 0, 0.0
+        try:
+            while asyncio.get_event_loop().time() < end_time:
+                try:
+                    polls += 1
+                    async with user_session.get(
+                        job_status_url,
+                        headers=self._headers_for(credential),
+                        timeout=poll_interval,
+                    ) as response:
+                        data = await response.json()
+                        response.raise_for_status()
+                        self._hooks.emit(
+                            "on_poll", span, status=data["status"], poll=polls
+                        )
+                        if data["status"] == "done":
+                            outcome = "done"
+                            self._hooks.emit("on_done", span, polls=polls)
+                            return True
+                        elif data["status"] == "faulted":
+                            outcome = "faulted"
+                            raise Exception("Job faulted")
+                except Exception as e:
+                    if outcome != "faulted":
+                        outcome = "error"
+                    self._hooks.emit("on_error", span, error=e)
+                    logger.error(
+                        "poll_error",
+                        "Error occurred: %s",
+                        e,
+                        source=source,
+                        job_id=job_id,
+                    )
+                    return False
+                sleep_started = time.perf_counter()
+                await asyncio.sleep(poll_interval)
+                slept = time.perf_counter() - sleep_started
+
+            logger.info(
+                "job_timeout",
+                "Job completion timeout exceeded",
+                source=source,
+                job_id=job_id,
+            )
+            self._hooks.emit("on_error", span, error="timeout")
+            return False
+        finally:
+            self._hooks.annotate(
+                span,
+                {
+                    "oxylabs.polls": polls,
+                    "oxylabs.queue.duration_s": time.perf_counter() - started,
+                },
+            )
+            if self._metrics is not None:
+                self._metrics.time_to_done_seconds.observe(
+                    time.perf_counter() - started, source, outcome
+                )
+                self._metrics.polls.observe(polls, source, outcome)
+                if outcome == "done":
+                    self._metrics.wasted_poll_seconds.observe(slept, source)
 
     async def _get_http_resp(
-        self, job_id: str, user_session: aiohttp.ClientSession
+        self,
+        job_id: str,
+        user_session: "aiohttp.ClientSession",
+        stream: bool = False,
+        credential: Optional[Credential] = None,
+        source: str = "",
+        span: Optional[Span] = None,
     ) -> dict:
         """
         Retrieves the HTTP response for a given job ID.
@@ -187,9 +1122,17 @@ class AsyncClient(BaseClient):
             job_id (str): The ID of the job.
             user_session (aiohttp.ClientSession): The client session used for
             making the request.
+            stream (bool): Whether to return an async iterator that parses
+            the result pages while the body is being downloaded. Defaults to
+            False.
+            credential (Optional[Credential]): The pooled credential the job
+            was submitted with.
+            source (str): The source of the job, labelling its metrics.
+            span (Optional[Span]): The span of the job.
 
         Returns:
-            dict: The JSON response data.
+            dict: The JSON response data, or an async iterator over the
+            result pages if `stream` is set.
 
         Raises:
             aiohttp.ClientResponseError: If a client response error occurs.
@@ -197,45 +1140,321 @@ class AsyncClient(BaseClient):
             asyncio.TimeoutError: If the request times out.
             Exception: If any other error occurs.
         """
+        if stream:
+            return self._iter_http_resp(
+                job_id, user_session, credential, source, span
+            )
+
         result_url = f"{self._base_url}/{job_id}/results"
+        outcome = "error"
+        started = time.perf_counter()
         try:
             async with user_session.get(
-                result_url, headers=self._headers
+                result_url, headers=self._headers_for(credential)
             ) as response:
-                data = await response.json()
+                body = await response.read()
+                data = self._decode(body, "push_pull", source)
                 response.raise_for_status()
+                outcome = "ok"
+                self._hooks.annotate(
+                    span,
+                    {
+                        "http.response.status_code": response.status,
+                        "http.response.body.size": len(body),
+                        "oxylabs.fetch.duration_s": time.perf_counter()
+                        - started,
+                    },
+                )
+                self._hooks.emit("on_fetch", span, bytes=len(body))
                 return data
         except aiohttp.ClientResponseError as e:
+            outcome = "http_error"
+            self._hooks.emit("on_error", span, error=e)
             logger.error(
-                f"HTTP error occurred: {e.status} - {e.message} - {data['message']}"
+                "http_error",
+                "HTTP error occurred: %s - %s - %s",
+                e.status,
+                e.message,
+                data["message"],
+                source=source,
+                job_id=job_id,
             )
         except aiohttp.ClientConnectionError as e:
-            logger.error(f"Connection error occurred: {e}")
-        except asyncio.TimeoutError:
+            outcome = "connection_error"
+            self._hooks.emit("on_error", span, error=e)
             logger.error(
-                f"Timeout error. The request to {result_url} has timed out."
+                "connection_error",
+                "Connection error occurred: %s",
+                e,
+                source=source,
+                job_id=job_id,
+            )
+        except asyncio.TimeoutError as e:
+            outcome = "timeout"
+            self._hooks.emit("on_error", span, error=e)
+            logger.error(
+                "timeout",
+                "Timeout error. The request to %s has timed out.",
+                result_url,
+                source=source,
             )
         except Exception as e:
-            logger.error(f"An error occurred: {e} - {data['message']}")
+            self._hooks.emit("on_error", span, error=e)
+            logger.error(
+                "error",
+                "An error occurred: %s - %s",
+                e,
+                data["message"],
+                source=source,
+                job_id=job_id,
+            )
+        finally:
+            if self._metrics is not None:
+                self._metrics.results_seconds.observe(
+                    time.perf_counter() - started, source, outcome
+                )
         return None
 
+    async def _iter_http_resp(
+        self,
+        job_id: str,
+        user_session: "aiohttp.ClientSession",
+        credential: Optional[Credential] = None,
+        source: str = "",
+        span: Optional[Span] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Yields the result pages of a job while the body is being downloaded.
+
+        Args:
+            job_id (str): The ID of the job.
+            user_session (aiohttp.ClientSession): The client session used for
+            making the request.
+            credential (Optional[Credential]): The pooled credential the job
+            was submitted with.
+            source (str): The source of the job, labelling its metrics.
+            span (Optional[Span]): The span of the job.
+
+        Yields:
+            dict: One result page at a time.
+        """
+        result_url = f"{self._base_url}/{job_id}/results"
+        try:
+            async with user_session.get(
+                result_url, headers=self._headers_for(credential)
+            ) as response:
+                if response.status >= 400:
+                    # Only the head of the body is read, as it is truncated
+                    # in the log anyway.
+                    logger.error(
+                        "http_error",
+                        "HTTP error occurred: %s - %s",
+                        response.status,
+                        response.reason,
+                        source=source,
+                        job_id=job_id,
+                        body=Body(
+                            await response.content.read(LOG_MAX_BODY + 1)
+                        ),
+                    )
+                    return
+                parser = ResultsStreamParser()
+                size = 0
+                async for chunk in response.content.iter_chunked(
+                    STREAM_CHUNK_SIZE
+                ):
+                    size += len(chunk)
+                    for item in parser.feed(chunk):
+                        yield item
+                parser.close()
+                if self._metrics is not None:
+                    self._metrics.result_bytes.observe(
+                        size, "push_pull", source
+                    )
+                self._hooks.emit("on_fetch", span, bytes=size)
+        except aiohttp.ClientConnectionError as e:
+            logger.error(
+                "connection_error",
+                "Connection error occurred: %s",
+                e,
+                source=source,
+                job_id=job_id,
+            )
+        except asyncio.TimeoutError:
+            logger.error(
+                "timeout",
+                "Timeout error. The request to %s has timed out.",
+                result_url,
+                source=source,
+            )
+
     async def _execute_with_timeout(
-        self, payload: dict, config: dict, user_session: aiohttp.ClientSession
+        self,
+        payload: dict,
+        config: dict,
+        user_session: "aiohttp.ClientSession",
     ) -> dict:
 
         request_timeout = config["request_timeout"]
         job_completion_timeout = config["job_completion_timeout"]
         poll_interval = config["poll_interval"]
+        source = payload.get("source", "")
+        span = self._hooks.begin(
+            "oxylabs.push_pull",
+            **{"oxylabs.integration": "push_pull", "oxylabs.source": source},
+        )
 
-        job_id = await self._get_job_id(payload, user_session, request_timeout)
-        if not job_id:
-            logger.error("Failed to get job ID")
+        # Jobs belong to the account that submitted them, so one credential
+        # is used for the submission, the polling and the results.
+        credential = await self._acquire(span)
+        try:
+            job_id = await self._get_job_id(
+                payload, user_session, request_timeout, credential, span
+            )
+            if not job_id:
+                logger.error(
+                    "no_job_id", "Failed to get job ID", source=source
+                )
 
-        job_completed = await self._poll_job_status(
-            job_id, poll_interval, user_session, job_completion_timeout
+            job_completed = await self._poll_job_status(
+                job_id,
+                poll_interval,
+                user_session,
+                job_completion_timeout,
+                credential,
+                source,
+                span,
+            )
+            if not job_completed:
+                logger.error(
+                    "job_incomplete",
+                    "Job did not complete successfully",
+                    source=source,
+                    job_id=job_id,
+                )
+
+            result = await self._get_http_resp(
+                job_id,
+                user_session,
+                credential=credential,
+                source=source,
+                span=span,
+            )
+            return result
+        finally:
+            self._release(credential)
+            self._hooks.end(span)
+
+    async def _execute_pages(
+        self,
+        payload: dict,
+        config: dict,
+        user_session: "aiohttp.ClientSession",
+    ) -> dict:
+        """
+        Runs a multi-page job as concurrent jobs of a page each and merges
+        their results in page order.
+        """
+        pages = split_pages(payload)
+        if pages is None:
+            return await self._execute_with_timeout(
+                payload, config, user_session
+            )
+        bodies = await asyncio.gather(
+            *(
+                self._execute_with_timeout(page, config, user_session)
+                for page in pages
+            ),
+            return_exceptions=True,
+        )
+        errors = [body for body in bodies if isinstance(body, Exception)]
+        if len(errors) == len(bodies):
+            raise errors[0]
+        for error in errors:
+            logger.error(
+                "page_error",
+                "A page of the job failed: %s",
+                error,
+                source=payload.get("source", ""),
+            )
+        return merge_pages(
+            payload,
+            (None if isinstance(body, Exception) else body for body in bodies),
         )
-        if not job_completed:
-            logger.error("Job did not complete successfully")
 
-        result = await self._get_http_resp(job_id, user_session)
-        return result
+    async def _execute_stream(
+        self,
+        payload: dict,
+        config: dict,
+        user_session: "aiohttp.ClientSession",
+    ) -> AsyncIterator[dict]:
+        """
+        Submits a job, waits for it to complete and yields its result pages
+        while they are being downloaded.
+
+        Args:
+            payload (dict): The payload for the request.
+            config (dict): The configuration for the request.
+            user_session (aiohttp.ClientSession): The client session used for
+            making the requests.
+
+        Yields:
+            dict: One result page at a time.
+        """
+        source = payload.get("source", "")
+        # The generator runs in the context of its consumer, where the span
+        # would stay current between pages and after the consumer stops
+        # early, so it is handed to every layer of the job instead.
+        span = self._hooks.start(
+            "oxylabs.push_pull",
+            **{"oxylabs.integration": "push_pull", "oxylabs.source": source},
+        )
+        credential = await self._acquire(span)
+        error = None
+        try:
+            job_id = await self._get_job_id(
+                payload,
+                user_session,
+                config["request_timeout"],
+                credential,
+                span,
+            )
+            if not job_id:
+                logger.error(
+                    "no_job_id", "Failed to get job ID", source=source
+                )
+                return
+
+            job_completed = await self._poll_job_status(
+                job_id,
+                config["poll_interval"],
+                user_session,
+                config["job_completion_timeout"],
+                credential,
+                source,
+                span,
+            )
+            if not job_completed:
+                logger.error(
+                    "job_incomplete",
+                    "Job did not complete successfully",
+                    source=source,
+                    job_id=job_id,
+                )
+                return
+
+            async for item in await self._get_http_resp(
+                job_id,
+                user_session,
+                stream=True,
+                credential=credential,
+                source=source,
+                span=span,
+            ):
+                yield item
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._release(credential)
+            self._hooks.end(span, error)
@@ -0,0 +1,65 @@
+from typing import Iterable, List, Optional
+
+from oxylabs.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+
+def split_pages(payload: dict) -> Optional[List[dict]]:
+    """
+    Splits the payload of a multi-page job into the payloads of a job per
+    page, or returns None if the job has a single page.
+
+    Example:
+        split_pages({"query": "shoes", "start_page": 3, "pages": 2})
+        # [{"query": "shoes", "start_page": 3, "pages": 1},
+        #  {"query": "shoes", "start_page": 4, "pages": 1}]
+    """
+    pages = int(payload.get("pages") or 1)
+    if pages <= 1:
+        return None
+    start = int(payload.get("start_page") or 1)
+    return [
+        {**payload, "start_page": start + i, "pages": 1} for i in range(pages)
+    ]
+
+
+def merge_pages(payload: dict, bodies: Iterable[Optional[dict]]) -> dict:
+    """
+    Merges the response bodies of the jobs of `split_pages`, in the order of
+    those jobs with None for failed ones, into the body of the multi-page
+    job they were split from.
+
+    The results keep the `page` of their job and their content as is, so
+    `pos` and `pos_overall`, which count from the top of each page, read
+    as in a single multi-page job. The job is that of the first page with
+    the number of pages requested.
+
+    Pages whose job failed are left out, listed in `missing_pages` of the
+    job and logged, so a partial result can be told from a complete one.
+
+    Returns:
+        dict: The merged body, or None if every job failed.
+    """
+    start = int(payload.get("start_page") or 1)
+    merged, missing = [], []
+    for i, body in enumerate(bodies):
+        if body:
+            merged.append(body)
+        else:
+            missing.append(start + i)
+    if not merged:
+        return None
+    results = [result for body in merged for result in body.get("results", ())]
+    results.sort(key=lambda result: result.get("page") or 0)
+    job = dict(merged[0].get("job") or {})
+    job["pages"] = payload.get("pages")
+    if missing:
+        job["missing_pages"] = missing
+        logger.error(
+            "missing_pages",
+            "Pages %s of the job failed and are missing from its results",
+            missing,
+            source=payload.get("source", ""),
+        )
+    return {"results": results, "job": job}
@@ -1 +1,14 @@
-from .proxy import ProxyClient
+from typing import TYPE_CHECKING
+
+from oxylabs.utils.lazy import lazy_attributes
+
+_ATTRIBUTES = {
+    "AsyncProxyClient": "oxylabs.proxy.proxy",
+    "ProxyClient": "oxylabs.proxy.proxy",
+}
+
+__all__ = list(_ATTRIBUTES)
+__getattr__ = lazy_attributes(__name__, _ATTRIBUTES, globals())
+
+if TYPE_CHECKING:
+    from .proxy import AsyncProxyClient, ProxyClient
@@ -1,90 +1,303 @@
-import logging
-from platform import python_version, architecture
-from typing import Optional
-from urllib.parse import quote, urlparse
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
 
+import oxylabs.utils.utils as utils
+from oxylabs.internal.credentials import Credential, CredentialPool
 from oxylabs.utils.defaults import (
-    NON_UNIVERSAL_DOMAINS,
     PROXY_BASE_URL,
+    PROXY_MAX_PROFILES,
+    PROXY_MAX_WORKERS,
+    PROXY_POOL_SIZE,
     PROXY_PORT,
+    STREAM_CHUNK_SIZE,
 )
-from oxylabs.utils.utils import prepare_config
-from oxylabs._version import __version__
+from oxylabs.utils.hosts import classify_url
+from oxylabs.utils.lazy import lazy_import
+from oxylabs.utils.log import get_logger
+from oxylabs.utils.tracing import NO_HOOKS, Hooks
+from oxylabs.utils.utils import prepare_config, sdk_header
+
+if TYPE_CHECKING:
+    import aiohttp
+else:
+    # Only needed by AsyncProxyClient, so imported on first use.
+    aiohttp = lazy_import("aiohttp")
+    asyncio = lazy_import("asyncio")
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
-class ProxyClient:
-    def __init__(self, username: str, password: str) -> None:
+class TransferStats:
+    def __init__(self) -> None:
         """
-        Initializes a ProxyClient object with the provided username and password.
+        Measures the body of a streamed response, from the moment its
+        headers are received until the last chunk is read.
+        """
+        self.bytes = 0
+        self._started = None
+        self._stopped = None
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        if self._started is not None and self._stopped is None:
+            self._stopped = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        """
+        The transfer time in seconds so far.
+        """
+        if self._started is None:
+            return 0.0
+        return (self._stopped or time.perf_counter()) - self._started
+
+    @property
+    def bytes_per_second(self) -> float:
+        """
+        The average transfer rate so far.
+        """
+        elapsed = self.elapsed
+        return self.bytes / elapsed if elapsed else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"TransferStats(bytes={self.bytes}, elapsed={self.elapsed:.3f}, "
+            f"bytes_per_second={self.bytes_per_second:.0f})"
+        )
+
+
+class ProxyStream:
+    def __init__(
+        self,
+        client: "ProxyClient",
+        session: requests.Session,
+        url: str,
+        options: dict,
+        chunk_size: int,
+    ) -> None:
+        """
+        Iterates over the body of a proxy endpoint response in chunks. The
+        request is sent when the iteration starts.
+
+        Args:
+            client (ProxyClient): The client sending the request.
+            session (requests.Session): The session to send it with.
+            url (str): The URL to send the GET request to.
+            options (dict): The keyword arguments of `Session.get`.
+            chunk_size (int): The maximum size of the chunks.
+        """
+        self._client = client
+        self._session = session
+        self._url = url
+        self._options = options
+        self._chunk_size = chunk_size
+        self.response = None
+        self.stats = TransferStats()
+
+    def __iter__(self) -> Iterator[bytes]:
+        client = self._client
+        credential = client._checkout()
+        try:
+            self.response = client._send(
+                self._session,
+                self._url,
+                credential,
+                stream=True,
+                **self._options,
+            )
+            try:
+                self.response.raise_for_status()
+                self.stats.start()
+                for chunk in self.response.iter_content(self._chunk_size):
+                    self.stats.bytes += len(chunk)
+                    yield chunk
+            finally:
+                self.stats.stop()
+                self.response.close()
+        finally:
+            client._checkin(credential)
+
+
+class AsyncProxyStream:
+    def __init__(
+        self,
+        client: "AsyncProxyClient",
+        url: str,
+        headers: dict,
+        request_timeout: int,
+        chunk_size: int,
+    ) -> None:
+        """
+        Asynchronously iterates over the body of a proxy endpoint response
+        in chunks. The request is sent when the iteration starts.
+
+        Args:
+            client (AsyncProxyClient): The client sending the request.
+            url (str): The URL to send the GET request to.
+            headers (dict): The request headers.
+            request_timeout (int): The timeout in seconds for connecting
+            and for reading each chunk.
+            chunk_size (int): The maximum size of the chunks.
+        """
+        self._client = client
+        self._url = url
+        self._headers = headers
+        self._request_timeout = request_timeout
+        self._chunk_size = chunk_size
+        self.response = None
+        self.stats = TransferStats()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        client = self._client
+        session = await client._acquire()
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=self._request_timeout,
+            sock_read=self._request_timeout,
+        )
+        try:
+            async with client._semaphore:
+                credential = await client._checkout()
+                try:
+                    async with session.get(
+                        self._url,
+                        headers=self._headers,
+                        proxy=client._proxy_for(credential),
+                        timeout=timeout,
+                    ) as response:
+                        self.response = response
+                        client._record(
+                            credential, response.status, response.headers
+                        )
+                        response.raise_for_status()
+                        self.stats.start()
+                        async for chunk in response.content.iter_chunked(
+                            self._chunk_size
+                        ):
+                            self.stats.bytes += len(chunk)
+                            yield chunk
+                finally:
+                    client._checkin(credential)
+        finally:
+            self.stats.stop()
+            await client._release()
+
+
+def _is_buffer(target: Any) -> bool:
+    """
+    Checks if a download target is a writable object rather than a path.
+    """
+    return hasattr(target, "write")
+
+
+class BaseProxyClient:
+    def __init__(
+        self,
+        username: Optional[str],
+        password: Optional[str],
+        headers: dict,
+        credential_pool: Optional[CredentialPool] = None,
+        endpoint: Optional[str] = None,
+    ) -> None:
+        """
+        Initializes the credentials and headers shared by proxy clients.
 
         Args:
-            username (str): The username for the proxy authentication.
-            password (str): The password for the proxy authentication.
+            username (Optional[str]): The username for the proxy
+            authentication.
+            password (Optional[str]): The password for the proxy
+            authentication.
+            headers (dict): The mapping holding the headers of every
+            request, updated by the `add_*_header` methods.
+            credential_pool (Optional[CredentialPool]): Several accounts to
+            spread the requests across, in place of the username and
+            password.
+            endpoint (Optional[str]): The "host:port" of the proxy
+            endpoint. Defaults to the Oxylabs proxy endpoint.
         """
+        if username is None:
+            if credential_pool is None:
+                raise ValueError(
+                    "Either a username and password or a credential pool "
+                    "are required"
+                )
+            first = credential_pool.credentials[0]
+            username, password = first.username, first.password
         self._username = quote(username)
         self._password = quote(password)
+        self._endpoint = endpoint or f"{PROXY_BASE_URL}:{PROXY_PORT}"
         self._proxy_url = self._build_proxy_url()
-        self._session = requests.Session()
-        self._session.proxies = {
-            "http": self._proxy_url,
-            "https": self._proxy_url,
+        self._credential_pool = credential_pool
+        # The proxy URL of every pooled credential, built once.
+        credentials = credential_pool.credentials if credential_pool else ()
+        self._proxy_urls = {
+            credential: self._build_proxy_url(credential.proxy_auth)
+            for credential in credentials
         }
-        self._session.verify = False
-        self._url_to_scrape = None
-        bits, _ = architecture()
-        self._session.headers["x-oxylabs-sdk"] = f"oxylabs-sdk-python/{__version__} ({python_version()}; {bits})"
+        self._headers = headers
+        self._headers["x-oxylabs-sdk"] = sdk_header()
 
-
-    def _build_proxy_url(self) -> str:
+    def _build_proxy_url(self, auth: Optional[str] = None) -> str:
         """
         Build the proxy URL using configured constants.
 
+        Args:
+            auth (Optional[str]): The quoted "username:password" to
+            authenticate with. Defaults to the credentials of the client.
+
         Returns:
             str: The constructed proxy URL.
         """
-        return f"http://{self._username}:{self._password}@{PROXY_BASE_URL}:{PROXY_PORT}"
+        auth = auth or f"{self._username}:{self._password}"
+        return f"http://{auth}@{self._endpoint}"
 
-    def get(
-        self, url: str, request_timeout: Optional[int] = None
-    ) -> Optional[requests.Response]:
+    def _proxy_for(self, credential: Optional[Credential]) -> str:
         """
-        Sends a GET request to the specified URL using the session object.
-
-        Args:
-            url (str): The URL to send the GET request to.
-            request_timeout (Optional[int]): The request timeout in seconds.
-            Defaults to None (no timeout).
+        Returns the proxy URL of a pooled credential, or of the client.
+        """
+        if credential is None:
+            return self._proxy_url
+        return self._proxy_urls[credential]
 
-        Returns:
-            Optional[requests.Response]: The response object returned by the
-            GET request, or None if an error occurred.
+    def _record(
+        self, credential: Optional[Credential], status: int, headers
+    ) -> None:
         """
-        try:
-            config = prepare_config(request_timeout=request_timeout)
-            self._url_to_scrape = url
-            response = self._session.get(
-                url, timeout=config["request_timeout"]
-            )
-            response.raise_for_status()
-            return response
-        except requests.exceptions.Timeout:
-            logger.error(
-                f"Timeout error. The request to {url} has timed out after {request_timeout} seconds."
+        Records the response status of a pooled credential.
+        """
+        if credential is not None:
+            self._credential_pool.record(
+                credential, status, headers.get("Retry-After")
             )
-            return None
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            return None
+
+    def _checkin(self, credential: Optional[Credential]) -> None:
+        if credential is not None:
+            self._credential_pool.release(credential)
 
     def add_user_agent_header(self, user_agent_type: str) -> None:
         """
-        Adds a user agent header to the session headers.
+        Adds a user agent header to the headers of every request.
         There is no way to indicate a specific User-Agent, but you can let us
         know which user-agent type you would like us to use.
 
@@ -116,11 +329,11 @@ class ProxyClient:
         Returns:
             None
         """
-        self._session.headers["x-oxylabs-user-agent-type"] = user_agent_type
+        self._headers["x-oxylabs-user-agent-type"] = user_agent_type
 
     def add_render_header(self, render: str) -> None:
         """
-        Adds a render header to the session headers.
+        Adds a render header to the headers of every request.
 
         Args:
             render (str): The render type to add. Must be one of the following:
@@ -130,13 +343,14 @@ class ProxyClient:
         Returns:
             None
         """
-        self._session.headers["x-oxylabs-render"] = render
+        self._headers["x-oxylabs-render"] = render
 
     def add_parse_header(
         self, parse: bool = False, parsing_instructions: Optional[dict] = None
     ) -> None:
         """
-        Adds a parse header to the session headers.
+        Adds a parse header to the headers of every request. The parser type
+        is chosen per request from its URL, as in `get`.
 
         Args:
             parse (bool, optional): Whether to enable parsing. Defaults to
@@ -149,36 +363,27 @@ class ProxyClient:
         """
 
         if parse or parsing_instructions:
-            self._session.headers["x-oxylabs-parse"] = "1"
-            if self._is_universal_source():
-                self._session.headers["x-oxylabs-parser-type"] = (
-                    "universal_ecommerce"
-                )
-            else:
-                self._session.headers.pop("x-oxylabs-parser-type", None)
+            self._headers["x-oxylabs-parse"] = "1"
         else:
-            self._session.headers.pop("x-oxylabs-parse", None)
+            self._headers.pop("x-oxylabs-parse", None)
+        self._headers.pop("x-oxylabs-parser-type", None)
 
-    def _is_universal_source(self) -> bool:
+    def _is_universal_source(self, url: str) -> bool:
         """
         Checks if the URL to scrape belongs to a universal source.
 
+        Args:
+            url (str): The URL to check.
+
         Returns:
             bool: True if the URL belongs to a universal source, False
             otherwise.
         """
-        parsed_url = urlparse(self._url_to_scrape)
-        if any(
-            domain in parsed_url.netloc.decode()
-            for domain in NON_UNIVERSAL_DOMAINS
-        ):
-            return False
-
-        return True
+        return classify_url(url) is None
 
     def add_geo_location_header(self, geo_location: str) -> None:
         """
-        Adds a geo location header to the session headers.
+        Adds a geo location header to the headers of every request.
         In some cases, you may need to indicate the geographical location that
         the result should be adapted for.
 
@@ -189,4 +394,724 @@ class ProxyClient:
         Returns:
             None
         """
-        self._session.headers["x-oxylabs-geo-location"] = geo_location
+        self._headers["x-oxylabs-geo-location"] = geo_location
+
+    def _build_headers(
+        self,
+        url: str,
+        user_agent_type: Optional[str] = None,
+        render: Optional[str] = None,
+        parse: Optional[bool] = None,
+        geo_location: Optional[str] = None,
+    ) -> dict:
+        """
+        Builds the headers of a single request from its options. Headers set
+        to None remove the session header of the same name.
+
+        When parsing is enabled, by `parse` or for every request with
+        `add_parse_header`, the parser type is chosen from the URL: the
+        universal ecommerce parser for hosts without a dedicated source.
+
+        Returns:
+            dict: The request headers, empty when no option is given.
+        """
+        headers = {}
+        if user_agent_type is not None:
+            headers["x-oxylabs-user-agent-type"] = user_agent_type
+        if render is not None:
+            headers["x-oxylabs-render"] = render
+        if geo_location is not None:
+            headers["x-oxylabs-geo-location"] = geo_location
+        if parse:
+            headers["x-oxylabs-parse"] = "1"
+        elif parse is not None:
+            headers["x-oxylabs-parse"] = None
+            headers["x-oxylabs-parser-type"] = None
+        if parse or (parse is None and "x-oxylabs-parse" in self._headers):
+            headers["x-oxylabs-parser-type"] = (
+                "universal_ecommerce"
+                if self._is_universal_source(url)
+                else None
+            )
+        return headers
+
+
+class ProxyClient(BaseProxyClient):
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        max_profiles: int = PROXY_MAX_PROFILES,
+        pool_size: int = PROXY_POOL_SIZE,
+        credential_pool: Optional[CredentialPool] = None,
+        endpoint: Optional[str] = None,
+        hooks: Optional[Hooks] = None,
+    ) -> None:
+        """
+        Initializes a ProxyClient object with the provided username and password.
+
+        Requests with a per-request `geo_location` or `user_agent_type` are
+        sent through a session of their own for each combination of the
+        two, so every profile keeps warm connections to the proxy endpoint.
+
+        Args:
+            username (Optional[str]): The username for the proxy
+            authentication.
+            password (Optional[str]): The password for the proxy
+            authentication.
+            max_profiles (int): The maximum number of profile sessions kept
+            open. The least recently used one is closed beyond that.
+            Defaults to 64.
+            pool_size (int): The maximum number of connections kept open
+            per session and host. Defaults to 32.
+            credential_pool (Optional[CredentialPool]): Several accounts to
+            spread the requests across, in place of the username and
+            password. Defaults to None.
+            endpoint (Optional[str]): The "host:port" of the proxy
+            endpoint, e.g. of a `MockServer`. Defaults to the Oxylabs proxy
+            endpoint.
+            hooks (Optional[Hooks]): The callbacks and span exporter of the
+            lifecycle events of the requests. Defaults to None.
+        """
+        self._hooks = hooks if hooks is not None else NO_HOOKS
+        self._pool_size = pool_size
+        self._max_profiles = max_profiles
+        self._profiles = OrderedDict()
+        self._profiles_lock = threading.Lock()
+        self._session = self._new_session()
+        super().__init__(
+            username,
+            password,
+            self._session.headers,
+            credential_pool,
+            endpoint,
+        )
+        self._session.proxies = {
+            "http": self._proxy_url,
+            "https": self._proxy_url,
+        }
+        self._proxies = {
+            credential: {"http": proxy_url, "https": proxy_url}
+            for credential, proxy_url in self._proxy_urls.items()
+        }
+
+    def _new_session(self) -> requests.Session:
+        """
+        Creates a session with its own connection pool sized for parallel
+        use, since every request goes through the same proxy.
+        """
+        session = requests.Session()
+        session.verify = False
+        adapter = HTTPAdapter(pool_maxsize=self._pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _session_for(
+        self,
+        geo_location: Optional[str] = None,
+        user_agent_type: Optional[str] = None,
+    ) -> requests.Session:
+        """
+        Returns the session of a geo location and user agent profile,
+        creating it on first use and closing the least recently used one
+        beyond `max_profiles`.
+
+        Profile sessions share the headers of the client, so headers added
+        later apply to them too.
+        """
+        if geo_location is None and user_agent_type is None:
+            return self._session
+        key = (geo_location, user_agent_type)
+        evicted = None
+        with self._profiles_lock:
+            session = self._profiles.get(key)
+            if session is not None:
+                self._profiles.move_to_end(key)
+                return session
+            session = self._new_session()
+            session.headers = self._session.headers
+            session.proxies = self._session.proxies
+            self._profiles[key] = session
+            if len(self._profiles) > self._max_profiles:
+                _, evicted = self._profiles.popitem(last=False)
+        if evicted is not None:
+            # Requests in flight on the evicted session still complete, its
+            # connections are discarded when they are released.
+            evicted.close()
+        return session
+
+    def _checkout(self) -> Optional[Credential]:
+        """
+        Picks a pooled credential for a request, waiting for its backoff to
+        end if every credential is backed off.
+        """
+        if self._credential_pool is None:
+            return None
+        credential = self._credential_pool.acquire()
+        if credential.wait:
+            self._hooks.emit(
+                "on_retry", self._hooks.current(), delay=credential.wait
+            )
+            time.sleep(credential.wait)
+        return credential
+
+    def _send(
+        self,
+        session: requests.Session,
+        url: str,
+        credential: Optional[Credential],
+        **options,
+    ) -> requests.Response:
+        """
+        Sends a GET request through the proxy of a pooled credential, or of
+        the session, and records its status.
+        """
+        if credential is not None:
+            options["proxies"] = self._proxies[credential]
+        response = session.get(url, **options)
+        self._record(credential, response.status_code, response.headers)
+        return response
+
+    def close(self) -> None:
+        """
+        Closes the connections of every session of the client.
+        """
+        with self._profiles_lock:
+            sessions = list(self._profiles.values())
+            self._profiles.clear()
+        for session in sessions:
+            session.close()
+        self._session.close()
+
+    def get(
+        self,
+        url: str,
+        request_timeout: Optional[int] = None,
+        user_agent_type: Optional[str] = None,
+        render: Optional[str] = None,
+        parse: Optional[bool] = None,
+        geo_location: Optional[str] = None,
+    ) -> Optional[requests.Response]:
+        """
+        Sends a GET request to the specified URL using the session object.
+
+        The options override the headers added to the session for this
+        request only, so one client can serve concurrent requests with
+        different options.
+
+        Args:
+            url (str): The URL to send the GET request to.
+            request_timeout (Optional[int]): The request timeout in seconds.
+            Defaults to None (no timeout).
+            user_agent_type (Optional[str]): The user agent type, as in
+            `add_user_agent_header`.
+            render (Optional[str]): The render type, as in
+            `add_render_header`.
+            parse (Optional[bool]): Whether to parse the result, as in
+            `add_parse_header`.
+            geo_location (Optional[str]): The geo location, as in
+            `add_geo_location_header`.
+
+        Returns:
+            Optional[requests.Response]: The response object returned by the
+            GET request, or None if an error occurred.
+        """
+        span = self._hooks.begin(
+            "oxylabs.proxy",
+            **{"oxylabs.integration": "proxy", "url.full": url},
+        )
+        credential = self._checkout()
+        try:
+            config = prepare_config(request_timeout=request_timeout)
+            headers = self._build_headers(
+                url, user_agent_type, render, parse, geo_location
+            )
+            options = {"headers": headers} if headers else {}
+            session = self._session_for(geo_location, user_agent_type)
+            self._hooks.emit("on_submit", span, url=url)
+            response = self._send(
+                session,
+                url,
+                credential,
+                timeout=config["request_timeout"],
+                **options,
+            )
+            self._hooks.emit("on_done", span, status_code=response.status_code)
+            response.raise_for_status()
+            if span is not None:
+                size = len(response.content)
+                self._hooks.annotate(
+                    span,
+                    {
+                        "http.response.status_code": response.status_code,
+                        "http.response.body.size": size,
+                    },
+                )
+                self._hooks.emit("on_fetch", span, bytes=size)
+            return response
+        except requests.exceptions.Timeout as e:
+            logger.error(
+                "timeout",
+                "Timeout error. The request to %s has timed out after %s "
+                "seconds.",
+                url,
+                request_timeout,
+            )
+            self._hooks.emit("on_error", span, error=e)
+            return None
+        except requests.exceptions.RequestException as e:
+            logger.error("request_error", "Request failed: %s", e, url=url)
+            self._hooks.emit("on_error", span, error=e)
+            return None
+        finally:
+            self._checkin(credential)
+            self._hooks.end(span)
+
+    def get_many(
+        self,
+        urls: Iterable[str],
+        max_workers: int = PROXY_MAX_WORKERS,
+        request_timeout: Optional[int] = None,
+        **options,
+    ) -> List[Optional[requests.Response]]:
+        """
+        Sends GET requests to many URLs in parallel threads sharing the
+        sessions of the client and their connection pools.
+
+        Args:
+            urls (Iterable[str]): The URLs to send the GET requests to.
+            max_workers (int): The maximum number of parallel requests.
+            Defaults to 8.
+            request_timeout (Optional[int]): The request timeout in seconds.
+            **options: The per-request options of `get`, applied to every
+            request.
+
+        Returns:
+            List[Optional[requests.Response]]: The responses in the order of
+            the URLs, with None for requests that failed.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda url: self.get(url, request_timeout, **options),
+                    urls,
+                )
+            )
+
+    def stream(
+        self,
+        url: str,
+        request_timeout: Optional[int] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        **options,
+    ) -> ProxyStream:
+        """
+        Streams the body of a URL in chunks instead of buffering it, e.g. to
+        download large pages or rendered PNGs.
+
+        Args:
+            url (str): The URL to send the GET request to.
+            request_timeout (Optional[int]): The timeout in seconds for
+            connecting and for reading each chunk.
+            chunk_size (int): The maximum size of the chunks. Defaults to
+            64 KiB.
+            **options: The per-request options of `get`.
+
+        Returns:
+            ProxyStream: An iterable over the chunks of the body, which
+            sends the request when the iteration starts and raises
+            `requests.exceptions.RequestException` if it fails. Its `stats`
+            report the transferred bytes and rate.
+        """
+        config = prepare_config(request_timeout=request_timeout)
+        headers = self._build_headers(url, **options)
+        kwargs = {"headers": headers} if headers else {}
+        session = self._session_for(
+            options.get("geo_location"), options.get("user_agent_type")
+        )
+        kwargs["timeout"] = config["request_timeout"]
+        return ProxyStream(self, session, url, kwargs, chunk_size)
+
+    def download(
+        self,
+        url: str,
+        target: Union[str, os.PathLike, BinaryIO],
+        request_timeout: Optional[int] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        **options,
+    ) -> Optional[TransferStats]:
+        """
+        Downloads the body of a URL chunk by chunk into a file or buffer.
+
+        Args:
+            url (str): The URL to send the GET request to.
+            target (Union[str, os.PathLike, BinaryIO]): The path of the file
+            to write, or a writable binary object such as an open file or
+            `io.BytesIO`.
+            request_timeout (Optional[int]): The timeout in seconds for
+            connecting and for reading each chunk.
+            chunk_size (int): The maximum size of the chunks. Defaults to
+            64 KiB.
+            **options: The per-request options of `get`.
+
+        Returns:
+            Optional[TransferStats]: The transferred bytes and rate, or None
+            if the download failed, in which case a partially written file
+            is removed.
+        """
+        stream = self.stream(url, request_timeout, chunk_size, **options)
+        try:
+            if _is_buffer(target):
+                for chunk in stream:
+                    target.write(chunk)
+            else:
+                with open(target, "wb") as file:
+                    for chunk in stream:
+                        file.write(chunk)
+        except requests.exceptions.RequestException as e:
+            logger.error("download_error", "Download of %s failed: %s", url, e)
+            if not _is_buffer(target) and os.path.exists(target):
+                os.remove(target)
+            return None
+        return stream.stats
+
+
+class AsyncProxyClient(BaseProxyClient):
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        max_concurrency: int = PROXY_POOL_SIZE,
+        credential_pool: Optional[CredentialPool] = None,
+        endpoint: Optional[str] = None,
+    ) -> None:
+        """
+        Initializes an AsyncProxyClient object with the provided username
+        and password.
+
+        Requests share one aiohttp session whose connections to the proxy
+        are reused. The session is closed once no request is in flight,
+        unless the client is used as an async context manager, in which case
+        it stays open until the context exits.
+
+        Args:
+            username (Optional[str]): The username for the proxy
+            authentication.
+            password (Optional[str]): The password for the proxy
+            authentication.
+            max_concurrency (int): The maximum number of requests in flight
+            at once. Defaults to 32.
+            credential_pool (Optional[CredentialPool]): Several accounts to
+            spread the requests across, in place of the username and
+            password. Defaults to None.
+            endpoint (Optional[str]): The "host:port" of the proxy
+            endpoint, e.g. of a `MockServer`. Defaults to the Oxylabs proxy
+            endpoint.
+        """
+        super().__init__(username, password, {}, credential_pool, endpoint)
+        self._max_concurrency = max_concurrency
+        self._session = None
+        self._semaphore = None
+        self._requests = 0
+        self._keep_open = False
+
+    async def __aenter__(self) -> "AsyncProxyClient":
+        self._keep_open = True
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._keep_open = False
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the session and its connections.
+        """
+        await utils.close(self._session)
+        self._session = None
+
+    async def _acquire(self) -> "aiohttp.ClientSession":
+        """
+        Returns the shared session, opening it if needed, and counts a
+        request in flight.
+        """
+        self._requests += 1
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._max_concurrency, ssl=False
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._session
+
+    async def _release(self) -> None:
+        """
+        Counts a finished request and closes the session when it was the
+        last one.
+        """
+        self._requests -= 1
+        if self._requests == 0 and not self._keep_open:
+            await self.close()
+
+    async def _checkout(self) -> Optional[Credential]:
+        """
+        Picks a pooled credential for a request, waiting for its backoff to
+        end if every credential is backed off.
+        """
+        if self._credential_pool is None:
+            return None
+        credential = self._credential_pool.acquire()
+        if credential.wait:
+            await asyncio.sleep(credential.wait)
+        return credential
+
+    def _request_headers(self, url: str, **options) -> dict:
+        """
+        Merges the client headers with the options of a single request.
+        """
+        headers = dict(self._headers)
+        for name, value in self._build_headers(url, **options).items():
+            if value is None:
+                headers.pop(name, None)
+            else:
+                headers[name] = value
+        return headers
+
+    async def get(
+        self,
+        url: str,
+        request_timeout: Optional[int] = None,
+        user_agent_type: Optional[str] = None,
+        render: Optional[str] = None,
+        parse: Optional[bool] = None,
+        geo_location: Optional[str] = None,
+    ) -> Optional["aiohttp.ClientResponse"]:
+        """
+        Asynchronously sends a GET request to the specified URL through the
+        proxy endpoint.
+
+        Args:
+            url (str): The URL to send the GET request to.
+            request_timeout (Optional[int]): The request timeout in seconds.
+            user_agent_type (Optional[str]): The user agent type, as in
+            `add_user_agent_header`.
+            render (Optional[str]): The render type, as in
+            `add_render_header`.
+            parse (Optional[bool]): Whether to parse the result, as in
+            `add_parse_header`.
+            geo_location (Optional[str]): The geo location, as in
+            `add_geo_location_header`.
+
+        Returns:
+            Optional[aiohttp.ClientResponse]: The response, with its body
+            already read, or None if an error occurred.
+        """
+        config = prepare_config(request_timeout=request_timeout)
+        headers = self._request_headers(
+            url,
+            user_agent_type=user_agent_type,
+            render=render,
+            parse=parse,
+            geo_location=geo_location,
+        )
+        session = await self._acquire()
+        try:
+            async with self._semaphore:
+                # Credentials are picked once the request can be sent, so
+                # queued requests do not count as in flight in the pool.
+                credential = await self._checkout()
+                try:
+                    async with session.get(
+                        url,
+                        headers=headers,
+                        proxy=self._proxy_for(credential),
+                        timeout=aiohttp.ClientTimeout(
+                            total=config["request_timeout"]
+                        ),
+                    ) as response:
+                        self._record(
+                            credential, response.status, response.headers
+                        )
+                        await response.read()
+                        response.raise_for_status()
+                        return response
+                finally:
+                    self._checkin(credential)
+        except asyncio.TimeoutError:
+            logger.error(
+                "timeout",
+                "Timeout error. The request to %s has timed out after %s "
+                "seconds.",
+                url,
+                request_timeout,
+            )
+            return None
+        except aiohttp.ClientError as e:
+            logger.error("request_error", "Request failed: %s", e, url=url)
+            return None
+        finally:
+            await self._release()
+
+    async def get_many(
+        self,
+        urls: Iterable[str],
+        request_timeout: Optional[int] = None,
+        **options,
+    ) -> List[Optional["aiohttp.ClientResponse"]]:
+        """
+        Asynchronously sends GET requests to many URLs, at most
+        `max_concurrency` at a time.
+
+        Args:
+            urls (Iterable[str]): The URLs to send the GET requests to.
+            request_timeout (Optional[int]): The request timeout in seconds.
+            **options: The per-request options of `get`, applied to every
+            request.
+
+        Returns:
+            List[Optional[aiohttp.ClientResponse]]: The responses in the
+            order of the URLs, with None for requests that failed.
+        """
+        return [
+            response
+            async for _, response in self.iter_get(
+                urls, request_timeout, ordered=True, **options
+            )
+        ]
+
+    async def iter_get(
+        self,
+        urls: Iterable[str],
+        request_timeout: Optional[int] = None,
+        ordered: bool = False,
+        **options,
+    ) -> AsyncIterator[Tuple[str, Optional["aiohttp.ClientResponse"]]]:
+        """
+        Asynchronously sends GET requests to many URLs and yields each
+        response as soon as it is available.
+
+        URLs are read lazily, so only `max_concurrency` requests are pending
+        at a time however many URLs there are.
+
+        Args:
+            urls (Iterable[str]): The URLs to send the GET requests to.
+            request_timeout (Optional[int]): The request timeout in seconds.
+            ordered (bool): Whether to yield the responses in the order of
+            the URLs instead of as they complete. Defaults to False.
+            **options: The per-request options of `get`, applied to every
+            request.
+
+        Yields:
+            Tuple[str, Optional[aiohttp.ClientResponse]]: The URL and its
+            response, or None if the request failed.
+        """
+
+        async def fetch(url: str) -> tuple:
+            return url, await self.get(url, request_timeout, **options)
+
+        urls = iter(urls)
+        pending = deque()
+        # Keep the session open between the requests of the iteration.
+        await self._acquire()
+        try:
+            while True:
+                while len(pending) < self._max_concurrency:
+                    url = next(urls, None)
+                    if url is None:
+                        break
+                    pending.append(asyncio.ensure_future(fetch(url)))
+                if not pending:
+                    break
+
+                if ordered:
+                    yield await pending.popleft()
+                    continue
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    pending.remove(task)
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await self._release()
+
+    def stream(
+        self,
+        url: str,
+        request_timeout: Optional[int] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        **options,
+    ) -> AsyncProxyStream:
+        """
+        Streams the body of a URL in chunks instead of buffering it, e.g. to
+        download large pages or rendered PNGs.
+
+        Args:
+            url (str): The URL to send the GET request to.
+            request_timeout (Optional[int]): The timeout in seconds for
+            connecting and for reading each chunk.
+            chunk_size (int): The maximum size of the chunks. Defaults to
+            64 KiB.
+            **options: The per-request options of `get`.
+
+        Returns:
+            AsyncProxyStream: An async iterable over the chunks of the body,
+            which sends the request when the iteration starts and raises
+            `aiohttp.ClientError` if it fails. Its `stats` report the
+            transferred bytes and rate.
+        """
+        config = prepare_config(request_timeout=request_timeout)
+        return AsyncProxyStream(
+            self,
+            url,
+            self._request_headers(url, **options),
+            config["request_timeout"],
+            chunk_size,
+        )
+
+    async def download(
+        self,
+        url: str,
+        target: Union[str, os.PathLike, BinaryIO],
+        request_timeout: Optional[int] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        **options,
+    ) -> Optional[TransferStats]:
+        """
+        Asynchronously downloads the body of a URL chunk by chunk into a
+        file or buffer.
+
+        Args:
+            url (str): The URL to send the GET request to.
+            target (Union[str, os.PathLike, BinaryIO]): The path of the file
+            to write, or a writable binary object such as an open file or
+            `io.BytesIO`.
+            request_timeout (Optional[int]): The timeout in seconds for
+            connecting and for reading each chunk.
+            chunk_size (int): The maximum size of the chunks. Defaults to
+            64 KiB.
+            **options: The per-request options of `get`.
+
+        Returns:
+            Optional[TransferStats]: The transferred bytes and rate, or None
+            if the download failed, in which case a partially written file
+            is removed.
+        """
+        stream = self.stream(url, request_timeout, chunk_size, **options)
+        try:
+            if _is_buffer(target):
+                async for chunk in stream:
+                    target.write(chunk)
+            else:
+                with open(target, "wb") as file:
+                    async for chunk in stream:
+                        file.write(chunk)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("download_error", "Download of %s failed: %s", url, e)
+            if not _is_buffer(target) and os.path.exists(target):
+                os.remove(target)
+            return None
+        return stream.stats
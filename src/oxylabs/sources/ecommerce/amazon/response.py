@@ -0,0 +1,43 @@
+from oxylabs.sources.ecommerce.response import (
+    AmazonRatingStarDistribution,
+    Content,
+    EcommerceResponse,
+    Results,
+)
+from oxylabs.utils.schema import Field
+
+
+class AmazonProductResponse(EcommerceResponse):
+    results = Field(["AmazonProductResults"])
+
+
+class AmazonProductResults(Results):
+    content_parsed = Field("AmazonProduct")
+
+
+class AmazonProduct(Content):
+    pass
+
+
+class AmazonReviewsResponse(EcommerceResponse):
+    results = Field(["AmazonReviewsResults"])
+
+
+class AmazonReviewsResults(Results):
+    content_parsed = Field("AmazonReviewsContent")
+
+
+class AmazonReviewsContent(Content):
+    rating_stars_distribution = Field([AmazonRatingStarDistribution])
+
+
+class AmazonPricingResponse(EcommerceResponse):
+    results = Field(["AmazonPricingResults"])
+
+
+class AmazonPricingResults(Results):
+    content_parsed = Field("AmazonPricingContent")
+
+
+class AmazonPricingContent(Content):
+    pass
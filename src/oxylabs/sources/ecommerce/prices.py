@@ -0,0 +1,380 @@
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
+from urllib.parse import urlsplit
+
+PRICE_FIELDS = (
+    "price",
+    "price_upper",
+    "price_strikethrough",
+    "price_shipping",
+)
+
+# Domains whose prices are written with a decimal comma, e.g. "1.234,56 €".
+COMMA_DECIMAL_DOMAINS: FrozenSet[str] = frozenset(
+    (
+        "at",
+        "be",
+        "com.br",
+        "com.tr",
+        "de",
+        "dk",
+        "es",
+        "fi",
+        "fr",
+        "it",
+        "nl",
+        "no",
+        "pl",
+        "pt",
+        "se",
+    )
+)
+
+# The currency of a domain, used when a row has no currency or only a symbol
+# shared by several currencies such as "$".
+DOMAIN_CURRENCIES: Dict[str, str] = {
+    "ae": "AED",
+    "at": "EUR",
+    "be": "EUR",
+    "ca": "CAD",
+    "co.jp": "JPY",
+    "co.uk": "GBP",
+    "com": "USD",
+    "com.au": "AUD",
+    "com.br": "BRL",
+    "com.mx": "MXN",
+    "com.tr": "TRY",
+    "de": "EUR",
+    "dk": "DKK",
+    "es": "EUR",
+    "fi": "EUR",
+    "fr": "EUR",
+    "in": "INR",
+    "it": "EUR",
+    "nl": "EUR",
+    "no": "NOK",
+    "pl": "PLN",
+    "pt": "EUR",
+    "sa": "SAR",
+    "se": "SEK",
+    "sg": "SGD",
+}
+
+# Symbols shared by several currencies, resolved through the domain: the
+# default currency of each symbol and the currencies it can stand for.
+SHARED_SYMBOLS: Dict[str, Tuple[str, FrozenSet[str]]] = {
+    "$": ("USD", frozenset(("AUD", "CAD", "MXN", "SGD", "USD"))),
+    "kr": ("SEK", frozenset(("DKK", "NOK", "SEK"))),
+}
+
+CURRENCY_SYMBOLS: Dict[str, str] = {
+    "€": "EUR",
+    "£": "GBP",
+    "¥": "JPY",
+    "₹": "INR",
+    "₺": "TRY",
+    "R$": "BRL",
+    "zł": "PLN",
+    "A$": "AUD",
+    "C$": "CAD",
+    "CA$": "CAD",
+    "AU$": "AUD",
+    "S$": "SGD",
+    "MX$": "MXN",
+    "US$": "USD",
+}
+
+# The nested lists of ecommerce results that rows can be read from.
+ROW_SECTIONS = (
+    "organic",
+    "paid",
+    "suggested",
+    "amazon_choices",
+    "instant_recommendations",
+)
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "Price normalization requires numpy. Install it with "
+            "`pip install oxylabs[numpy]`."
+        ) from None
+    return numpy
+
+
+_NUMBER_CHARS = frozenset("0123456789.,-–")
+_EMPTY = frozenset((type(None),))
+_NUMERIC = frozenset((type(None), float, int))
+
+
+def _delete(numpy, strings, keep: bool):
+    """
+    Deletes the characters that can't be part of a number from an array of
+    strings, or only those characters when `keep` is False.
+    """
+    strings = numpy.ascontiguousarray(strings)
+    if not strings.size or not strings.itemsize:
+        return strings
+    # A unicode array is an array of UCS4 code points, which reveals the
+    # few distinct characters to delete without looping over the strings.
+    codes = numpy.flatnonzero(numpy.bincount(strings.view(numpy.uint32)))
+    for char in map(chr, codes[codes > 0].tolist()):
+        if (char in _NUMBER_CHARS) != keep:
+            strings = numpy.char.replace(strings, char, "")
+    return strings
+
+
+class PriceBatch:
+    def __init__(
+        self,
+        prices: Dict[str, Any],
+        currency: Any,
+        domain: Any,
+        response_index: Any,
+    ) -> None:
+        """
+        Normalized prices of many ecommerce result rows, one array element
+        per row.
+
+        Args:
+            prices (Dict[str, ndarray]): Float arrays by price field, with
+            NaN where the price is missing or can't be parsed.
+            currency (ndarray): ISO 4217 currency codes, with "" where the
+            currency is unknown.
+            domain (ndarray): The domain each row was scraped from, e.g.
+            "de" for amazon.de.
+            response_index (ndarray): The index of the response each row
+            was read from.
+        """
+        self.prices = prices
+        self.currency = currency
+        self.domain = domain
+        self.response_index = response_index
+
+    def __len__(self) -> int:
+        return len(self.response_index)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__dict__["prices"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    @property
+    def mask(self) -> Dict[str, Any]:
+        """
+        Boolean arrays by price field, True where the price is missing.
+        """
+        numpy = _numpy()
+        return {name: numpy.isnan(v) for name, v in self.prices.items()}
+
+
+def _domain(result: dict, content: dict, job: dict) -> str:
+    """
+    Returns the domain of a result page, e.g. "co.uk" for amazon.co.uk.
+    """
+    url = result.get("url") or content.get("url")
+    if isinstance(url, str):
+        host = urlsplit(url).hostname or ""
+        if host.startswith("www."):
+            host = host[4:]
+        if "." in host:
+            return host.split(".", 1)[1]
+    return job.get("domain") or ""
+
+
+def _rows(content: dict, rows: str) -> List[dict]:
+    """
+    Returns the rows of parsed content for the given row kind.
+    """
+    if rows == "product":
+        return [content]
+    if rows == "pricing":
+        return content.get("pricing") or []
+    return (content.get("results") or {}).get(rows) or []
+
+
+def _collect(
+    responses: Iterable[Any], rows: str, fields: Tuple[str, ...]
+) -> Tuple[Dict[str, list], list, list, list, list]:
+    """
+    Flattens the rows of many responses into columns of raw values.
+
+    The domain and response index are returned once per page, along with
+    the number of rows of each page.
+    """
+    columns = {name: [] for name in fields}
+    currency, domain, response_index, counts = [], [], [], []
+    for index, response in enumerate(responses):
+        raw = response.raw if hasattr(response, "raw") else response
+        job = raw.get("job") or {}
+        for result in raw.get("results") or ():
+            content = result.get("content_parsed") or result.get("content")
+            if not isinstance(content, dict):
+                continue
+            items = _rows(content, rows)
+            if not items:
+                continue
+            default = content.get("currency") or ""
+            for name in fields:
+                columns[name].extend([item.get(name) for item in items])
+            currency.extend(
+                [item.get("currency") or default for item in items]
+            )
+            domain.append(_domain(result, content, job))
+            response_index.append(index)
+            counts.append(len(items))
+    return columns, currency, domain, response_index, counts
+
+
+def _parse(numpy, strings, comma):
+    """
+    Parses price strings such as "$1,299.99" or "1.299,99 €" into floats,
+    treating "," as the decimal separator where `comma` is set.
+    """
+    cleaned = _delete(numpy, strings, True)
+    if comma.any():
+        cleaned[comma] = numpy.char.replace(
+            numpy.char.replace(cleaned[comma], ".", ""), ",", "."
+        )
+    if not comma.all():
+        cleaned[~comma] = numpy.char.replace(cleaned[~comma], ",", "")
+
+    # Ranges such as "10.99 - 12.99" keep their lower bound.
+    cleaned = numpy.char.replace(cleaned, "–", "-")
+    ranges = numpy.char.find(cleaned, "-") >= 0
+    if ranges.any():
+        cleaned[ranges] = numpy.char.partition(cleaned[ranges], "-")[:, 0]
+
+    parsed = numpy.full(len(cleaned), numpy.nan)
+    dots = numpy.char.count(cleaned, ".")
+    valid = (dots <= 1) & (numpy.char.str_len(cleaned) > dots)
+    parsed[valid] = cleaned[valid].astype(float)
+    return parsed
+
+
+def _to_floats(numpy, values: list, comma, symbols, missing):
+    """
+    Converts a column of raw price values into a float array.
+
+    The currency symbols of price strings in rows flagged as `missing` are
+    written to the empty elements of `symbols`. Strings without an amount,
+    such as "N/A", hold no symbol, so their rows keep the currency of the
+    domain.
+    """
+    types = set(map(type, values))
+    if types <= _EMPTY:
+        return numpy.full(len(values), numpy.nan)
+    if types <= _NUMERIC:
+        return numpy.array(values, dtype=float)
+
+    column = numpy.empty(len(values), dtype=object)
+    column[:] = values
+    kinds = numpy.frompyfunc(type, 1, 1)(column)
+    numbers = (kinds == float) | (kinds == int)
+    strings = kinds == str
+
+    out = numpy.full(len(values), numpy.nan)
+    out[numbers] = column[numbers].astype(float)
+    if strings.any():
+        text = column[strings].astype(str)
+        out[strings] = _parse(numpy, text, comma[strings])
+        wanted = strings & missing & (symbols == "") & ~numpy.isnan(out)
+        if wanted.any():
+            symbols[wanted] = numpy.char.strip(
+                _delete(numpy, column[wanted].astype(str), False)
+            )
+    return out
+
+
+def _currencies(numpy, currency, domain):
+    """
+    Normalizes a column of currency codes and symbols into ISO 4217 codes,
+    falling back to the currency of the domain.
+    """
+    keys = numpy.char.add(numpy.char.add(currency, "|"), domain)
+    # Currencies repeat heavily, so each distinct one is resolved once.
+    unique, inverse = numpy.unique(keys, return_inverse=True)
+    codes = [_iso(*key.split("|")) for key in unique.tolist()]
+    # The extra code keeps the string dtype when there are no rows.
+    return numpy.array(codes + [""], dtype="<U3")[inverse]
+
+
+def _iso(currency: str, domain: str) -> str:
+    """
+    Returns the ISO 4217 code of a currency code or symbol.
+    """
+    if len(currency) == 3 and currency.isalpha():
+        return currency.upper()
+    if currency in CURRENCY_SYMBOLS:
+        return CURRENCY_SYMBOLS[currency]
+    local = DOMAIN_CURRENCIES.get(domain, "")
+    if not currency:
+        return local
+    if currency in SHARED_SYMBOLS:
+        default, currencies = SHARED_SYMBOLS[currency]
+        return local if local in currencies else default
+    return ""
+
+
+def normalize_prices(
+    responses: Iterable[Any],
+    rows: str = "organic",
+    fields: Tuple[str, ...] = PRICE_FIELDS,
+    comma_decimal_domains: FrozenSet[str] = COMMA_DECIMAL_DOMAINS,
+) -> PriceBatch:
+    """
+    Normalizes the prices of many ecommerce responses into NumPy arrays.
+
+    Prices returned as numbers are used as is. Prices returned as strings
+    are parsed in bulk, honouring the decimal separator of the domain the
+    page was scraped from, e.g. "1.299,99 €" on amazon.de. Requires numpy.
+
+    Args:
+        responses (Iterable[EcommerceResponse]): The responses, or their
+        raw data.
+        rows (str): The rows to read: "product" for the product of each
+        page, "pricing" for its seller offers, or one of the result lists
+        of search pages: "organic", "paid", "suggested", "amazon_choices"
+        or "instant_recommendations". Defaults to "organic".
+        fields (Tuple[str, ...]): The price fields to read. Defaults to
+        `PRICE_FIELDS`.
+        comma_decimal_domains (FrozenSet[str]): The domains writing prices
+        with a decimal comma. Defaults to `COMMA_DECIMAL_DOMAINS`.
+
+    Returns:
+        PriceBatch: The normalized prices, one element per row.
+
+    Raises:
+        ValueError: If `rows` is not a known kind of rows.
+    """
+    if rows not in ("product", "pricing") + ROW_SECTIONS:
+        raise ValueError(f"Unknown rows: {rows}")
+
+    numpy = _numpy()
+    columns, currency, domain, response_index, counts = _collect(
+        responses, rows, tuple(fields)
+    )
+    domain = numpy.repeat(numpy.array(domain, dtype=str), counts)
+    comma = numpy.isin(domain, list(comma_decimal_domains))
+
+    # Rows without a currency take the symbol of their price strings.
+    currency = numpy.char.strip(numpy.array(currency, dtype=str))
+    missing = currency == ""
+    symbols = numpy.full(len(currency), "", dtype=object)
+    prices = {
+        name: _to_floats(numpy, values, comma, symbols, missing)
+        for name, values in columns.items()
+    }
+    currency = numpy.where(missing, symbols.astype(str), currency)
+
+    return PriceBatch(
+        prices=prices,
+        currency=_currencies(numpy, currency, domain),
+        domain=domain,
+        response_index=numpy.repeat(
+            numpy.array(response_index, dtype=numpy.intp), counts
+        ),
+    )
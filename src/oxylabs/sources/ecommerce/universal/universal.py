@@ -1,6 +1,8 @@
 from typing import Optional
 
 from oxylabs.sources.ecommerce.response import EcommerceResponse
+from oxylabs.sources.router import Route, route_url
+from oxylabs.utils.batch import many
 from oxylabs.utils.types import source
 from oxylabs.utils.utils import (
     check_parsing_instructions_validity,
@@ -32,6 +34,7 @@ class Universal:
         parser_type: Optional[str] = None,
         parsing_instructions: Optional[dict] = None,
         request_timeout: int = None,
+        route: bool = False,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -53,15 +56,16 @@ class Universal:
             request_timeout (int | 165, optional): The interval in seconds for
             the request to time out if no response is returned.
             Defaults to 165.
+            route (bool): Whether to scrape URLs of Amazon, Google Shopping,
+            Bing and Wayfair with their dedicated source when it accepts the
+            given parameters. Defaults to False.
 
         Returns:
             EcommerceResponse: The response from the server after the job is completed.
         """
 
         config = prepare_config(request_timeout=request_timeout)
-        payload = {
-            "source": source.UNIVERSAL,
-            "url": url,
+        params = {
             "user_agent_type": user_agent_type,
             "geo_location": geo_location,
             "locale": locale,
@@ -74,10 +78,18 @@ class Universal:
             "parsing_instructions": parsing_instructions,
             **kwargs,
         }
+        target = (
+            route_url(url, **params)
+            if route
+            else Route(source.UNIVERSAL, {"url": url})
+        )
+        payload = {"source": target.source, **target.params, **params}
         check_parsing_instructions_validity(parsing_instructions)
         response = self._ecommerce_instance._get_resp(payload, config)
         return response
 
+    scrape_url_many = many(scrape_url)
+
 
 class UniversalAsync:
     def __init__(self, ecommerce_async_instance) -> None:
@@ -105,6 +117,7 @@ class UniversalAsync:
         request_timeout: int = None,
         job_completion_timeout: int = None,
         poll_interval: int = None,
+        route: bool = False,
         **kwargs
     ) -> EcommerceResponse:
         """
@@ -131,6 +144,9 @@ class UniversalAsync:
             job_completion_timeout (int | 50, optional): The interval in
             seconds for the job to time out if no response is returned.
             Defaults to 50.
+            route (bool): Whether to scrape URLs of Amazon, Google Shopping,
+            Bing and Wayfair with their dedicated source when it accepts the
+            given parameters. Defaults to False.
 
         Returns:
             EcommerceResponse: The response from the server after the job is completed.
@@ -142,9 +158,7 @@ class UniversalAsync:
             job_completion_timeout=job_completion_timeout,
             async_integration=True,
         )
-        payload = {
-            "source": source.UNIVERSAL,
-            "url": url,
+        params = {
             "user_agent_type": user_agent_type,
             "geo_location": geo_location,
             "locale": locale,
@@ -157,6 +171,12 @@ class UniversalAsync:
             "parsing_instructions": parsing_instructions,
             **kwargs,
         }
+        target = (
+            route_url(url, **params)
+            if route
+            else Route(source.UNIVERSAL, {"url": url})
+        )
+        payload = {"source": target.source, **target.params, **params}
         check_parsing_instructions_validity(parsing_instructions)
         response = await self._ecommerce_async_instance._get_resp(
             payload, config
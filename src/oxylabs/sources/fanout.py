@@ -0,0 +1,84 @@
+from itertools import product
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from oxylabs.sources import registry
+
+AXES = ("geo_location", "domain", "locale")
+
+
+class Cell(NamedTuple):
+    """
+    One job of a fan-out: a query and the location, domain and locale it is
+    scraped with. Axes left out of the fan-out are None.
+    """
+
+    query: str
+    geo_location: Optional[str] = None
+    domain: Optional[str] = None
+    locale: Optional[str] = None
+
+    def params(self) -> dict:
+        """
+        Returns the query parameters of the cell that are set.
+        """
+        return {k: v for k, v in zip(self._fields, self) if v is not None}
+
+
+def _unique(values: Optional[Iterable[str]]) -> tuple:
+    if values is None:
+        return (None,)
+    values = tuple(dict.fromkeys(values))
+    return values or (None,)
+
+
+def check_axes(
+    source: str,
+    geo_locations: Optional[Iterable[str]] = None,
+    domains: Optional[Iterable[str]] = None,
+    locales: Optional[Iterable[str]] = None,
+) -> None:
+    """
+    Checks that a source takes a query and every axis of a fan-out.
+
+    Raises:
+        ValueError: If the source is not registered or does not take the
+        query or an axis given.
+    """
+    params = registry.get(source).params
+    if params[0] != "query":
+        raise ValueError(f"The source {source} does not take a query")
+    for axis, values in zip(AXES, (geo_locations, domains, locales)):
+        if values is not None and axis not in params:
+            raise ValueError(f"The source {source} does not take {axis}")
+
+
+def cells(
+    queries: Iterable[str],
+    geo_locations: Optional[Iterable[str]] = None,
+    domains: Optional[Iterable[str]] = None,
+    locales: Optional[Iterable[str]] = None,
+) -> Iterator[Cell]:
+    """
+    Yields the cross product of queries and locations, domains and locales
+    one cell at a time, without duplicates, in the order of the queries.
+
+    The axes are read up front and the queries lazily, so memory grows with
+    the number of distinct queries and axis values, not with the number of
+    cells.
+
+    Example:
+        cells(["shoes", "boots"], geo_locations=["Berlin,Germany"],
+              domains=["de", "com"])
+        # Cell("shoes", "Berlin,Germany", "de", None),
+        # Cell("shoes", "Berlin,Germany", "com", None), ...
+    """
+    combinations = tuple(
+        product(_unique(geo_locations), _unique(domains), _unique(locales))
+    )
+    seen = set()
+    for query in queries:
+        if query in seen:
+            continue
+        seen.add(query)
+        for geo_location, domain, locale in combinations:
+            yield Cell(query, geo_location, domain, locale)
@@ -0,0 +1,877 @@
+import importlib
+import sys
+import textwrap
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Union
+
+from oxylabs.utils.defaults import DEFAULT_REQUEST_TIMEOUT
+from oxylabs.utils.types import source
+from oxylabs.utils.utils import (
+    check_parsing_instructions_validity,
+    prepare_config,
+)
+
+
+class Param(NamedTuple):
+    """
+    A query parameter of the sources, with its annotation and description
+    in the generated scrape methods.
+    """
+
+    annotation: str
+    doc: str
+
+
+PARAMS: Dict[str, Param] = {
+    "query": Param("str", "The search query."),
+    "url": Param("str", "The URL to be scraped."),
+    "domain": Param(
+        "Optional[str]", 'The domain to localize the results to, e.g. "de".'
+    ),
+    "start_page": Param("Optional[int]", "The starting page number."),
+    "pages": Param("Optional[int]", "The number of pages to scrape."),
+    "limit": Param(
+        "Optional[int]", "Number of results to retrieve in each page."
+    ),
+    "locale": Param(
+        "Optional[str]",
+        "Accept-Language header value which changes the web interface "
+        "language of the page.",
+    ),
+    "results_language": Param("Optional[str]", "The language of the results."),
+    "geo_location": Param(
+        "Optional[str]", "The geographical location of the results."
+    ),
+    "user_agent_type": Param("Optional[str]", "Device type and browser."),
+    "render": Param("Optional[str]", "Enables JavaScript rendering."),
+    "content_encoding": Param(
+        "Optional[str]", "Add this parameter if you are downloading images."
+    ),
+    "callback_url": Param("Optional[str]", "URL to your callback endpoint."),
+    "parse": Param("Optional[bool]", "true will return structured data."),
+    "parser_type": Param(
+        "Optional[str]",
+        "Set the value to ecommerce_product to access the AI-powered "
+        "Adaptive Parser.",
+    ),
+    "parsing_instructions": Param(
+        "Optional[dict]", "Instructions for parsing the results."
+    ),
+    "context": Param(
+        "Optional[list]",
+        "Additional parameters of the source, as a list of "
+        '{"key": ..., "value": ...} dicts.',
+    ),
+}
+
+# The validators run on the value of a parameter whenever it is set.
+VALIDATORS: Dict[str, Callable[[Any], None]] = {
+    "parsing_instructions": check_parsing_instructions_validity,
+}
+
+RESPONSES = {"serp": "SERPResponse", "ecommerce": "EcommerceResponse"}
+
+
+def with_context(context: Optional[list], defaults: tuple) -> list:
+    """
+    Returns a copy of the context of a job with default entries added for
+    the keys it does not set, e.g. {"key": "tbm", "value": "isch"}.
+    """
+    context = [dict(item) for item in context or ()]
+    defaults = dict(defaults)
+    for item in context:
+        key = item.get("key")
+        if key in defaults:
+            item.setdefault("value", defaults.pop(key))
+    context += [{"key": k, "value": v} for k, v in defaults.items()]
+    return context
+
+
+class Source(NamedTuple):
+    """
+    The declaration of a source: the API serving it, the parameters it
+    accepts in the order of its scrape methods, and their defaults and
+    validators.
+    """
+
+    name: str
+    api: str
+    params: tuple
+    method: Optional[str]
+    summary: str
+    defaults: Dict[str, Any]
+    validators: Dict[str, Callable[[Any], None]]
+    # The default (key, value) entries of the context of its jobs.
+    context: tuple = ()
+    # The position of the timeouts among the parameters of the asynchronous
+    # method, for methods taking them before the other parameters. Defaults
+    # to after the parameters.
+    async_timeouts_at: Optional[int] = None
+    # The dotted path of the per-source response model, if any.
+    model: Optional[str] = None
+
+    @property
+    def response(self) -> str:
+        """
+        The name of the response model of the source: its per-source model,
+        or that of its API.
+        """
+        if self.model is not None:
+            return self.model.rpartition(".")[2]
+        return RESPONSES[self.api]
+
+    def payload(self, params: Dict[str, Any]) -> dict:
+        """
+        Returns the payload of a job of the source, with its defaults applied
+        and without parameters set to None.
+
+        Parameters the source does not declare are passed through, as the
+        scrape methods do with their keyword arguments.
+
+        Raises:
+            Exception: If the value of a parameter is invalid.
+        """
+        payload = {"source": self.name}
+        if self.defaults:
+            params = {**self.defaults, **params}
+        if self.context:
+            params = {
+                **params,
+                "context": with_context(params.get("context"), self.context),
+            }
+        for key, value in params.items():
+            if value is None:
+                continue
+            validator = self.validators.get(key)
+            if validator is not None:
+                validator(value)
+            payload[key] = value
+        return payload
+
+
+SOURCES: Dict[str, Source] = {}
+
+
+def register(
+    name: str,
+    api: str,
+    params: Iterable[str],
+    method: Optional[str] = None,
+    summary: str = "",
+    defaults: Optional[Dict[str, Any]] = None,
+    validators: Optional[Dict[str, Callable[[Any], None]]] = None,
+    async_timeouts_at: Optional[int] = None,
+    model: Optional[str] = None,
+) -> Source:
+    """
+    Declares a source, making it available to `client.scrape` and to the
+    generation of its scrape methods.
+
+    Args:
+        name (str): The source, e.g. "google_search".
+        api (str): The API serving the source, "serp" or "ecommerce", which
+        decides its response model.
+        params (Iterable[str]): The parameters of the source declared in
+        `PARAMS`, starting with the required one, e.g. "query" or "url".
+        method (Optional[str]): The name of the scrape method of the source,
+        e.g. "scrape_search". Defaults to None for sources without one.
+        summary (str): The first line of the docstring of the method.
+        defaults (Optional[Dict[str, Any]]): Default values of parameters,
+        applied when they are not given.
+        validators (Optional[Dict[str, Callable]]): Validators of parameters
+        besides those of `VALIDATORS`.
+        async_timeouts_at (Optional[int]): The position of the timeouts
+        among the parameters of the asynchronous method, e.g. 1 to take them
+        right after the URL. Defaults to None, after the parameters.
+        model (Optional[str]): The dotted path of a response model of the
+        source, narrower than that of its API, e.g.
+        "oxylabs.sources.serp.google.response.GoogleSearchResponse". It is
+        imported when a response of the source is first built.
+
+    Raises:
+        ValueError: If the API or a parameter is unknown.
+    """
+    if api not in RESPONSES:
+        raise ValueError(f"Unknown API: {api}")
+    params = tuple(params)
+    for param in params:
+        if param not in PARAMS:
+            raise ValueError(f"Unknown parameter of {name}: {param}")
+    spec = Source(
+        name,
+        api,
+        params,
+        method,
+        summary,
+        dict(defaults or {}),
+        {
+            **{p: VALIDATORS[p] for p in params if p in VALIDATORS},
+            **(validators or {}),
+        },
+        async_timeouts_at=async_timeouts_at,
+        model=model,
+    )
+    SOURCES[name] = spec
+    _models.pop(name, None)
+    return spec
+
+
+def variant(
+    name: str,
+    method: str,
+    summary: str,
+    params: Optional[Iterable[str]] = None,
+    context: Optional[Dict[str, Any]] = None,
+) -> Source:
+    """
+    Declares a scrape method sending jobs of a registered source with its
+    own parameters and default context entries, e.g. Google Images
+    searches, which are Google searches with the "tbm" context set to
+    "isch". Variants are not registered, so `client.scrape` is unaffected.
+
+    Example:
+        GOOGLE_IMAGES_SEARCH = variant(
+            source.GOOGLE_SEARCH, "scrape_images", "Scrapes Google Images.",
+            context={"tbm": "isch"},
+        )
+
+    Raises:
+        ValueError: If the source is not registered or a parameter is
+        unknown.
+    """
+    spec = get(name)
+    params = spec.params if params is None else tuple(params)
+    for param in params:
+        if param not in PARAMS:
+            raise ValueError(f"Unknown parameter of {name}: {param}")
+    return spec._replace(
+        params=params,
+        method=method,
+        summary=summary,
+        context=tuple((context or {}).items()),
+    )
+
+
+def get(name: str) -> Source:
+    """
+    Returns the declaration of a source.
+
+    Raises:
+        ValueError: If the source is not registered.
+    """
+    try:
+        return SOURCES[name]
+    except KeyError:
+        raise ValueError(f"Unknown source: {name}") from None
+
+
+_models: Dict[str, type] = {}
+
+
+def response_model(name: str, default: type) -> type:
+    """
+    Returns the per-source response model of a source, importing it on
+    first use, or `default`, the model of its API, if it has none.
+    """
+    model = _models.get(name)
+    if model is None:
+        spec = SOURCES.get(name)
+        if spec is None or spec.model is None:
+            return default
+        module, _, attribute = spec.model.rpartition(".")
+        model = _models[name] = getattr(
+            importlib.import_module(module), attribute
+        )
+    return model
+
+
+def _wrap(text: str, indent: int) -> list:
+    return textwrap.wrap(
+        text,
+        width=79,
+        initial_indent=" " * indent,
+        subsequent_indent=" " * indent,
+    )
+
+
+def _docstring(spec: Source, is_async: bool) -> str:
+    summary = spec.summary
+    if is_async:
+        summary = f"Asynchronously {summary[:1].lower()}{summary[1:]}"
+    lines = [""] + _wrap(summary, 8) + ["", "        Args:"]
+    params = []
+    for name in spec.params:
+        param = PARAMS[name]
+        params.append(_wrap(f"{name} ({param.annotation}): {param.doc}", 12))
+    timeouts = _wrap(
+        "request_timeout (int | 165, optional): The interval in seconds for "
+        "the request to time out if no response is returned. Defaults to "
+        "165.",
+        12,
+    )
+    if is_async:
+        timeouts += _wrap(
+            "job_completion_timeout (int | 50, optional): The interval in "
+            "seconds for the job to time out if no response is returned. "
+            "Defaults to 50.",
+            12,
+        )
+        timeouts += _wrap(
+            "poll_interval (int | 5, optional): The interval in seconds to "
+            "poll the server for a response. Defaults to 5.",
+            12,
+        )
+    position = _timeouts_at(spec, is_async)
+    params.insert(position, timeouts)
+    lines += [line for param in params for line in param]
+    if "pages" in spec.params:
+        lines += _wrap(
+            "parallel_pages (bool): Whether to split a multi-page job into "
+            "concurrent jobs of a page each, merged into one response in "
+            "page order. Pages whose job failed are left out and listed in "
+            "`job.missing_pages`. Defaults to False.",
+            12,
+        )
+    lines += ["", "        Returns:"]
+    lines += _wrap(
+        f"{spec.response}: The response from the server after the job is "
+        "completed.",
+        12,
+    )
+    return "\n".join(lines) + "\n        "
+
+
+def _timeouts_at(spec: Source, is_async: bool) -> int:
+    """
+    Returns the position of the timeouts among the parameters of a scrape
+    method.
+    """
+    if is_async and spec.async_timeouts_at is not None:
+        return spec.async_timeouts_at
+    return len(spec.params)
+
+
+def _generate(spec: Union[str, Source], is_async: bool, frame) -> Callable:
+    """
+    Generates the scrape method of a registered source or of a variant with
+    straight-line code, as if it were written by hand.
+    """
+    if isinstance(spec, str):
+        spec = get(spec)
+    if spec.method is None:
+        raise ValueError(f"The source {spec.name} has no scrape method")
+
+    bound = {
+        "Optional": Optional,
+        "_source": spec.name,
+        "_prepare_config": prepare_config,
+    }
+    args = []
+    for i, param in enumerate(spec.params):
+        annotation = PARAMS[param].annotation
+        if i == 0:
+            args.append(f"{param}: {annotation}")
+            continue
+        bound[f"_default_{param}"] = spec.defaults.get(param)
+        args.append(f"{param}: {annotation} = _default_{param}")
+    timeouts = [f"request_timeout: Optional[int] = {DEFAULT_REQUEST_TIMEOUT}"]
+    config = ["request_timeout=request_timeout"]
+    if is_async:
+        timeouts += [
+            "job_completion_timeout: Optional[int] = None",
+            "poll_interval: Optional[int] = None",
+        ]
+        config += [
+            "poll_interval=poll_interval",
+            "job_completion_timeout=job_completion_timeout",
+            "async_integration=True",
+        ]
+    position = _timeouts_at(spec, is_async)
+    args = ["self"] + args[:position] + timeouts + args[position:]
+    if "pages" in spec.params:
+        args.append("parallel_pages: bool = False")
+    args.append("**kwargs")
+
+    body = ['    payload = {"source": _source,']
+    for param in spec.params:
+        if param == "context" and spec.context:
+            bound["_with_context"] = with_context
+            bound["_context"] = spec.context
+            body.append(
+                f"        {param!r}: _with_context({param}, _context),"
+            )
+        else:
+            body.append(f"        {param!r}: {param},")
+    body.append("        **kwargs}")
+    for param, validator in spec.validators.items():
+        if param in spec.params:
+            bound[f"_validate_{param}"] = validator
+            body.append(f"    _validate_{param}({param})")
+    body.append(f"    config = _prepare_config({', '.join(config)})")
+    if "pages" in spec.params:
+        body.append("    config['parallel_pages'] = parallel_pages")
+    instance = (
+        f"_{spec.api}_async_instance" if is_async else f"_{spec.api}_instance"
+    )
+    call = f"self.{instance}._get_resp(payload, config)"
+    body.append(
+        f"    return await {call}" if is_async else f"    return {call}"
+    )
+
+    prefix = "async def" if is_async else "def"
+    source_code = "\n".join(
+        [f"{prefix} {spec.method}({', '.join(args)}) -> {spec.response!r}:"]
+        + body
+    )
+    namespace = dict(bound)
+    exec(source_code, namespace)
+    method = namespace[spec.method]
+    method.__doc__ = _docstring(spec, is_async)
+    method.__module__ = frame.f_globals.get("__name__", __name__)
+    method.__qualname__ = f"{frame.f_code.co_name}.{spec.method}"
+    method._spec = spec
+    return method
+
+
+def method(spec: Union[str, Source]) -> Callable:
+    """
+    Returns the scrape method of a registered source, or of a variant, to
+    be assigned in the body of its source class.
+
+    Example:
+        class Google:
+            scrape_search = registry.method(source.GOOGLE_SEARCH)
+
+    Raises:
+        ValueError: If the source is not registered or has no method.
+    """
+    return _generate(spec, False, sys._getframe(1))
+
+
+def async_method(spec: Union[str, Source]) -> Callable:
+    """
+    Returns the asynchronous scrape method of a registered source, or of a
+    variant, which also takes the `job_completion_timeout` and
+    `poll_interval` of the job.
+
+    Raises:
+        ValueError: If the source is not registered or has no method.
+    """
+    return _generate(spec, True, sys._getframe(1))
+
+
+_SEARCH = (
+    "domain",
+    "start_page",
+    "pages",
+    "limit",
+    "locale",
+    "geo_location",
+    "user_agent_type",
+    "render",
+    "callback_url",
+)
+
+register(
+    source.GOOGLE_SEARCH,
+    "serp",
+    ("query",) + _SEARCH + ("parse", "parsing_instructions", "context"),
+    "scrape_search",
+    "Scrapes Google search results for a given query.",
+    model="oxylabs.sources.serp.google.response.GoogleSearchResponse",
+)
+register(
+    source.GOOGLE_URL,
+    "serp",
+    (
+        "url",
+        "user_agent_type",
+        "render",
+        "callback_url",
+        "geo_location",
+        "parse",
+        "parsing_instructions",
+    ),
+    "scrape_url",
+    "Scrapes Google search results for a given URL.",
+    async_timeouts_at=1,
+)
+register(
+    source.GOOGLE_ADS,
+    "serp",
+    (
+        "query",
+        "domain",
+        "start_page",
+        "pages",
+        "locale",
+        "geo_location",
+        "user_agent_type",
+        "render",
+        "callback_url",
+        "parse",
+        "parsing_instructions",
+        "context",
+    ),
+    "scrape_ads",
+    "Scrapes Google Ads search results for a given query.",
+)
+register(
+    source.GOOGLE_SUGGESTIONS,
+    "serp",
+    (
+        "query",
+        "locale",
+        "geo_location",
+        "user_agent_type",
+        "render",
+        "callback_url",
+    ),
+    "scrape_suggestions",
+    "Scrapes Google suggestions for a given query.",
+)
+register(
+    source.GOOGLE_HOTELS,
+    "serp",
+    ("query",) + _SEARCH + ("context",),
+    "scrape_hotels",
+    "Scrapes Google Hotels search results for a given query.",
+)
+register(
+    source.GOOGLE_TRAVEL_HOTELS,
+    "serp",
+    (
+        "query",
+        "domain",
+        "start_page",
+        "locale",
+        "geo_location",
+        "user_agent_type",
+        "render",
+        "callback_url",
+        "context",
+    ),
+    "scrape_travel_hotels",
+    "Scrapes Google Travel Hotels search results for a given query.",
+)
+_IMAGES = (
+    "query",
+    "domain",
+    "start_page",
+    "pages",
+    "locale",
+    "geo_location",
+    "user_agent_type",
+    "render",
+    "callback_url",
+    "parse",
+    "parsing_instructions",
+    "context",
+)
+
+# The google_images source searches by image URL and has no scrape method.
+# `scrape_images` searches images by text, as a Google search with the
+# "tbm" context set to "isch".
+register(source.GOOGLE_IMAGES, "serp", _IMAGES)
+GOOGLE_IMAGES_SEARCH = variant(
+    source.GOOGLE_SEARCH,
+    "scrape_images",
+    "Scrapes Google Images search results for a given query.",
+    _IMAGES,
+    context={"tbm": "isch"},
+)
+register(
+    source.GOOGLE_TRENDS_EXPLORE,
+    "serp",
+    ("query", "geo_location", "user_agent_type", "callback_url", "context"),
+    "scrape_trends_explore",
+    "Scrapes Google Trends Explore results for a given query.",
+)
+
+register(
+    source.BING_SEARCH,
+    "serp",
+    (
+        "query",
+        "domain",
+        "start_page",
+        "pages",
+        "limit",
+        "user_agent_type",
+        "callback_url",
+        "locale",
+        "geo_location",
+        "render",
+        "parse",
+        "parsing_instructions",
+    ),
+    "scrape_search",
+    "Scrapes search results from Bing.",
+)
+register(
+    source.BING_URL,
+    "serp",
+    (
+        "url",
+        "user_agent_type",
+        "geo_location",
+        "callback_url",
+        "render",
+        "parse",
+        "parsing_instructions",
+    ),
+    "scrape_url",
+    "Scrapes Bing search results for a given URL.",
+)
+
+# Sources without scrape methods, available to `client.scrape`.
+register(
+    source.YANDEX_SEARCH,
+    "serp",
+    (
+        "query",
+        "domain",
+        "start_page",
+        "pages",
+        "limit",
+        "locale",
+        "geo_location",
+        "user_agent_type",
+        "callback_url",
+    ),
+)
+register(source.YANDEX_URL, "serp", ("url", "user_agent_type", "callback_url"))
+register(
+    source.BAIDU_SEARCH,
+    "serp",
+    (
+        "query",
+        "domain",
+        "start_page",
+        "pages",
+        "limit",
+        "user_agent_type",
+        "callback_url",
+    ),
+)
+register(source.BAIDU_URL, "serp", ("url", "user_agent_type", "callback_url"))
+
+_AMAZON_RESPONSE = "oxylabs.sources.ecommerce.amazon.response"
+_AMAZON = (
+    "query",
+    "domain",
+    "start_page",
+    "pages",
+    "geo_location",
+    "user_agent_type",
+    "render",
+    "callback_url",
+    "parse",
+    "parsing_instructions",
+)
+
+register(
+    source.AMAZON_SEARCH,
+    "ecommerce",
+    (
+        "query",
+        "domain",
+        "start_page",
+        "pages",
+        "geo_location",
+        "user_agent_type",
+        "render",
+        "callback_url",
+        "context",
+        "parse",
+        "parsing_instructions",
+    ),
+    "scrape_search",
+    "Scrapes Amazon search results for a given query.",
+)
+register(
+    source.AMAZON_URL,
+    "ecommerce",
+    (
+        "url",
+        "user_agent_type",
+        "render",
+        "callback_url",
+        "parse",
+        "parsing_instructions",
+    ),
+    "scrape_url",
+    "Scrapes Amazon search results for a given URL.",
+)
+register(
+    source.AMAZON_PRODUCT,
+    "ecommerce",
+    (
+        "query",
+        "domain",
+        "geo_location",
+        "user_agent_type",
+        "render",
+        "callback_url",
+        "context",
+        "parse",
+        "parsing_instructions",
+    ),
+    "scrape_product",
+    "Scrapes Amazon product details for a given query.",
+    model=f"{_AMAZON_RESPONSE}.AmazonProductResponse",
+)
+register(
+    source.AMAZON_PRICING,
+    "ecommerce",
+    _AMAZON,
+    "scrape_pricing",
+    "Scrapes Amazon pricing details for a given query.",
+    model=f"{_AMAZON_RESPONSE}.AmazonPricingResponse",
+)
+register(
+    source.AMAZON_REVIEWS,
+    "ecommerce",
+    _AMAZON,
+    "scrape_reviews",
+    "Scrapes Amazon reviews for a given query.",
+    model=f"{_AMAZON_RESPONSE}.AmazonReviewsResponse",
+)
+register(
+    source.AMAZON_QUESTIONS,
+    "ecommerce",
+    _AMAZON[:2] + _AMAZON[4:],
+    "scrape_questions",
+    "Scrapes Amazon questions for a given query.",
+)
+register(
+    source.AMAZON_BEST_SELLERS,
+    "ecommerce",
+    _AMAZON,
+    "scrape_bestsellers",
+    "Scrapes Amazon bestsellers.",
+)
+register(
+    source.AMAZON_SELLERS,
+    "ecommerce",
+    _AMAZON[:2] + _AMAZON[4:],
+    "scrape_sellers",
+    "Scrapes Amazon sellers for a given query.",
+)
+
+register(
+    source.GOOGLE_SHOPPING_SEARCH,
+    "ecommerce",
+    (
+        "query",
+        "domain",
+        "start_page",
+        "pages",
+        "locale",
+        "results_language",
+        "geo_location",
+        "user_agent_type",
+        "callback_url",
+        "render",
+        "parse",
+        "context",
+        "parsing_instructions",
+    ),
+    "scrape_shopping_search",
+    "Scrapes Google Shopping search results for a given query.",
+)
+register(
+    source.GOOGLE_SHOPPING_URL,
+    "ecommerce",
+    (
+        "url",
+        "user_agent_type",
+        "render",
+        "callback_url",
+        "geo_location",
+        "parse",
+        "parsing_instructions",
+    ),
+    "scrape_shopping_url",
+    "Scrapes Google Shopping search results for a given URL.",
+)
+register(
+    source.GOOGLE_SHOPPING_PRODUCT,
+    "ecommerce",
+    (
+        "query",
+        "domain",
+        "locale",
+        "results_language",
+        "geo_location",
+        "user_agent_type",
+        "render",
+        "callback_url",
+        "parse",
+        "parsing_instructions",
+    ),
+    "scrape_shopping_products",
+    "Scrapes Google Shopping product results for a given query.",
+)
+register(
+    source.GOOGLE_SHOPPING_PRICING,
+    "ecommerce",
+    (
+        "query",
+        "domain",
+        "start_page",
+        "pages",
+        "locale",
+        "results_language",
+        "geo_location",
+        "user_agent_type",
+        "render",
+        "callback_url",
+        "parse",
+        "parsing_instructions",
+    ),
+    "scrape_product_pricing",
+    "Scrapes Google Shopping product pricing results for a given product "
+    "code.",
+)
+
+register(
+    source.WAYFAIR_SEARCH,
+    "ecommerce",
+    (
+        "query",
+        "start_page",
+        "pages",
+        "limit",
+        "user_agent_type",
+        "callback_url",
+    ),
+    "scrape_search",
+    "Scrapes Wayfair search results for a given query.",
+)
+register(
+    source.WAYFAIR,
+    "ecommerce",
+    ("url", "user_agent_type", "callback_url"),
+    "scrape_url",
+    "Scrapes Wayfair search results for a given URL.",
+)
+
+# The universal source keeps a hand-written method, as it routes URLs to
+# the dedicated sources.
+register(
+    source.UNIVERSAL,
+    "ecommerce",
+    (
+        "url",
+        "user_agent_type",
+        "geo_location",
+        "locale",
+        "render",
+        "content_encoding",
+        "context",
+        "callback_url",
+        "parse",
+        "parser_type",
+        "parsing_instructions",
+    ),
+)
@@ -0,0 +1,134 @@
+from oxylabs.utils import serialization
+from oxylabs.utils.schema import Field, Model
+
+
+class Response(Model):
+    """
+    Base class of top-level responses, which can be serialized to bytes to
+    be cached or passed between processes.
+    """
+
+    job = Field("Job")
+
+    def to_bytes(self, compress: bool = False) -> bytes:
+        """
+        Serializes the raw response data.
+
+        Args:
+            compress (bool): Whether to compress the data with zstd.
+            Defaults to False.
+
+        Returns:
+            bytes: The serialized response.
+        """
+        return serialization.dumps(self.raw, compress=compress)
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "Response":
+        """
+        Builds a response from data serialized with `to_bytes`.
+
+        Args:
+            blob (bytes): The serialized response.
+
+        Returns:
+            Response: The response.
+        """
+        return cls(serialization.loads(blob))
+
+    def to_shared_memory(
+        self, compress: bool = False
+    ) -> serialization.SharedBlob:
+        """
+        Serializes the response into a shared memory block, so it can be
+        handed to another process without pickling the model.
+
+        Args:
+            compress (bool): Whether to compress the data with zstd.
+            Defaults to False.
+
+        Returns:
+            SharedBlob: The handle to pass to `from_shared_memory`.
+        """
+        return serialization.to_shared_memory(self.to_bytes(compress))
+
+    @classmethod
+    def from_shared_memory(
+        cls, handle: serialization.SharedBlob, unlink: bool = True
+    ) -> "Response":
+        """
+        Builds a response from a shared memory block.
+
+        Args:
+            handle (SharedBlob): The handle returned by `to_shared_memory`.
+            unlink (bool): Whether to free the block after reading.
+            Defaults to True.
+
+        Returns:
+            Response: The response.
+        """
+        return cls.from_bytes(
+            serialization.from_shared_memory(handle, unlink=unlink)
+        )
+
+
+class Expanded(Model):
+    url = Field(str)
+    desc = Field(str)
+    title = Field(str)
+
+
+class Inline(Model):
+    url = Field(str)
+    desc = Field(str)
+    title = Field(str)
+
+
+class Sitelinks(Model):
+    expanded = Field([Expanded])
+    inline = Field([Inline])
+
+
+class Job(Model):
+    callback_url = Field(str)
+    client_id = Field(int)
+    context = Field(["Context"])
+    created_at = Field(str)
+    domain = Field(str, intern=True)
+    geo_location = Field(str, intern=True)
+    id = Field(str)
+    limit = Field(int)
+    locale = Field(str, intern=True)
+    pages = Field(int)
+    missing_pages = Field([int])
+    parse = Field(bool)
+    parser_type = Field(str, intern=True)
+    parsing_instructions = Field()
+    browser_instructions = Field()
+    render = Field(str, intern=True)
+    url = Field(str)
+    query = Field(str)
+    source = Field(str, intern=True)
+    start_page = Field(int)
+    status = Field(str, intern=True)
+    storage_type = Field(str, intern=True)
+    storage_url = Field(str)
+    subdomain = Field(str, intern=True)
+    content_encoding = Field(str, intern=True)
+    updated_at = Field(str)
+    user_agent_type = Field(str, intern=True)
+    session_info = Field()
+    statuses = Field()
+    client_notes = Field()
+    links = Field(["JobLink"], key="_links")
+
+
+class Context(Model):
+    key = Field(str, intern=True)
+    value = Field()
+
+
+class JobLink(Model):
+    rel = Field(str, intern=True)
+    href = Field(str)
+    method = Field(str, intern=True)
@@ -0,0 +1,118 @@
+import re
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple
+from urllib.parse import parse_qs, urlsplit
+
+from oxylabs.sources import registry
+from oxylabs.utils.hosts import dedicated_source
+from oxylabs.utils.types import source
+
+# The parameters each dedicated source accepts besides those the router
+# extracts from the URL.
+ACCEPTED_PARAMS: Dict[str, FrozenSet[str]] = {
+    name: frozenset(registry.get(name).params) - {"url", "query", "domain"}
+    for name in (
+        source.AMAZON_URL,
+        source.AMAZON_PRODUCT,
+        source.BING_URL,
+        source.GOOGLE_SHOPPING_URL,
+        source.GOOGLE_SHOPPING_PRODUCT,
+        source.WAYFAIR,
+    )
+}
+
+_ASIN = re.compile(
+    r"/(?:dp|gp/product|gp/aw/d)/([A-Z0-9]{10})(?:[/?]|$)", re.IGNORECASE
+)
+_SHOPPING_PRODUCT = re.compile(r"^/shopping/product/(\d+)")
+
+
+class Route(NamedTuple):
+    """
+    The source a URL is scraped with and the parameters extracted from it,
+    e.g. ("amazon_product", {"query": "B07FZ8S74R", "domain": "de"}).
+    """
+
+    source: str
+    params: Dict[str, Any]
+
+
+def _match(url: str) -> Route:
+    """
+    Returns the dedicated route of a URL, or the universal source.
+    """
+    parts = urlsplit(url)
+    host = dedicated_source(parts.hostname or "")
+    if host is None:
+        return Route(source.UNIVERSAL, {"url": url})
+
+    if host.source == source.AMAZON_URL:
+        asin = _ASIN.search(parts.path)
+        if asin:
+            return Route(
+                source.AMAZON_PRODUCT,
+                {"query": asin.group(1).upper(), "domain": host.domain},
+            )
+        return Route(source.AMAZON_URL, {"url": url})
+
+    if host.source == source.GOOGLE_URL:
+        product = _SHOPPING_PRODUCT.match(parts.path)
+        if product:
+            return Route(
+                source.GOOGLE_SHOPPING_PRODUCT,
+                {"query": product.group(1), "domain": host.domain},
+            )
+        if (
+            parts.hostname.startswith("shopping.")
+            or parts.path.startswith("/shopping")
+            or "shop" in parse_qs(parts.query).get("tbm", ())
+        ):
+            return Route(source.GOOGLE_SHOPPING_URL, {"url": url})
+        # Other Google pages are only served by SERP sources.
+        return Route(source.UNIVERSAL, {"url": url})
+
+    if host.source == source.BING_URL:
+        return Route(source.BING_URL, {"url": url})
+    return Route(source.WAYFAIR, {"url": url})
+
+
+def route_url(url: str, **params) -> Route:
+    """
+    Finds the dedicated source that scrapes a URL faster and parses it
+    better than the universal source, e.g. `amazon_product` with the ASIN
+    and domain of an Amazon product page.
+
+    A URL is only routed when the dedicated source accepts every parameter
+    given, otherwise it stays with the universal source.
+
+    Args:
+        url (str): The URL to scrape.
+        **params: The query parameters the URL is scraped with. Parameters
+        set to None are ignored.
+
+    Returns:
+        Route: The source and the parameters extracted from the URL.
+    """
+    return route_urls([url], **params)[0]
+
+
+def route_urls(urls: Iterable[str], **params) -> List[Route]:
+    """
+    Routes many URLs scraped with the same parameters, as in `route_url`.
+
+    Args:
+        urls (Iterable[str]): The URLs to scrape.
+        **params: The query parameters the URLs are scraped with.
+
+    Returns:
+        List[Route]: The routes in the order of the URLs.
+    """
+    given = frozenset(k for k, v in params.items() if v is not None)
+    routes = []
+    for url in urls:
+        route = _match(url)
+        if route.source != source.UNIVERSAL and not (
+            given <= ACCEPTED_PARAMS[route.source]
+        ):
+            route = Route(source.UNIVERSAL, {"url": url})
+        routes.append(route)
+    return routes
@@ -0,0 +1,23 @@
+from oxylabs.sources.serp.response import (
+    Content,
+    Result,
+    Results,
+    SERPResponse,
+)
+from oxylabs.utils.schema import Field
+
+
+class GoogleSearchResponse(SERPResponse):
+    results = Field(["GoogleSearchResults"])
+
+
+class GoogleSearchResults(Results):
+    content_parsed = Field("GoogleSearch")
+
+
+class GoogleSearch(Content):
+    results = Field("GoogleSearchResult")
+
+
+class GoogleSearchResult(Result):
+    pass
@@ -1,14 +1,17 @@
-import logging
+import time
+from typing import AsyncIterator, Iterator, Optional
 
 import oxylabs.utils.utils as utils
+from oxylabs.sources import registry
+from oxylabs.sources.template import Payload
+from oxylabs.utils.intern import interning
+from oxylabs.utils.log import get_logger
 
 from .bing.bing import Bing, BingAsync
 from .google.google import Google, GoogleAsync
-from .response import SERPResponse
+from .response import Results, SERPResponse
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 
 class SERP:
@@ -29,10 +32,60 @@ class SERP:
         Returns:
             dict: The response from the server after the job is completed.
         """
-        # Remove empty or null values from the payload
-        payload = {k: v for k, v in payload.items() if v is not None}
+        # Remove empty or null values from the payload, which payloads
+        # stamped from a template are already without.
+        if not isinstance(payload, Payload):
+            payload = {k: v for k, v in payload.items() if v is not None}
+
+        source = payload.get("source", "")
+        hooks = self._client._hooks
+        span = hooks.begin(
+            "oxylabs.realtime",
+            **{"oxylabs.integration": "realtime", "oxylabs.source": source},
+        )
+        try:
+            if config.get("parallel_pages"):
+                result = self._client._req_pages(payload, config)
+            else:
+                result = self._client._req(payload, "POST", config)
+            started = time.perf_counter()
+            model = registry.response_model(source, SERPResponse)
+            with interning(self._client._intern_pool):
+                response = model(result)
+            self._client._observe_model(source, started)
+            return response
+        finally:
+            hooks.end(span)
+
+    def iter_results(
+        self, source: str, request_timeout: Optional[int] = None, **params
+    ) -> Iterator[Results]:
+        """
+        Scrapes the given source and yields its result pages one at a time
+        while the response body is being downloaded. Useful for multi-page
+        jobs, as only one page is held in memory at a time.
+
+        Args:
+            source (str): The source to scrape, e.g. "google_search".
+            request_timeout (Optional[int]): The interval in seconds for
+            the request to time out if no response is returned.
+            **params: The query parameters of the source.
 
-        return SERPResponse(self._client._req(payload, "POST", config))
+        Yields:
+            Results: One result page at a time.
+        """
+        config = utils.prepare_config(request_timeout=request_timeout)
+        utils.check_parsing_instructions_validity(
+            params.get("parsing_instructions")
+        )
+        payload = {k: v for k, v in params.items() if v is not None}
+        payload["source"] = source
+
+        results = self._client._req(payload, "POST", config, stream=True)
+        for item in results or ():
+            with interning(self._client._intern_pool):
+                page = Results(item)
+            yield page
 
 
 class SERPAsync:
@@ -55,25 +108,96 @@ class SERPAsync:
         Returns:
             dict: The response from the server after the job is completed.
         """
-        # Remove empty or null values from the payload
-        payload = {k: v for k, v in payload.items() if v is not None}
+        # Remove empty or null values from the payload, which payloads
+        # stamped from a template are already without.
+        if not isinstance(payload, Payload):
+            payload = {k: v for k, v in payload.items() if v is not None}
 
         result: dict = None
         self._requests += 1
+        source = payload.get("source", "")
+        hooks = self._client._hooks
+        span = hooks.begin(
+            "oxylabs.push_pull",
+            **{"oxylabs.integration": "push_pull", "oxylabs.source": source},
+        )
+        error = None
 
         try:
             self._session = await utils.ensure_session(self._session)
 
-            result = await self._client._execute_with_timeout(
-                payload, config, self._session
+            execute = (
+                self._client._execute_pages
+                if config.get("parallel_pages")
+                else self._client._execute_with_timeout
             )
-            return SERPResponse(result)
+            result = await execute(payload, config, self._session)
+            started = time.perf_counter()
+            model = registry.response_model(source, SERPResponse)
+            with interning(self._client._intern_pool):
+                response = model(result)
+            self._client._observe_model(source, started)
+            return response
 
         except Exception as e:
-            logger.error(f"An error occurred: {e}")
+            error = e
+            logger.error("error", "An error occurred: %s", e, source=source)
 
         finally:
+            hooks.end(span, error)
             self._requests -= 1
             if self._requests == 0:
                 await utils.close(self._session)
         return SERPResponse(None)
+
+    async def iter_results(
+        self,
+        source: str,
+        request_timeout: Optional[int] = None,
+        job_completion_timeout: Optional[int] = None,
+        poll_interval: Optional[int] = None,
+        **params,
+    ) -> AsyncIterator[Results]:
+        """
+        Asynchronously scrapes the given source and yields its result pages
+        one at a time while the results are being downloaded. Useful for
+        multi-page jobs, as only one page is held in memory at a time.
+
+        Args:
+            source (str): The source to scrape, e.g. "google_search".
+            request_timeout (Optional[int]): The interval in seconds for
+            the request to time out if no response is returned.
+            job_completion_timeout (Optional[int]): The interval in seconds
+            for the job to time out if no response is returned.
+            poll_interval (Optional[int]): The interval in seconds to poll
+            the server for a response.
+            **params: The query parameters of the source.
+
+        Yields:
+            Results: One result page at a time.
+        """
+        config = utils.prepare_config(
+            request_timeout=request_timeout,
+            poll_interval=poll_interval,
+            job_completion_timeout=job_completion_timeout,
+            async_integration=True,
+        )
+        utils.check_parsing_instructions_validity(
+            params.get("parsing_instructions")
+        )
+        payload = {k: v for k, v in params.items() if v is not None}
+        payload["source"] = source
+
+        self._requests += 1
+        try:
+            self._session = await utils.ensure_session(self._session)
+            async for item in self._client._execute_stream(
+                payload, config, self._session
+            ):
+                with interning(self._client._intern_pool):
+                    page = Results(item)
+                yield page
+        finally:
+            self._requests -= 1
+            if self._requests == 0:
+                await utils.close(self._session)
@@ -0,0 +1,173 @@
+import json
+from typing import Any, Dict, Optional, Union
+
+from oxylabs.sources import registry
+
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+
+class Payload(dict):
+    """
+    The payload of a job stamped from a `PayloadTemplate`, along with its
+    JSON encoding, which the clients send as is.
+    """
+
+    __slots__ = ("body",)
+
+    def __init__(self, payload: Dict[str, Any], body: bytes) -> None:
+        super().__init__(payload)
+        self.body = body
+
+
+def request_body(payload: dict) -> dict:
+    """
+    Returns the keyword arguments sending a payload with requests or
+    aiohttp: its encoding if it was stamped from a template, or the payload
+    to be encoded otherwise.
+    """
+    if isinstance(payload, Payload):
+        return {"data": payload.body}
+    return {"json": payload}
+
+
+def _check_params(spec: registry.Source, params: Dict[str, Any]) -> None:
+    """
+    Checks that a source declares every parameter given, so that typos do
+    not reach the API unnoticed.
+
+    Raises:
+        ValueError: If a parameter is not declared by the source.
+    """
+    for key in params:
+        if key not in spec.params:
+            raise ValueError(f"Unknown parameter of {spec.name}: {key}")
+
+
+class PayloadTemplate:
+    def __init__(
+        self, source: Union[str, registry.Source, None] = None, **params
+    ) -> None:
+        """
+        The parameters shared by many jobs, validated and encoded once, into
+        which the fields of each job are stamped. Useful for batches of jobs
+        that only differ in a few fields, e.g. the query.
+
+        Parameters of registered sources are validated and their defaults
+        and context entries applied as in `client.scrape`, for the shared
+        parameters and the fields of each job alike. The context of a job
+        is merged into that of the template. Parameters set to None are
+        ignored.
+
+        Example:
+            template = PayloadTemplate("google_search", parse=True, pages=2)
+            payload = template.stamp(query="shoes")
+            body = template.encode(query="shoes")
+
+        Args:
+            source (Union[str, registry.Source, None]): The source of the
+            jobs, or the declaration of a source such as
+            `registry.GOOGLE_IMAGES_SEARCH`. Defaults to None for jobs
+            stamping their own source.
+            **params: The query parameters shared by the jobs.
+
+        Raises:
+            ValueError: If a parameter is not declared by a registered
+            source.
+            Exception: If a parameter of a registered source is invalid.
+        """
+        if isinstance(source, registry.Source):
+            self._spec = source
+            source = source.name
+        else:
+            self._spec = registry.SOURCES.get(source)
+        self.source = source
+        if self._spec is not None:
+            _check_params(self._spec, params)
+            common = self._spec.payload(params)
+        else:
+            common = {k: v for k, v in params.items() if v is not None}
+            if source is not None:
+                common = {"source": source, **common}
+        self.common = common
+        # The context entries of the jobs, defaulting to those of the
+        # template.
+        self._context = tuple(
+            (item["key"], item.get("value"))
+            for item in common.get("context") or ()
+            if isinstance(item, dict) and "key" in item
+        )
+        self._keys = frozenset(common)
+        encoded = _dumps(common)
+        self._body = encoded.encode()
+        # The encoding without its closing brace, which the fields of each
+        # job are appended to.
+        self._head = encoded[:-1] + ("," if common else "")
+
+    def _fields(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        fields = {k: v for k, v in fields.items() if v is not None}
+        spec = self._spec
+        if spec is not None and fields.get("source") == spec.name:
+            del fields["source"]
+        if "context" in fields and self._context:
+            fields["context"] = registry.with_context(
+                fields["context"], self._context
+            )
+        if spec is None:
+            spec = registry.SOURCES.get(fields.get("source"))
+            if spec is None:
+                return fields
+            # Jobs stamping their own registered source are built as by
+            # `client.scrape`, along with the shared parameters.
+            params = {**self.common, **fields}
+            del params["source"]
+            _check_params(spec, params)
+            return spec.payload(params)
+
+        _check_params(spec, fields)
+        for key, value in fields.items():
+            validator = spec.validators.get(key)
+            if validator is not None:
+                validator(value)
+        return fields
+
+    def _encode(self, fields: Dict[str, Any]) -> bytes:
+        if not fields:
+            return self._body
+        if self._keys.isdisjoint(fields):
+            return (
+                self._head
+                + ",".join(
+                    f"{_dumps(key)}:{_dumps(value)}"
+                    for key, value in fields.items()
+                )
+                + "}"
+            ).encode()
+        # Fields overriding shared parameters are merged, so the encoding
+        # has no duplicate keys.
+        return _dumps({**self.common, **fields}).encode()
+
+    def stamp(self, **fields) -> Payload:
+        """
+        Returns the payload of a job with the given fields, e.g. its query,
+        along with its encoding.
+
+        Raises:
+            ValueError: If a field is not declared by a registered source.
+            Exception: If a field of a registered source is invalid.
+        """
+        fields = self._fields(fields)
+        return Payload({**self.common, **fields}, self._encode(fields))
+
+    def encode(self, **fields) -> bytes:
+        """
+        Returns the JSON encoding of the payload of a job with the given
+        fields, without building the payload.
+
+        Raises:
+            ValueError: If a field is not declared by a registered source.
+            Exception: If a field of a registered source is invalid.
+        """
+        return self._encode(self._fields(fields))
+
+    def __repr__(self) -> str:
+        return f"PayloadTemplate({self.common!r})"
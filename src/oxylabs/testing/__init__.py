@@ -0,0 +1,7 @@
+from .mock_server import (
+    MockServer,
+    html_fixture,
+    lognormal,
+    search_fixture,
+    uniform,
+)
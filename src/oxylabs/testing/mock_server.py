@@ -0,0 +1,430 @@
+import asyncio
+import itertools
+import math
+import random
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from aiohttp import web
+
+Latency = Union[float, Callable[[], float]]
+Fixture = Callable[[dict], Any]
+
+
+def uniform(low: float, high: float, seed: Optional[int] = None) -> Callable:
+    """
+    Returns a latency distribution uniform between `low` and `high`
+    seconds.
+    """
+    rng = random.Random(seed)
+    return lambda: rng.uniform(low, high)
+
+
+def lognormal(
+    median: float, sigma: float = 0.5, seed: Optional[int] = None
+) -> Callable:
+    """
+    Returns a log-normal latency distribution, whose long tail resembles
+    the latency of real scraping jobs.
+
+    Args:
+        median (float): The median latency in seconds.
+        sigma (float): The standard deviation of the logarithm of the
+        latency. Defaults to 0.5.
+        seed (Optional[int]): The seed of the random generator.
+    """
+    rng = random.Random(seed)
+    mu = math.log(median)
+    return lambda: rng.lognormvariate(mu, sigma)
+
+
+def _sampler(latency: Latency) -> Callable[[], float]:
+    if callable(latency):
+        return latency
+    return lambda: latency
+
+
+def html_fixture(size: int = 50 * 1024) -> Fixture:
+    """
+    Returns a fixture whose content is an HTML page of about `size` bytes.
+    """
+    filler = "<p>" + "x" * 96 + "</p>\n"
+    html = (
+        "<html><body>\n"
+        + filler * max(1, size // len(filler))
+        + "</body></html>"
+    )
+    return lambda payload: html
+
+
+def search_fixture(items: int = 48) -> Fixture:
+    """
+    Returns a fixture whose content is a parsed ecommerce search page with
+    `items` organic results.
+    """
+    organic = [
+        {
+            "pos": i + 1,
+            "url": f"/dp/B{i:09d}",
+            "asin": f"B{i:09d}",
+            "price": round(9.99 + i * 1.5, 2),
+            "title": f"Product {i + 1}",
+            "rating": 4.5,
+            "currency": "USD",
+            "is_prime": i % 2 == 0,
+            "price_upper": round(12.99 + i * 1.5, 2),
+            "reviews_count": 100 + i,
+            "manufacturer": "Acme",
+        }
+        for i in range(items)
+    ]
+
+    def build(payload: dict) -> dict:
+        return {
+            "url": payload.get("url"),
+            "query": payload.get("query"),
+            "results": {"organic": organic, "paid": []},
+            "parse_status_code": 12000,
+        }
+
+    return build
+
+
+class MockServer:
+    def __init__(
+        self,
+        latency: Latency = 0.0,
+        job_duration: Latency = 0.0,
+        errors: Optional[Dict[int, float]] = None,
+        job_fault_rate: float = 0.0,
+        fixture: Optional[Fixture] = None,
+        parsed_fixture: Optional[Fixture] = None,
+        proxy_fixture: Optional[Fixture] = None,
+        record: bool = False,
+        host: str = "127.0.0.1",
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        A local stand-in for the Oxylabs realtime, push-pull and proxy
+        endpoints, to test and benchmark the real I/O paths of the clients
+        without network access.
+
+        The realtime and push-pull APIs are served on one port and the
+        proxy endpoint on another. The proxy endpoint serves http:// URLs
+        only, as https:// URLs would need a TLS interception proxy.
+
+        Example:
+            async with MockServer(latency=lognormal(0.05)) as server:
+                kwargs = server.client_kwargs("push_pull")
+                client = AsyncClient("user", "pass", **kwargs)
+
+        Args:
+            latency (Latency): The latency of realtime and proxy requests in
+            seconds, or a callable sampling it, e.g. `uniform(0.01, 0.1)`
+            or `lognormal(0.05)`. Defaults to 0.
+            job_duration (Latency): The time a push-pull job stays pending
+            after its submission. Defaults to 0.
+            errors (Optional[Dict[int, float]]): The probability of failing
+            a realtime, job submission or proxy request with each HTTP
+            status, e.g. {429: 0.05, 500: 0.01}.
+            job_fault_rate (float): The probability of a push-pull job
+            ending as faulted.
+            fixture (Optional[Fixture]): Builds the content of a result from
+            the job payload. Defaults to an HTML page of 50 KiB.
+            parsed_fixture (Optional[Fixture]): Builds the content of jobs
+            with `parse` set. Defaults to a search page of 48 results.
+            proxy_fixture (Optional[Fixture]): Builds the body of proxy
+            responses from a dict with the requested "url". Defaults to
+            `fixture`, or `parsed_fixture` for requests with the parse
+            header.
+            record (bool): Whether to keep every request in `history`.
+            host (str): The interface to listen on.
+            seed (Optional[int]): The seed of the error injection.
+        """
+        self._latency = _sampler(latency)
+        self._job_duration = _sampler(job_duration)
+        self._errors = sorted((errors or {}).items())
+        self._job_fault_rate = job_fault_rate
+        self._fixture = fixture or html_fixture()
+        self._parsed_fixture = parsed_fixture or search_fixture()
+        self._proxy_fixture = proxy_fixture
+        self._record = record
+        self._host = host
+        self._rng = random.Random(seed)
+        self._ids = itertools.count(7_000_000_000_000_000_000)
+        self._jobs: Dict[str, dict] = {}
+        self._runners: List[web.AppRunner] = []
+        self._ports: Tuple[int, int] = (0, 0)
+        self._thread = None
+        self._loop = None
+        self._stop = None
+        self.counts = Counter()
+        self.history: List[Tuple[str, dict, Any]] = []
+
+    @property
+    def api_url(self) -> str:
+        return f"http://{self._host}:{self._ports[0]}"
+
+    @property
+    def realtime_url(self) -> str:
+        """
+        The base URL of the realtime API.
+        """
+        return f"{self.api_url}/realtime/v1/queries"
+
+    @property
+    def push_pull_url(self) -> str:
+        """
+        The base URL of the push-pull API.
+        """
+        return f"{self.api_url}/v1/queries"
+
+    @property
+    def proxy_endpoint(self) -> str:
+        """
+        The "host:port" of the proxy endpoint.
+        """
+        return f"{self._host}:{self._ports[1]}"
+
+    def client_kwargs(self, kind: str = "push_pull") -> dict:
+        """
+        Returns the keyword arguments pointing a client at the server: for
+        "realtime", "push_pull" or "proxy" clients.
+        """
+        if kind == "proxy":
+            return {"endpoint": self.proxy_endpoint}
+        if kind == "realtime":
+            return {"base_url": self.realtime_url}
+        return {"base_url": self.push_pull_url}
+
+    async def start(self) -> "MockServer":
+        """
+        Starts listening on two free ports.
+        """
+        api = web.Application(client_max_size=64 * 1024**2)
+        api.router.add_post("/realtime/v1/queries", self._realtime)
+        api.router.add_post("/v1/queries", self._submit)
+        api.router.add_post("/v1/queries/batch", self._batch)
+        api.router.add_get("/v1/queries/{id}", self._status)
+        api.router.add_get("/v1/queries/{id}/results", self._results)
+        proxy = web.Application()
+        proxy.router.add_route("*", "/{tail:.*}", self._proxy)
+
+        ports = []
+        for app in (api, proxy):
+            runner = web.AppRunner(app, access_log=None)
+            await runner.setup()
+            site = web.TCPSite(runner, self._host, 0, backlog=1024)
+            await site.start()
+            self._runners.append(runner)
+            ports.append(site._server.sockets[0].getsockname()[1])
+        self._ports = tuple(ports)
+        return self
+
+    async def close(self) -> None:
+        for runner in self._runners:
+            await runner.cleanup()
+        self._runners = []
+
+    async def __aenter__(self) -> "MockServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def start_thread(self) -> "MockServer":
+        """
+        Starts the server on an event loop of its own in a daemon thread,
+        for use with synchronous clients.
+        """
+        started = threading.Event()
+
+        async def serve() -> None:
+            self._loop = asyncio.get_running_loop()
+            self._stop = asyncio.Event()
+            await self.start()
+            started.set()
+            await self._stop.wait()
+            await self.close()
+
+        self._thread = threading.Thread(
+            target=asyncio.run, args=(serve(),), daemon=True
+        )
+        self._thread.start()
+        started.wait()
+        return self
+
+    def stop_thread(self) -> None:
+        self._loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "MockServer":
+        return self.start_thread()
+
+    def __exit__(self, *exc) -> None:
+        self.stop_thread()
+
+    def _log(self, endpoint: str, request: web.Request, payload: Any) -> None:
+        self.counts[endpoint] += 1
+        if self._record:
+            self.history.append((endpoint, dict(request.headers), payload))
+
+    def _error(self) -> Optional[web.Response]:
+        """
+        Returns an injected error response, if one is drawn.
+        """
+        draw = self._rng.random()
+        for status, probability in self._errors:
+            if draw < probability:
+                self.counts[status] += 1
+                return web.json_response(
+                    {"message": f"Injected error {status}"}, status=status
+                )
+            draw -= probability
+        return None
+
+    def _job(self, payload: dict) -> dict:
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        job_id = str(next(self._ids))
+        return {
+            "id": job_id,
+            "status": "pending",
+            "created_at": now,
+            "updated_at": now,
+            "client_id": 1,
+            "_links": [
+                {
+                    "rel": "self",
+                    "href": f"{self.push_pull_url}/{job_id}",
+                    "method": "GET",
+                },
+                {
+                    "rel": "results",
+                    "href": f"{self.push_pull_url}/{job_id}/results",
+                    "method": "GET",
+                },
+            ],
+            **payload,
+        }
+
+    def _result_body(self, job: dict) -> dict:
+        fixture = self._parsed_fixture if job.get("parse") else self._fixture
+        url = job.get("url") or ""
+        results = [
+            {
+                "content": fixture(job),
+                "page": page,
+                "url": url,
+                "job_id": job["id"],
+                "status_code": 200,
+                "created_at": job["created_at"],
+                "updated_at": job["updated_at"],
+                "parser_type": job.get("parser_type", ""),
+            }
+            for page in range(
+                job.get("start_page", 1),
+                job.get("start_page", 1) + int(job.get("pages", 1)),
+            )
+        ]
+        return {"results": results, "job": {**job, "status": "done"}}
+
+    async def _realtime(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self._log("realtime", request, payload)
+        await asyncio.sleep(self._latency())
+        error = self._error()
+        if error is not None:
+            return error
+        return web.json_response(self._result_body(self._job(payload)))
+
+    def _submit_job(self, payload: dict) -> dict:
+        job = self._job(payload)
+        loop = asyncio.get_running_loop()
+        job["_done_at"] = loop.time() + self._job_duration()
+        job["_faulted"] = self._rng.random() < self._job_fault_rate
+        self._jobs[job["id"]] = job
+        return job
+
+    def _state(self, job: dict) -> str:
+        if asyncio.get_running_loop().time() < job["_done_at"]:
+            return "pending"
+        return "faulted" if job["_faulted"] else "done"
+
+    async def _submit(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self._log("submit", request, payload)
+        error = self._error()
+        if error is not None:
+            return error
+        job = self._submit_job(payload)
+        return web.json_response(self._view(job))
+
+    async def _batch(self, request: web.Request) -> web.Response:
+        """
+        Submits one job per URL or query of a batch, sharing the other
+        parameters.
+        """
+        payload = await request.json()
+        self._log("batch", request, payload)
+        error = self._error()
+        if error is not None:
+            return error
+        key = "url" if "url" in payload else "query"
+        values = payload.get(key)
+        if not isinstance(values, list):
+            return web.json_response(
+                {"message": f"{key} must be a list"}, status=400
+            )
+        common = {k: v for k, v in payload.items() if k != key}
+        jobs = [self._submit_job({**common, key: v}) for v in values]
+        return web.json_response({"queries": [self._view(j) for j in jobs]})
+
+    def _view(self, job: dict) -> dict:
+        view = {k: v for k, v in job.items() if not k.startswith("_")}
+        view["_links"] = job["_links"]
+        view["status"] = self._state(job)
+        return view
+
+    async def _status(self, request: web.Request) -> web.Response:
+        self._log("status", request, None)
+        job = self._jobs.get(request.match_info["id"])
+        if job is None:
+            return web.json_response({"message": "Job not found"}, status=404)
+        return web.json_response(self._view(job))
+
+    async def _results(self, request: web.Request) -> web.Response:
+        self._log("results", request, None)
+        job = self._jobs.get(request.match_info["id"])
+        if job is None:
+            return web.json_response({"message": "Job not found"}, status=404)
+        state = self._state(job)
+        if state != "done":
+            return web.json_response(
+                {"message": f"Job is {state}"}, status=400
+            )
+        body = self._result_body(
+            {k: v for k, v in job.items() if not k.startswith("_")}
+        )
+        return web.json_response(body)
+
+    async def _proxy(self, request: web.Request) -> web.StreamResponse:
+        self._log("proxy", request, None)
+        if request.method == "CONNECT":
+            return web.Response(status=405, text="https:// is not supported")
+        if "Proxy-Authorization" not in request.headers:
+            return web.Response(status=407)
+        await asyncio.sleep(self._latency())
+        error = self._error()
+        if error is not None:
+            return error
+        fixture = self._proxy_fixture
+        if fixture is None:
+            parse = request.headers.get("x-oxylabs-parse") == "1"
+            fixture = self._parsed_fixture if parse else self._fixture
+        body = fixture({"url": str(request.url)})
+        if isinstance(body, (dict, list)):
+            return web.json_response(body)
+        return web.Response(text=body, content_type="text/html")
@@ -0,0 +1,96 @@
+from typing import Callable, Iterable, List, Union
+
+from oxylabs.sources.template import PayloadTemplate
+
+from .defaults import DEFAULT_REQUEST_TIMEOUT, REALTIME_MAX_WORKERS
+from .utils import prepare_config
+
+
+def _dispatcher_of(source):
+    """
+    Returns the SERP or Ecommerce instance of a source, e.g. of
+    `client.serp.google`.
+    """
+    dispatcher = getattr(source, "_serp_instance", None)
+    if dispatcher is None:
+        dispatcher = source._ecommerce_instance
+    return dispatcher
+
+
+def many(method: Callable) -> Callable:
+    """
+    Returns the batch variant of a scrape method of a realtime source, which
+    calls it for many queries or URLs in the thread pool of
+    `RealtimeClient.map`.
+
+    Example:
+        class Google:
+            def scrape_search(self, query, ...): ...
+
+            scrape_search_many = many(scrape_search)
+    """
+
+    spec = getattr(method, "_spec", None)
+
+    def scrape_many(
+        self,
+        items: Iterable[Union[str, dict]],
+        max_workers: int = REALTIME_MAX_WORKERS,
+        **common,
+    ) -> List:
+        dispatcher = _dispatcher_of(self)
+
+        def call(item):
+            if isinstance(item, dict):
+                return method(self, **{**common, **item})
+            return method(self, item, **common)
+
+        if spec is not None:
+            # Generated methods build their payloads from the registry, so
+            # the parameters shared by the items are validated and encoded
+            # once, and each item only stamps in its own. Items passing
+            # other keyword arguments, such as timeouts, are called as is.
+            shared = dict(common)
+            config = prepare_config(
+                request_timeout=shared.pop(
+                    "request_timeout", DEFAULT_REQUEST_TIMEOUT
+                )
+            )
+            config["parallel_pages"] = shared.pop("parallel_pages", False)
+            declared = frozenset(spec.params)
+            if declared.issuperset(shared):
+                template = PayloadTemplate(spec, **shared)
+                first = spec.params[0]
+                fallback = call
+
+                def call(item):
+                    if not isinstance(item, dict):
+                        item = {first: item}
+                    elif not declared.issuperset(item):
+                        return fallback(item)
+                    return dispatcher._get_resp(template.stamp(**item), config)
+
+        results = dispatcher._client._iter_calls(
+            items, call, max_workers, ordered=True
+        )
+        return [response for _, response in results]
+
+    scrape_many.__name__ = f"{method.__name__}_many"
+    scrape_many.__qualname__ = f"{method.__qualname__}_many"
+    scrape_many.__doc__ = f"""
+        Calls `{method.__name__}` for many queries or URLs in parallel
+        threads sharing the pooled session of the client, within its
+        `max_concurrency`.
+
+        Args:
+            items (Iterable[Union[str, dict]]): The first argument of each
+            call, e.g. the query or URL, or a dict of its keyword arguments.
+            max_workers (int): The maximum number of parallel calls.
+            Defaults to 8.
+            **common: Keyword arguments of every call.
+
+        Returns:
+            list: The responses in the order of the items. Use
+            `RealtimeClient.iter_map` to get them as they complete.
+        """
+    return scrape_many
@@ -10,3 +10,20 @@ DEFAULT_REQUEST_TIMEOUT = 165
 DEFAULT_POLL_INTERVAL = 5
 DEFAULT_REQUEST_TIMEOUT_ASYNC = 105
 DEFAULT_JOB_COMPLETION_TIMEOUT = 50
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+PROXY_POOL_SIZE = 32
+PROXY_MAX_WORKERS = 8
+PROXY_MAX_PROFILES = 64
+
+REALTIME_MAX_CONCURRENCY = 32
+REALTIME_MAX_WORKERS = 8
+
+LOG_MAX_BODY = 1024
+LOG_BURST = 10
+LOG_INTERVAL = 60.0
+
+BULK_CONCURRENCY = 100
+BULK_PARQUET_ROWS = 1000
+BULK_FLUSH_INTERVAL = 1.0
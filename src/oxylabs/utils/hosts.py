@@ -0,0 +1,93 @@
+from functools import lru_cache
+from typing import Dict, Iterable, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from oxylabs.utils.defaults import NON_UNIVERSAL_DOMAINS
+from oxylabs.utils.types import domain as domains
+
+_VALUE = ""  # No host label is empty, so the key can't clash with one.
+
+
+class HostMatch(NamedTuple):
+    """
+    The dedicated source family of a host and the domain it was scraped
+    from, e.g. ("amazon", "co.uk") for www.amazon.co.uk.
+    """
+
+    source: str
+    domain: str
+
+
+class HostIndex:
+    """
+    Maps host suffixes such as "amazon.co.uk" to values with a trie of
+    reversed labels, so a host is matched in as many steps as it has labels
+    regardless of the number of suffixes.
+
+    The longest registered suffix of a host wins, and any subdomain of a
+    registered suffix matches it.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        self._root: Dict[str, dict] = {}
+
+    def add(self, suffix: str, value: HostMatch) -> None:
+        node = self._root
+        for label in reversed(suffix.lower().split(".")):
+            node = node.setdefault(label, {})
+        node[_VALUE] = value
+
+    def match(self, host: str) -> Optional[HostMatch]:
+        """
+        Returns the value of the longest registered suffix of `host`, or
+        None if none matches.
+        """
+        node, found = self._root, None
+        for label in reversed(host.lower().rstrip(".").split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            found = node.get(_VALUE, found)
+        return found
+
+
+def build_index(
+    sources: Iterable[str], top_level_domains: Iterable[str]
+) -> HostIndex:
+    """
+    Builds an index of the hosts of each source family under each of the
+    top-level domains, e.g. "amazon.de" for ("amazon", "de").
+    """
+    index = HostIndex()
+    top_level_domains = set(top_level_domains)
+    for source in sources:
+        for tld in top_level_domains:
+            index.add(f"{source}.{tld}", HostMatch(source, tld))
+    return index
+
+
+DEDICATED_HOSTS = build_index(
+    sorted(NON_UNIVERSAL_DOMAINS),
+    (v for k, v in vars(domains).items() if k.isupper()),
+)
+
+
+@lru_cache(maxsize=4096)
+def dedicated_source(host: str) -> Optional[HostMatch]:
+    """
+    Returns the dedicated source family of a host, or None if it is only
+    served by the universal source. Lookups are memoized per host.
+    """
+    return DEDICATED_HOSTS.match(host)
+
+
+def classify_url(url: Optional[str]) -> Optional[HostMatch]:
+    """
+    Returns the dedicated source family of the host of a URL, or None if
+    it is only served by the universal source.
+    """
+    if not url:
+        return None
+    return dedicated_source(urlsplit(url).hostname or "")
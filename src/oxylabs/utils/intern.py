@@ -0,0 +1,100 @@
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import Any, Optional
+
+_current: ContextVar[Optional["InternPool"]] = ContextVar(
+    "oxylabs_intern_pool", default=None
+)
+# The pools active before each pool entered in the current context, so that
+# threads and tasks sharing a pool each restore their own.
+_previous: ContextVar[tuple] = ContextVar(
+    "oxylabs_intern_pool_previous", default=()
+)
+
+
+class InternPool:
+    """
+    Deduplicates strings that repeat across many responses, such as
+    currencies, merchant names and job metadata.
+
+    While a pool is active, the fields of response models declared with
+    `intern=True` are replaced by the first equal string the pool has seen,
+    both on the model and in its `raw` data, so the duplicates can be freed.
+    Pools are activated as context managers, or per client with the
+    `intern_pool` argument.
+
+    Example:
+        pool = InternPool()
+        with pool:
+            responses = [EcommerceResponse(data) for data in batch]
+    """
+
+    __slots__ = ("_strings",)
+
+    def __init__(self) -> None:
+        self._strings = {}
+
+    def __enter__(self) -> "InternPool":
+        _previous.set(_previous.get() + (_current.get(),))
+        _current.set(self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        previous = _previous.get()
+        _current.set(previous[-1])
+        _previous.set(previous[:-1])
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def intern(self, value: str) -> str:
+        """
+        Returns the pooled string equal to `value`, adding it to the pool if
+        it is new.
+        """
+        return self._strings.setdefault(value, value)
+
+    def intern_tree(self, value: Any) -> Any:
+        """
+        Interns the strings nested in lists and dicts in place and returns
+        the value.
+        """
+        strings = self._strings
+        if isinstance(value, list):
+            for i, item in enumerate(value):
+                if item.__class__ is str:
+                    value[i] = strings.setdefault(item, item)
+                elif isinstance(item, (list, dict)):
+                    self.intern_tree(item)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                if item.__class__ is str:
+                    value[key] = strings.setdefault(item, item)
+                elif isinstance(item, (list, dict)):
+                    self.intern_tree(item)
+        elif value.__class__ is str:
+            return strings.setdefault(value, value)
+        return value
+
+    def clear(self) -> None:
+        """
+        Empties the pool. Strings already shared by models stay shared.
+        """
+        self._strings.clear()
+
+
+def current_pool() -> Optional[InternPool]:
+    """
+    Returns the active intern pool, if any.
+    """
+    return _current.get()
+
+
+def interning(pool: Optional[InternPool]) -> Any:
+    """
+    Returns a context manager activating `pool`, or doing nothing when no
+    pool is given.
+    """
+    if pool is None:
+        return nullcontext()
+    return pool
@@ -0,0 +1,86 @@
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Dict, List
+
+
+class LazyModule:
+    """
+    Stands in for a module that is imported on first attribute access, so
+    that importing the SDK does not pay for HTTP libraries it may never
+    use.
+
+    Attributes are looked up on the real module on every access, so patches
+    applied to it, e.g. by `unittest.mock.patch`, are seen.
+
+    Example:
+        requests = lazy_import("requests")
+        ...
+        requests.post(url)  # Imports requests here.
+    """
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module = None
+
+    def _load(self) -> ModuleType:
+        # The import system serializes concurrent imports of a module, so
+        # threads racing here get the same module.
+        self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._module or self._load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in LazyModule.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._module or self._load(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._module or self._load(), name)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._module or self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> Any:
+    """
+    Returns the module if it is already imported, or a `LazyModule`
+    importing it on first use.
+    """
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
+
+
+def lazy_attributes(
+    package: str, attributes: Dict[str, str], namespace: Dict[str, Any]
+):
+    """
+    Returns a module `__getattr__` importing the attributes of a package
+    from their modules on first access and caching them in its namespace.
+
+    Args:
+        package (str): The name of the package, for error messages.
+        attributes (Dict[str, str]): The module of each attribute.
+        namespace (Dict[str, Any]): The globals of the package.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = attributes.get(name)
+        if module is None:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            )
+        value = getattr(importlib.import_module(module), name)
+        namespace[name] = value
+        return value
+
+    return __getattr__
@@ -0,0 +1,141 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Union
+
+from .defaults import LOG_BURST, LOG_INTERVAL, LOG_MAX_BODY
+
+
+class Body:
+    """
+    A response body in a log message, decoded and truncated only if the
+    message is formatted.
+    """
+
+    __slots__ = ("_body", "_limit")
+
+    def __init__(
+        self, body: Union[str, bytes, None], limit: int = LOG_MAX_BODY
+    ) -> None:
+        self._body = body
+        self._limit = limit
+
+    def __str__(self) -> str:
+        body = self._body
+        if not body:
+            return "<empty>"
+        head = body[: self._limit]
+        if isinstance(head, bytes):
+            head = head.decode("utf-8", "replace")
+        if len(body) <= self._limit:
+            return head
+        return f"{head}... ({len(body)} bytes, truncated)"
+
+    __repr__ = __str__
+
+
+class _Fields:
+    """
+    Formats the fields of a structured log message as `key=value` pairs
+    when the message is formatted.
+    """
+
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: Dict[str, Any]) -> None:
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return "".join(f" {key}={value}" for key, value in self.fields.items())
+
+
+class RateLimitedLogger:
+    """
+    Logs SDK events through a standard library logger, which is left
+    unconfigured so applications keep control of handlers and levels.
+
+    Messages are %-style and formatted only when emitted. Each event, e.g.
+    "http_error", is logged at most `burst` times per `interval` seconds;
+    beyond that it is sampled, and the next emitted message reports how
+    many were suppressed. Fields are attached to the record as
+    `oxylabs_event` and `oxylabs_fields` for structured handlers and
+    appended to the message as `key=value` pairs.
+
+    Example:
+        logger = get_logger(__name__)
+        logger.error("http_error", "HTTP error %s", 500, body=Body(text))
+    """
+
+    def __init__(
+        self,
+        name: str,
+        burst: int = LOG_BURST,
+        interval: float = LOG_INTERVAL,
+    ) -> None:
+        self.logger = logging.getLogger(name)
+        self.burst = burst
+        self.interval = interval
+        self._windows: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def _admit(self, event: str) -> Optional[int]:
+        """
+        Counts a message of an event and returns the number of messages
+        suppressed before it, or None if it is suppressed too.
+        """
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(event)
+            if window is None or now - window[0] >= self.interval:
+                suppressed = window[2] if window is not None else 0
+                self._windows[event] = [now, 1, 0]
+                return suppressed
+            window[1] += 1
+            if window[1] <= self.burst:
+                return 0
+            window[2] += 1
+            return None
+
+    def log(
+        self, level: int, event: str, msg: str, *args: Any, **fields: Any
+    ) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
+        suppressed = self._admit(event)
+        if suppressed is None:
+            return
+        if suppressed:
+            fields["suppressed"] = suppressed
+        self.logger.log(
+            level,
+            msg + "%s",
+            *args,
+            _Fields(fields),
+            extra={"oxylabs_event": event, "oxylabs_fields": fields},
+            stacklevel=3,
+        )
+
+    def debug(self, event: str, msg: str, *args: Any, **fields: Any) -> None:
+        self.log(logging.DEBUG, event, msg, *args, **fields)
+
+    def info(self, event: str, msg: str, *args: Any, **fields: Any) -> None:
+        self.log(logging.INFO, event, msg, *args, **fields)
+
+    def warning(self, event: str, msg: str, *args: Any, **fields: Any) -> None:
+        self.log(logging.WARNING, event, msg, *args, **fields)
+
+    def error(self, event: str, msg: str, *args: Any, **fields: Any) -> None:
+        self.log(logging.ERROR, event, msg, *args, **fields)
+
+
+_loggers: Dict[str, RateLimitedLogger] = {}
+
+
+def get_logger(name: str) -> RateLimitedLogger:
+    """
+    Returns the rate limited logger of a module.
+    """
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers.setdefault(name, RateLimitedLogger(name))
+    return logger
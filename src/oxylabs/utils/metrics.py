@@ -0,0 +1,369 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300,
+)  # fmt: skip
+SIZE_BUCKETS = tuple(1024 * 4**i for i in range(10))
+COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: Sequence[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    body = ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs)
+    return f"{{{body}}}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """
+    A metric with a value per combination of label values.
+    """
+
+    kind = ""
+
+    def __init__(
+        self, name: str, documentation: str, labels: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._series: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # Locks cannot be pickled, e.g. to send metrics between processes.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _check(self, values: tuple) -> None:
+        if len(values) != len(self.labels):
+            raise ValueError(
+                f"{self.name} expects the labels {self.labels}, got {values}"
+            )
+
+    def _header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+
+class Counter(Metric):
+    """
+    A value that only goes up, e.g. the number of requests.
+    """
+
+    kind = "counter"
+
+    def inc(self, *values: str, amount: float = 1) -> None:
+        """
+        Increments the counter of the given label values.
+        """
+        with self._lock:
+            count = self._series.get(values)
+            if count is None:
+                self._check(values)
+                count = 0
+            self._series[values] = count + amount
+
+    def get(self, *values: str) -> float:
+        return self._series.get(values, 0)
+
+    def merge(self, other: "Counter") -> None:
+        """
+        Adds the counts of another counter with the same labels.
+        """
+        for values, count in other.collect().items():
+            self.inc(*values, amount=count)
+
+    def collect(self) -> dict:
+        with self._lock:
+            return {values: count for values, count in self._series.items()}
+
+    def to_prometheus(self) -> List[str]:
+        lines = self._header()
+        for values, count in sorted(self.collect().items()):
+            labels = _format_labels(list(zip(self.labels, values)))
+            lines.append(f"{self.name}{labels} {_format_value(count)}")
+        return lines
+
+
+class Histogram(Metric):
+    """
+    The distribution of observed values, e.g. latencies, counted in
+    buckets along with their sum.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *values: str) -> None:
+        """
+        Records a value for the given label values.
+        """
+        # Bucket counts are kept per bucket and made cumulative on export.
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(values)
+            if series is None:
+                self._check(values)
+                series = self._series[values] = [
+                    [0] * (len(self.buckets) + 1),
+                    0.0,
+                ]
+            series[0][index] += 1
+            series[1] += value
+
+    def count(self, *values: str) -> int:
+        series = self._series.get(values)
+        return sum(series[0]) if series else 0
+
+    def sum(self, *values: str) -> float:
+        series = self._series.get(values)
+        return series[1] if series else 0.0
+
+    def merge(self, other: "Histogram") -> None:
+        """
+        Adds the observations of another histogram with the same labels and
+        buckets.
+        """
+        if other.buckets != self.buckets:
+            raise ValueError(f"{self.name} has different buckets")
+        with other._lock:
+            series = {v: (list(s[0]), s[1]) for v, s in other._series.items()}
+        with self._lock:
+            for values, (counts, total) in series.items():
+                mine = self._series.get(values)
+                if mine is None:
+                    self._check(values)
+                    mine = self._series[values] = [[0] * len(counts), 0.0]
+                mine[0] = [a + b for a, b in zip(mine[0], counts)]
+                mine[1] += total
+
+    def collect(self) -> dict:
+        """
+        Returns the cumulative bucket counts, sum and count per label
+        values.
+        """
+        with self._lock:
+            series = {v: (list(s[0]), s[1]) for v, s in self._series.items()}
+        collected = {}
+        for values, (counts, total) in series.items():
+            cumulative, running = [], 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                running += count
+                cumulative.append((bound, running))
+            collected[values] = {
+                "buckets": cumulative,
+                "sum": total,
+                "count": running,
+            }
+        return collected
+
+    def to_prometheus(self) -> List[str]:
+        lines = self._header()
+        for values, series in sorted(self.collect().items()):
+            pairs = list(zip(self.labels, values))
+            for bound, count in series["buckets"]:
+                labels = _format_labels(pairs + [("le", _format_value(bound))])
+                lines.append(f"{self.name}_bucket{labels} {count}")
+            labels = _format_labels(pairs)
+            lines.append(
+                f"{self.name}_sum{labels} {_format_value(series['sum'])}"
+            )
+            lines.append(f"{self.name}_count{labels} {series['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Holds the metrics recorded by the clients it is passed to and exposes
+    them in the Prometheus text format, without depending on a Prometheus
+    client library. One registry can be shared by several clients.
+
+    Example:
+        metrics = MetricsRegistry()
+        c = AsyncClient(username, password, metrics=metrics)
+        ...
+        print(metrics.to_prometheus())
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    __getstate__ = Metric.__getstate__
+    __setstate__ = Metric.__setstate__
+
+    def __iter__(self) -> Iterator[Metric]:
+        return iter(list(self._metrics.values()))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._metrics
+
+    def __getitem__(self, name: str) -> Metric:
+        return self._metrics[name]
+
+    def _register(self, cls: type, name: str, *args, **kwargs) -> Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(
+                    f"{name} is already registered as a {metric.kind}"
+                )
+            return metric
+
+    def counter(
+        self, name: str, documentation: str, labels: Sequence[str] = ()
+    ) -> Counter:
+        """
+        Returns the counter with the given name, registering it first if
+        needed.
+        """
+        return self._register(Counter, name, documentation, labels)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """
+        Returns the histogram with the given name, registering it first if
+        needed.
+        """
+        return self._register(
+            Histogram, name, documentation, labels, buckets=buckets
+        )
+
+    def merge(self, other: "MetricsRegistry") -> None:
+        """
+        Adds the values of another registry, e.g. one recorded in a worker
+        process, registering its metrics first if needed.
+        """
+        for metric in other:
+            if isinstance(metric, Histogram):
+                mine = self.histogram(
+                    metric.name,
+                    metric.documentation,
+                    metric.labels,
+                    metric.buckets,
+                )
+            else:
+                mine = self.counter(
+                    metric.name, metric.documentation, metric.labels
+                )
+            mine.merge(metric)
+
+    def collect(self) -> Dict[str, dict]:
+        """
+        Returns the values of every metric keyed by metric name and then by
+        label values.
+        """
+        return {metric.name: metric.collect() for metric in self}
+
+    def to_prometheus(self) -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        for metric in self:
+            lines.extend(metric.to_prometheus())
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+class ClientMetrics:
+    """
+    The metrics recorded by the realtime and push-pull clients for each
+    phase of a job, labelled by integration method, source and outcome.
+    """
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.registry = registry
+        self.requests = registry.counter(
+            "oxylabs_requests_total",
+            "Jobs submitted to the API.",
+            ("integration", "source", "outcome"),
+        )
+        self.submit_seconds = registry.histogram(
+            "oxylabs_submit_seconds",
+            "Time to submit a job. Realtime jobs include the wait for "
+            "their results.",
+            ("integration", "source", "outcome"),
+        )
+        self.time_to_done_seconds = registry.histogram(
+            "oxylabs_time_to_done_seconds",
+            "Time from the submission of a push-pull job until it was seen "
+            "done.",
+            ("source", "outcome"),
+        )
+        self.polls = registry.histogram(
+            "oxylabs_polls_per_job",
+            "Status requests sent per push-pull job.",
+            ("source", "outcome"),
+            buckets=COUNT_BUCKETS,
+        )
+        self.wasted_poll_seconds = registry.histogram(
+            "oxylabs_wasted_poll_seconds",
+            "Time slept before the status request that saw a push-pull job "
+            "done, an upper bound on the delay added by the poll interval.",
+            ("source",),
+        )
+        self.results_seconds = registry.histogram(
+            "oxylabs_results_seconds",
+            "Time to download the results of a push-pull job.",
+            ("source", "outcome"),
+        )
+        self.result_bytes = registry.histogram(
+            "oxylabs_result_bytes",
+            "Size of the result bodies.",
+            ("integration", "source"),
+            buckets=SIZE_BUCKETS,
+        )
+        self.json_decode_seconds = registry.histogram(
+            "oxylabs_json_decode_seconds",
+            "Time to decode the result bodies.",
+            ("integration", "source"),
+        )
+        self.model_build_seconds = registry.histogram(
+            "oxylabs_model_build_seconds",
+            "Time to build response models from decoded results.",
+            ("source",),
+        )
+
+
+def client_metrics(
+    registry: Optional[MetricsRegistry],
+) -> Optional[ClientMetrics]:
+    return None if registry is None else ClientMetrics(registry)
@@ -0,0 +1,240 @@
+import sys
+from typing import Any, Callable, Dict
+
+from oxylabs.utils.intern import _current
+
+
+def _to_int(value: Any) -> Any:
+    """
+    Converts floats without a fractional part and numeric strings to int.
+    Any other value is returned unchanged.
+    """
+    try:
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, str):
+            return int(value.strip())
+    except ValueError:
+        pass
+    return value
+
+
+def _to_float(value: Any) -> Any:
+    """
+    Converts ints to float. Any other value is returned unchanged, as the
+    decimal separator of strings such as prices depends on the domain.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def _to_str(value: Any) -> Any:
+    """
+    Converts numbers to str. Any other value is returned unchanged.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+
+def _to_bool(value: Any) -> Any:
+    """
+    Converts 0/1 and "true"/"false" to bool. Any other value is returned
+    unchanged.
+    """
+    if value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.lower() in ("true", "false"):
+        return value.lower() == "true"
+    return value
+
+
+COERCERS: Dict[type, Callable[[Any], Any]] = {
+    int: _to_int,
+    float: _to_float,
+    str: _to_str,
+    bool: _to_bool,
+}
+
+
+class Field:
+    __slots__ = ("type", "key", "intern", "module")
+
+    def __init__(
+        self, type: Any = None, key: str = None, intern: bool = False
+    ) -> None:
+        """
+        Declares a field of a response model.
+
+        Args:
+            type (Any): How the value is read. One of:
+            - None        - The value is stored as is.
+            - int, float, str, bool - The value is coerced to the type when
+              possible and stored as is otherwise.
+            - list, dict  - The value is stored as is, defaulting to an
+              empty container when missing.
+            - A Model subclass, or its name for models defined later in the
+              same module - The value is built into a nested model.
+            - [type]      - A list whose items are read as `type`.
+            key (str): The key of the value in the response data. Defaults
+            to the attribute name.
+            intern (bool): Whether the strings of the value are deduplicated
+            by the active `InternPool`. Only untyped, str, list and dict
+            fields can be interned. Defaults to False.
+
+        Raises:
+            TypeError: If `intern` is set on a field of another type.
+        """
+        if intern and type not in (None, str, list, dict) and type != [str]:
+            raise TypeError(
+                "Only untyped, str, list and dict fields can be interned"
+            )
+        self.type = type
+        self.key = key
+        self.intern = intern
+        self.module = None
+
+
+class _ModelMeta(type):
+    def __new__(mcs, name, bases, namespace):
+        fields = {}
+        for base in reversed(bases):
+            fields.update(getattr(base, "_fields", {}))
+        own = []
+        for attr, value in list(namespace.items()):
+            if isinstance(value, Field):
+                del namespace[attr]
+                value.module = namespace["__module__"]
+                if attr not in fields:
+                    own.append(attr)
+                fields[attr] = value
+
+        namespace["__slots__"] = tuple(own) + tuple(
+            namespace.get("__slots__", ())
+        )
+        namespace["_fields"] = fields
+        if "__init__" not in namespace:
+            namespace["__init__"] = _lazy_init
+        return super().__new__(mcs, name, bases, namespace)
+
+
+def _lazy_init(self, data: dict = None) -> None:
+    # Compile the constructor on first use, so that models may refer to
+    # models defined further down their module.
+    cls = type(self)
+    cls.__init__ = _compile(cls)
+    cls.__init__(self, data)
+
+
+def _resolve(field: Field, ref: Any) -> Any:
+    """
+    Resolves a model given by name against the module declaring `field`.
+    """
+    if isinstance(ref, str):
+        return getattr(sys.modules[field.module], ref)
+    return ref
+
+
+def _read(field: Field, ref: Any, bound: dict, var: str = "v") -> str:
+    """
+    Returns the expression reading the value held in `var` as `ref`, adding
+    the names it refers to to `bound`.
+    """
+    ref = _resolve(field, ref)
+    if ref in COERCERS:
+        name = ref.__name__
+        bound[f"_{name}"] = ref
+        bound[f"_to_{name}"] = COERCERS[ref]
+        return (
+            f"{var} if {var} is None or {var}.__class__ is _{name} "
+            f"else _to_{name}({var})"
+        )
+    if isinstance(ref, type) and issubclass(ref, Model):
+        name = f"_{ref.__name__}"
+        bound[name] = ref
+        return f"{name}({var})"
+    return var
+
+
+def _default(field: Field, ref: Any, bound: dict) -> str:
+    """
+    Returns the expression for the value of a field missing from the data.
+    """
+    if ref is list or isinstance(ref, list):
+        return "[]"
+    if ref is dict:
+        return "{}"
+    ref = _resolve(field, ref)
+    if isinstance(ref, type) and issubclass(ref, Model):
+        name = f"_{ref.__name__}"
+        bound[name] = ref
+        return f"{name}(None)"
+    return "None"
+
+
+def _compile(cls: type) -> Callable:
+    """
+    Generates a constructor for `cls` that reads every declared field with
+    straight-line code.
+    """
+    bound = {}
+    empty = ["    if data is None:", "        self.raw = {}"]
+    body = ["    get = data.get", "    self.raw = data"]
+    if any(field.intern for field in cls._fields.values()):
+        bound["_current"] = _current
+        bound["_str"] = str
+        body.append("    pool = _current.get()")
+
+    for attr, field in cls._fields.items():
+        key = repr(field.key or attr)
+        ref = field.type
+        empty.append(f"        self.{attr} = {_default(field, ref, bound)}")
+        if field.intern:
+            # Interned values are written back to the data, so that the
+            # duplicates held by `raw` are released too.
+            body.append(f"    v = get({key})")
+            if ref is None or ref is str:
+                body.append("    if pool is not None and v.__class__ is _str:")
+                body.append(f"        v = data[{key}] = pool.intern(v)")
+                body.append(f"    self.{attr} = {_read(field, ref, bound)}")
+            else:
+                empty_value = "{}" if ref is dict else "[]"
+                body.append("    if pool is not None and v:")
+                body.append("        pool.intern_tree(v)")
+                body.append(
+                    f"    self.{attr} = {empty_value} if v is None else v"
+                )
+            continue
+        if ref is None:
+            body.append(f"    self.{attr} = get({key})")
+            continue
+
+        body.append(f"    v = get({key})")
+        if ref is list:
+            body.append(f"    self.{attr} = [] if v is None else v")
+        elif ref is dict:
+            body.append(f"    self.{attr} = {{}} if v is None else v")
+        elif isinstance(ref, list):
+            item = _read(field, ref[0], bound, "i")
+            body.append(f"    self.{attr} = [{item} for i in v] if v else []")
+        else:
+            body.append(f"    self.{attr} = {_read(field, ref, bound)}")
+    empty.append("        return")
+
+    source = "\n".join(["def __init__(self, data=None):"] + empty + body)
+    namespace = dict(bound)
+    exec(source, namespace)
+    init = namespace["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    return init
+
+
+class Model(metaclass=_ModelMeta):
+    """
+    Base class of response models declared with `Field` attributes.
+
+    Every model keeps the data it was built from in `raw`.
+    """
+
+    __slots__ = ("raw",)
@@ -0,0 +1,165 @@
+import json
+import os
+import sys
+from typing import NamedTuple
+
+# The first byte of a serialized blob tells how the rest was encoded.
+_FORMAT_JSON = 0x00
+_FORMAT_MSGPACK = 0x01
+_FLAG_ZSTD = 0x80
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        return None
+    return msgpack
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstd compression requires the zstandard package. Install it "
+            "with `pip install oxylabs[serialization]`."
+        ) from None
+    return zstandard
+
+
+def dumps(data: dict, compress: bool = False, level: int = 3) -> bytes:
+    """
+    Serializes response data into a compact binary blob.
+
+    msgpack is used when it is installed and compact JSON otherwise. The
+    format is recorded in the blob, so `loads` can read either.
+
+    Args:
+        data (dict): The raw response data.
+        compress (bool): Whether to compress the blob with zstd. Defaults
+        to False.
+        level (int): The zstd compression level. Defaults to 3.
+
+    Returns:
+        bytes: The serialized data.
+    """
+    msgpack = _msgpack()
+    if msgpack is not None:
+        header = _FORMAT_MSGPACK
+        body = msgpack.packb(data, use_bin_type=True)
+    else:
+        header = _FORMAT_JSON
+        body = json.dumps(
+            data, separators=(",", ":"), ensure_ascii=False
+        ).encode()
+
+    if compress:
+        header |= _FLAG_ZSTD
+        body = _zstd().ZstdCompressor(level=level).compress(body)
+
+    return bytes((header,)) + body
+
+
+def loads(blob: bytes) -> dict:
+    """
+    Deserializes a blob produced by `dumps`.
+
+    Args:
+        blob (bytes): The serialized data.
+
+    Returns:
+        dict: The raw response data.
+
+    Raises:
+        ValueError: If the blob is empty or of an unknown format.
+    """
+    if not blob:
+        raise ValueError("Cannot deserialize an empty blob")
+
+    header = blob[0]
+    body = memoryview(blob)[1:]
+    if header & _FLAG_ZSTD:
+        body = _zstd().ZstdDecompressor().decompress(body)
+
+    codec = header & ~_FLAG_ZSTD
+    if codec == _FORMAT_MSGPACK:
+        msgpack = _msgpack()
+        if msgpack is None:
+            raise ImportError(
+                "The blob was serialized with msgpack, which is not "
+                "installed. Install it with `pip install "
+                "oxylabs[serialization]`."
+            )
+        return msgpack.unpackb(body, raw=False, strict_map_key=False)
+    if codec == _FORMAT_JSON:
+        return json.loads(bytes(body))
+
+    raise ValueError(f"Unknown serialization format: {header:#x}")
+
+
+class SharedBlob(NamedTuple):
+    """
+    A handle to a serialized blob in shared memory. It is cheap to pickle,
+    so it can be passed through a multiprocessing queue or pipe.
+    """
+
+    name: str
+    size: int
+
+
+def to_shared_memory(blob: bytes) -> SharedBlob:
+    """
+    Copies a blob into a new shared memory block.
+
+    The block is owned by whoever reads it with `from_shared_memory`, which
+    frees it by default.
+
+    Args:
+        blob (bytes): The serialized data.
+
+    Returns:
+        SharedBlob: The handle to pass to another process.
+    """
+    from multiprocessing import resource_tracker, shared_memory
+
+    # The reading process frees the block, so the resource tracker of this
+    # process must not free it when this process exits first. Python 3.13
+    # can create untracked blocks, older versions track them on POSIX.
+    track = sys.version_info < (3, 13)
+    options = {} if track else {"track": False}
+    shm = shared_memory.SharedMemory(
+        create=True, size=max(len(blob), 1), **options
+    )
+    try:
+        shm.buf[: len(blob)] = blob
+        if track and os.name != "nt":
+            # Blocks are tracked by their POSIX name, which has the leading
+            # slash that `name` leaves out.
+            resource_tracker.unregister(f"/{shm.name}", "shared_memory")
+        return SharedBlob(shm.name, len(blob))
+    finally:
+        shm.close()
+
+
+def from_shared_memory(handle: SharedBlob, unlink: bool = True) -> bytes:
+    """
+    Reads a blob from shared memory.
+
+    Args:
+        handle (SharedBlob): The handle returned by `to_shared_memory`.
+        unlink (bool): Whether to free the block after reading. Defaults to
+        True.
+
+    Returns:
+        bytes: The serialized data.
+    """
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=handle.name)
+    try:
+        return bytes(shm.buf[: handle.size])
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
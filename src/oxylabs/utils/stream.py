@@ -0,0 +1,145 @@
+import json
+import re
+from typing import List
+
+_STRUCTURAL = re.compile(rb'[{}\[\]"]')
+_STRING_END = re.compile(rb'["\\]')
+
+_OPEN = (ord("{"), ord("["))
+_ARRAY = ord("[")
+_CLOSE = (ord("}"), ord("]"))
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+
+# Where the bytes of the current segment end up.
+_SKELETON = 0
+_GAP = 1
+_ELEMENT = 2
+
+
+class ResultsStreamParser:
+    def __init__(self, key: str = "results") -> None:
+        """
+        Initializes an incremental parser for a JSON document whose
+        top-level object holds an array of items under `key`.
+
+        Bytes are fed in as they arrive and every completed array item is
+        decoded and returned on its own, so only one item is buffered at a
+        time. Everything outside the array is kept and decoded on `close`.
+
+        Args:
+            key (str): The top-level key of the array to stream. Defaults
+            to "results".
+        """
+        self._key = json.dumps(key).encode()
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._mode = _SKELETON
+        self._skeleton = bytearray()
+        self._element = bytearray()
+        self._string_start = None
+        self._last_string = None
+        self.extra = None
+
+    def feed(self, chunk: bytes) -> List[dict]:
+        """
+        Consumes the next chunk of the document.
+
+        Args:
+            chunk (bytes): The next chunk of the response body.
+
+        Returns:
+            List[dict]: The array items completed by this chunk.
+        """
+        items = []
+        size = len(chunk)
+        start = 0
+        i = 0
+
+        if self._escape and size:
+            self._escape = False
+            i = 1
+
+        while i < size:
+            if self._in_string:
+                match = _STRING_END.search(chunk, i)
+                if match is None:
+                    break
+                i = match.start()
+                if chunk[i] == _BACKSLASH:
+                    if i + 1 == size:
+                        self._escape = True
+                    i += 2
+                    continue
+                self._in_string = False
+                i += 1
+                if self._string_start is not None:
+                    self._skeleton += chunk[start:i]
+                    start = i
+                    self._last_string = bytes(
+                        self._skeleton[self._string_start :]
+                    )
+                    self._string_start = None
+                continue
+
+            match = _STRUCTURAL.search(chunk, i)
+            if match is None:
+                break
+            i = match.start()
+            char = chunk[i]
+
+            if char == _QUOTE:
+                self._in_string = True
+                if self._depth == 1 and self._mode == _SKELETON:
+                    self._string_start = len(self._skeleton) + i - start
+            elif char in _OPEN:
+                self._depth += 1
+                if self._mode == _GAP:
+                    start = i
+                    self._mode = _ELEMENT
+                elif (
+                    char == _ARRAY
+                    and self._depth == 2
+                    and self._last_string == self._key
+                ):
+                    self._skeleton += chunk[start : i + 1]
+                    start = i + 1
+                    self._mode = _GAP
+            elif char in _CLOSE:
+                self._depth -= 1
+                if self._mode == _ELEMENT and self._depth == 2:
+                    self._element += chunk[start : i + 1]
+                    start = i + 1
+                    items.append(json.loads(self._element))
+                    self._element = bytearray()
+                    self._mode = _GAP
+                elif self._mode == _GAP and self._depth == 1:
+                    start = i
+                    self._mode = _SKELETON
+            i += 1
+
+        if self._mode == _SKELETON:
+            self._skeleton += chunk[start:]
+        elif self._mode == _ELEMENT:
+            self._element += chunk[start:]
+
+        return items
+
+    def close(self) -> dict:
+        """
+        Finishes parsing once the whole body has been fed.
+
+        Returns:
+            dict: The top-level object without the streamed array items.
+
+        Raises:
+            ValueError: If the document ended before it was complete.
+        """
+        if self._depth != 0 or self._in_string:
+            raise ValueError("Incomplete JSON document")
+
+        self.extra = (
+            json.loads(self._skeleton) if self._skeleton.strip() else {}
+        )
+        return self.extra
@@ -0,0 +1,304 @@
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+from .log import get_logger
+
+logger = get_logger(__name__)
+
+EVENTS = (
+    "on_submit",
+    "on_poll",
+    "on_done",
+    "on_fetch",
+    "on_retry",
+    "on_error",
+)
+
+_current: ContextVar[Optional["Span"]] = ContextVar(
+    "oxylabs_span", default=None
+)
+# Guards the depth of spans, which the layers of a job running in other
+# threads, such as its pages, join and end concurrently.
+_depth_lock = threading.Lock()
+
+
+class Span:
+    """
+    The timeline of one job or proxy request: its attributes, named after
+    the OpenTelemetry semantic conventions where one applies, and the
+    lifecycle events that happened to it.
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "start_time",
+        "end_time",
+        "attributes",
+        "events",
+        "status",
+        "_depth",
+        "_previous",
+    )
+
+    def __init__(self, name: str, attributes: Dict[str, Any]) -> None:
+        self.name = name
+        self.trace_id = os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.start_time = time.time_ns()
+        self.end_time: Optional[int] = None
+        self.attributes = attributes
+        self.events: List[tuple] = []
+        self.status = "unset"
+        self._depth = 1
+        self._previous: Optional[Span] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """
+        The duration of the span in seconds, once ended.
+        """
+        if self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def add_event(self, name: str, attributes: Dict[str, Any]) -> None:
+        self.events.append((name, time.time_ns(), attributes))
+
+    def to_dict(self) -> dict:
+        """
+        Returns the span in the shape of an OpenTelemetry span, with
+        timestamps in nanoseconds since the epoch.
+        """
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "start_time_unix_nano": self.start_time,
+            "end_time_unix_nano": self.end_time,
+            "attributes": dict(self.attributes),
+            "events": [
+                {
+                    "name": name,
+                    "time_unix_nano": timestamp,
+                    "attributes": attributes,
+                }
+                for name, timestamp, attributes in self.events
+            ],
+            "status": self.status,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"Span({self.name!r}, events={len(self.events)}, "
+            f"status={self.status!r})"
+        )
+
+
+class InMemoryExporter:
+    """
+    Keeps finished spans in memory so per-job timelines can be inspected or
+    dumped as JSON lines and analyzed offline.
+    """
+
+    def __init__(self, max_spans: Optional[int] = None) -> None:
+        self.spans: List[Span] = []
+        self._max_spans = max_spans
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+            if self._max_spans and len(self.spans) > self._max_spans:
+                del self.spans[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+    def to_dicts(self) -> List[dict]:
+        with self._lock:
+            return [span.to_dict() for span in self.spans]
+
+    def dump(self, path: str) -> None:
+        """
+        Writes the finished spans to a file, one JSON object per line.
+        """
+        with open(path, "w") as file:
+            for span in self.to_dicts():
+                file.write(json.dumps(span, default=str))
+                file.write("\n")
+
+
+class Hooks:
+    def __init__(
+        self,
+        on_submit: Optional[Callable] = None,
+        on_poll: Optional[Callable] = None,
+        on_done: Optional[Callable] = None,
+        on_fetch: Optional[Callable] = None,
+        on_retry: Optional[Callable] = None,
+        on_error: Optional[Callable] = None,
+        exporter: Optional[InMemoryExporter] = None,
+    ) -> None:
+        """
+        Callbacks for the lifecycle events of the jobs and proxy requests of
+        the clients it is passed to, and the exporter of their spans.
+
+        Every callback is called with the span of the job and the details
+        of the event as keyword arguments:
+
+        - on_submit: a job or proxy request is about to be sent.
+        - on_poll: the status of a push-pull job was polled (`status`).
+        - on_done: a job is done or a response arrived (`status_code`).
+        - on_fetch: the results were downloaded (`bytes`).
+        - on_retry: a request waits for the backoff of a throttled
+          account (`delay`).
+        - on_error: a request or job failed (`error`).
+
+        Callbacks raising exceptions are logged and do not fail the job.
+
+        Args:
+            exporter (Optional[InMemoryExporter]): Receives every span once
+            it ends. Any object with an `export(span)` method can be used.
+        """
+        self._callbacks: Dict[str, List[Callable]] = {e: [] for e in EVENTS}
+        for event, callback in (
+            ("on_submit", on_submit),
+            ("on_poll", on_poll),
+            ("on_done", on_done),
+            ("on_fetch", on_fetch),
+            ("on_retry", on_retry),
+            ("on_error", on_error),
+        ):
+            if callback is not None:
+                self.add(event, callback)
+        self.exporter = exporter
+
+    def add(self, event: str, callback: Callable) -> None:
+        """
+        Registers another callback for an event.
+
+        Raises:
+            ValueError: If the event is unknown.
+        """
+        if event not in self._callbacks:
+            raise ValueError(f"Unknown event: {event}")
+        self._callbacks[event].append(callback)
+
+    def begin(self, name: str, **attributes: Any) -> Span:
+        """
+        Starts a span and makes it current, or joins the current span, so
+        nested layers of the client record onto the span of the job.
+        """
+        span = _current.get()
+        if span is not None and span.end_time is None:
+            with _depth_lock:
+                span._depth += 1
+            for key, value in attributes.items():
+                span.attributes.setdefault(key, value)
+            return span
+        span = Span(name, attributes)
+        span._previous = _current.get()
+        _current.set(span)
+        return span
+
+    def start(self, name: str, **attributes: Any) -> Span:
+        """
+        Starts a span without making it current, for jobs that outlive the
+        call starting them, such as streamed results. The layers of such a
+        job are handed the span, so no other job of the caller joins it.
+        """
+        return Span(name, attributes)
+
+    def end(self, span: Span, error: Optional[BaseException] = None) -> None:
+        """
+        Ends a span begun with `begin` or `start` and exports it once the
+        outermost layer ends it.
+        """
+        if error is not None and span.status != "error":
+            span.status = "error"
+            span.attributes["error.type"] = type(error).__name__
+        with _depth_lock:
+            span._depth -= 1
+            if span._depth:
+                return
+        span.end_time = time.time_ns()
+        if span.status == "unset":
+            span.status = "ok"
+        if _current.get() is span:
+            _current.set(span._previous)
+        span._previous = None
+        if self.exporter is not None:
+            self.exporter.export(span)
+
+    def current(self) -> Optional[Span]:
+        """
+        Returns the span of the job being processed, if any.
+        """
+        return _current.get()
+
+    def annotate(self, span: Span, attributes: Dict[str, Any]) -> None:
+        """
+        Sets attributes of a span.
+        """
+        if span is not None:
+            span.attributes.update(attributes)
+
+    def emit(self, event: str, span: Span, **details: Any) -> None:
+        """
+        Records an event on a span and calls its callbacks.
+        """
+        if span is None:
+            return
+        span.add_event(event[3:], details)
+        if event == "on_error":
+            span.status = "error"
+        for callback in self._callbacks[event]:
+            try:
+                callback(span, **details)
+            except Exception as e:
+                logger.error("hook_error", "Error in %s hook: %s", event, e)
+
+
+class NoHooks:
+    """
+    Stands in for `Hooks` on clients without any, so that instrumented
+    code calls no-ops instead of checking whether hooks are set.
+    """
+
+    def begin(self, name: str, **attributes: Any) -> None:
+        return None
+
+    def start(self, name: str, **attributes: Any) -> None:
+        return None
+
+    def end(self, span: None, error: Optional[BaseException] = None) -> None:
+        pass
+
+    def current(self) -> None:
+        return None
+
+    def annotate(self, span: None, attributes: Dict[str, Any]) -> None:
+        pass
+
+    def emit(self, event: str, span: None, **details: Any) -> None:
+        pass
+
+
+NO_HOOKS = NoHooks()
+
+
+def current_span() -> Optional[Span]:
+    """
+    Returns the span of the job being processed, if any.
+    """
+    return _current.get()
@@ -208,3 +208,8 @@ BZ = "com.bz"
 UY = "com.uy"
 COM_VE = "com.ve"
 ID_TL = "tl"
+IN = "in"
+SA = "sa"
+SG = "sg"
+COM_BE = "com.be"
+EG = "eg"
@@ -1,7 +1,9 @@
-from typing import Any, List
+import struct
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, List
 from urllib.parse import urlparse
 
-import aiohttp
+from oxylabs._version import __version__
 
 from .defaults import (
     DEFAULT_JOB_COMPLETION_TIMEOUT,
@@ -9,8 +11,14 @@ from .defaults import (
     DEFAULT_REQUEST_TIMEOUT,
     DEFAULT_REQUEST_TIMEOUT_ASYNC,
 )
+from .lazy import lazy_import
 from .types import fn_name
 
+if TYPE_CHECKING:
+    import aiohttp
+else:
+    aiohttp = lazy_import("aiohttp")
+
 
 def get_valid_values(module: object) -> list:
     """
@@ -32,6 +40,21 @@ def get_valid_values(module: object) -> list:
 VALID_FN_NAMES = get_valid_values(fn_name)
 
 
+@lru_cache(maxsize=None)
+def sdk_header() -> str:
+    """
+    Returns the value of the `x-oxylabs-sdk` header sent with every request.
+
+    The pointer size gives the same "64bit" or "32bit" as
+    `platform.architecture`, without it running the `file` command on the
+    interpreter.
+    """
+    from platform import python_version
+
+    bits = f"{struct.calcsize('P') * 8}bit"
+    return f"oxylabs-sdk-python/{__version__} ({python_version()}; {bits})"
+
+
 def prepare_config(**kwargs):
     """
     Prepare a configuration dictionary based on the provided keyword arguments.
@@ -109,7 +132,7 @@ def validate_url(input_url: str, host: str) -> None:
     return None
 
 
-async def ensure_session(session) -> aiohttp.ClientSession:
+async def ensure_session(session) -> "aiohttp.ClientSession":
     """
     Ensure the provided session is valid and return a valid session.
 
@@ -125,7 +148,7 @@ async def ensure_session(session) -> aiohttp.ClientSession:
     return session
 
 
-async def close(user_session: aiohttp.ClientSession) -> None:
+async def close(user_session: "aiohttp.ClientSession") -> None:
     """
     Closes the user session.
 
@@ -0,0 +1,112 @@
+import threading
+import unittest
+
+from oxylabs import Hooks, RealtimeClient
+from oxylabs.sources.ecommerce.response import EcommerceResponse
+from oxylabs.sources.serp.response import SERPResponse
+from oxylabs.testing import MockServer, uniform
+
+
+class TestRealtimeBatch(unittest.TestCase):
+    def test_map(self):
+        """
+        Tests that `map` returns the responses in the order of the specs,
+        with the response model of each source.
+        """
+        with MockServer(latency=uniform(0, 0.02, seed=1)) as server:
+            client = RealtimeClient(
+                "user", "pass", **server.client_kwargs("realtime")
+            )
+            specs = [
+                {"source": "google_search", "query": f"query {i}"}
+                for i in range(10)
+            ]
+            specs.append({"source": "amazon_product", "query": "B07FZ8S74R"})
+            responses = client.map(specs, max_workers=4)
+
+        self.assertEqual(len(responses), 11)
+        for spec, response in zip(specs, responses):
+            self.assertEqual(response.job.query, spec["query"])
+        self.assertIsInstance(responses[0], SERPResponse)
+        self.assertIsInstance(responses[-1], EcommerceResponse)
+        self.assertIsNotNone(client._session)
+        with self.assertRaises(ValueError):
+            client.map([{"query": "shoes"}])
+
+    def test_iter_map(self):
+        with MockServer(latency=uniform(0, 0.02, seed=2)) as server:
+            client = RealtimeClient(
+                "user", "pass", **server.client_kwargs("realtime")
+            )
+            specs = (
+                {"source": "universal_ecommerce", "url": f"https://{i}.com"}
+                for i in range(20)
+            )
+            results = list(client.iter_map(specs, max_workers=4))
+
+        self.assertEqual(
+            sorted(spec["url"] for spec, _ in results),
+            sorted(f"https://{i}.com" for i in range(20)),
+        )
+        for spec, response in results:
+            self.assertEqual(response.results[0].url, spec["url"])
+
+    def test_scrape_many(self):
+        with MockServer() as server:
+            client = RealtimeClient(
+                "user", "pass", **server.client_kwargs("realtime")
+            )
+            responses = client.serp.google.scrape_search_many(
+                ["shoes", {"query": "boots", "pages": 2}], parse=True
+            )
+
+        self.assertEqual(
+            [response.job.query for response in responses], ["shoes", "boots"]
+        )
+        self.assertEqual(len(responses[1].results), 2)
+        self.assertTrue(responses[0].job.parse)
+        self.assertEqual(
+            RealtimeClient(
+                "user", "pass"
+            ).ecommerce.amazon.scrape_product_many.__name__,
+            "scrape_product_many",
+        )
+
+    def test_max_concurrency(self):
+        """
+        Tests that the jobs in flight across concurrent calls stay within
+        the `max_concurrency` of the client.
+        """
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def submitted(span, **details):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+
+        def done(span, **details):
+            with lock:
+                in_flight[0] -= 1
+
+        hooks = Hooks(on_submit=submitted, on_done=done)
+        with MockServer(latency=0.02) as server:
+            client = RealtimeClient(
+                "user",
+                "pass",
+                hooks=hooks,
+                max_concurrency=3,
+                **server.client_kwargs("realtime"),
+            )
+            specs = [{"source": "google_search", "query": "q"}] * 12
+            threads = [
+                threading.Thread(target=client.map, args=(specs, 8))
+                for _ in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(server.counts["realtime"], 24)
+        self.assertLessEqual(in_flight[1], 3)
@@ -0,0 +1,193 @@
+import asyncio
+import base64
+import unittest
+from unittest.mock import Mock, patch
+
+from aiohttp import web
+
+from oxylabs import AsyncClient, CredentialPool, ProxyClient, RealtimeClient
+
+
+def username(headers: dict) -> str:
+    encoded = headers["Authorization"].split()[1]
+    return base64.b64decode(encoded).decode().split(":")[0]
+
+
+class TestCredentialPool(unittest.TestCase):
+    def test_least_loaded(self):
+        """
+        Tests that the credential with the fewest requests in flight
+        relative to its weight is picked.
+        """
+        pool = CredentialPool([("a", "x", 2), ("b", "y")])
+        picks = [pool.acquire().username for _ in range(6)]
+        self.assertEqual(picks.count("a"), 4)
+        self.assertEqual(picks.count("b"), 2)
+
+        for credential in pool.credentials:
+            while credential.in_flight:
+                pool.release(credential)
+        self.assertEqual([c.in_flight for c in pool.credentials], [0, 0])
+
+    def test_weighted_round_robin(self):
+        """
+        Tests that picks are spread evenly by weight.
+        """
+        pool = CredentialPool(
+            [("a", "x", 2), ("b", "y")], strategy="round_robin"
+        )
+        picks = [pool.acquire().username for _ in range(6)]
+        self.assertEqual(picks, ["a", "b", "a", "a", "b", "a"])
+
+    def test_backoff(self):
+        """
+        Tests that a throttled credential is skipped until its backoff ends
+        and that another response clears it.
+        """
+        pool = CredentialPool([("a", "x"), ("b", "y")], backoff=30)
+        a, b = pool.credentials
+
+        pool.record(a, 429)
+        self.assertGreater(a.wait, 29)
+        self.assertEqual({pool.acquire().username for _ in range(3)}, {"b"})
+
+        pool.record(a, 429, retry_after="120")
+        self.assertGreater(a.wait, 119)
+        self.assertEqual(a.throttle_rate, 1.0)
+
+        pool.record(b, 429)
+        self.assertIs(pool.acquire(), b)
+
+        pool.record(b, 200)
+        self.assertEqual(pool.stats()[1]["throttled"], 1)
+        self.assertEqual(pool.stats()[1]["throttle_rate"], 0.5)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            CredentialPool([])
+        with self.assertRaises(ValueError):
+            CredentialPool([("a", "x")], strategy="random")
+        with self.assertRaises(ValueError):
+            RealtimeClient()
+
+
+class TestPooledClients(unittest.TestCase):
+    @patch("oxylabs.internal.internal.requests.post")
+    def test_realtime(self, post):
+        """
+        Tests that realtime requests are spread across the credentials and
+        a throttled credential is backed off.
+        """
+        throttled = Mock(status_code=429, headers={"Retry-After": "60"})
+        throttled.raise_for_status.side_effect = Exception("429")
+
+        def respond(url, headers, **kwargs):
+            if username(headers) == "a":
+                return throttled
+            return Mock(status_code=200, headers={}, content=b"{}")
+
+        post.side_effect = respond
+        pool = CredentialPool([("a", "x"), ("b", "y")])
+        client = RealtimeClient(credential_pool=pool)
+
+        for _ in range(4):
+            try:
+                client._req({}, "POST", {"request_timeout": 1})
+            except Exception:
+                pass
+
+        users = [username(c.kwargs["headers"]) for c in post.call_args_list]
+        self.assertEqual(users, ["a", "b", "b", "b"])
+        self.assertEqual([c.in_flight for c in pool.credentials], [0, 0])
+
+    @patch("requests.Session")
+    def test_proxy(self, MockSession):
+        """
+        Tests that proxy requests are sent through the proxy of each
+        credential.
+        """
+        session = MockSession.return_value
+        session.headers = {}
+        session.get.return_value = Mock(status_code=200, headers={})
+
+        pool = CredentialPool([("a", "x"), ("b", "y")], "round_robin")
+        proxy = ProxyClient(credential_pool=pool)
+        proxy.get("https://www.example.com")
+        proxy.get("https://www.example.com")
+
+        proxies = [
+            c.kwargs["proxies"]["https"] for c in session.get.call_args_list
+        ]
+        self.assertTrue(proxies[0].startswith("http://a:x@"))
+        self.assertTrue(proxies[1].startswith("http://b:y@"))
+
+
+class TestPooledPushPull(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        """
+        Starts a local server standing in for the push-pull API, recording
+        the account of every request.
+        """
+        self.requests = []
+
+        async def submit(request):
+            self.requests.append((username(request.headers), "submit"))
+            return web.json_response({"id": username(request.headers)})
+
+        async def status(request):
+            job = request.match_info["job"]
+            self.requests.append((username(request.headers), job))
+            return web.json_response({"status": "done"})
+
+        async def results(request):
+            job = request.match_info["job"]
+            self.requests.append((username(request.headers), job))
+            return web.json_response({"results": [{"content": "ok"}]})
+
+        app = web.Application()
+        app.router.add_post("/", submit)
+        app.router.add_get("/{job}", status)
+        app.router.add_get("/{job}/results", results)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_same_credential_per_job(self):
+        """
+        Tests that a job is submitted, polled and fetched with the same
+        credential while concurrent jobs use different ones.
+        """
+        pool = CredentialPool([("a", "x"), ("b", "y")])
+        client = AsyncClient(credential_pool=pool)
+        client._base_url = self.base_url
+
+        await asyncio.gather(
+            *(
+                client.ecommerce.universal.scrape_url(
+                    "https://www.example.com", poll_interval=0
+                )
+                for _ in range(2)
+            )
+        )
+        pages = [
+            page
+            async for page in client.ecommerce.iter_results(
+                "universal", url="https://www.example.com", poll_interval=0
+            )
+        ]
+        self.assertEqual(len(pages), 1)
+
+        # Every poll and result fetch uses the account that submitted the
+        # job, whose id is the account name.
+        for user, job in self.requests:
+            self.assertIn(job, ("submit", user))
+        self.assertEqual(len(self.requests), 9)
+        submitted = [user for user, job in self.requests if job == "submit"]
+        self.assertEqual(sorted(submitted[:2]), ["a", "b"])
+        self.assertEqual([c.in_flight for c in pool.credentials], [0, 0])
@@ -0,0 +1,134 @@
+import threading
+import unittest
+
+from oxylabs import AsyncClient, Hooks, RealtimeClient
+from oxylabs.internal.pages import merge_pages, split_pages
+from oxylabs.testing import MockServer
+
+
+class TestParallelPages(unittest.TestCase):
+    def test_split_and_merge(self):
+        payload = {"source": "google_search", "start_page": 3, "pages": 2}
+        pages = split_pages(payload)
+        self.assertEqual(
+            [(page["start_page"], page["pages"]) for page in pages],
+            [(3, 1), (4, 1)],
+        )
+        self.assertIsNone(split_pages({"source": "google_search"}))
+
+        bodies = [
+            {"results": [{"page": 3}], "job": {"id": "1", "pages": 1}},
+            {"results": [{"page": 4}], "job": {"id": "2", "pages": 1}},
+        ]
+        merged = merge_pages(payload, bodies)
+        self.assertEqual([r["page"] for r in merged["results"]], [3, 4])
+        self.assertEqual(merged["job"], {"id": "1", "pages": 2})
+
+        payload = {"source": "google_search", "start_page": 3, "pages": 3}
+        bodies = [
+            {"results": [{"page": 5}], "job": {"id": "3", "pages": 1}},
+            None,
+            {"results": [{"page": 3}], "job": {"id": "1", "pages": 1}},
+        ]
+        with self.assertLogs("oxylabs.internal.pages", "ERROR"):
+            merged = merge_pages(payload, bodies)
+        self.assertEqual([r["page"] for r in merged["results"]], [3, 5])
+        self.assertEqual(
+            merged["job"], {"id": "3", "pages": 3, "missing_pages": [4]}
+        )
+        self.assertIsNone(merge_pages(payload, [None]))
+
+    def test_realtime(self):
+        """
+        Tests that a multi-page job runs as a job per page and is merged in
+        page order, including when it runs within a batch.
+        """
+        with MockServer(record=True) as server:
+            client = RealtimeClient(
+                "user",
+                "pass",
+                max_concurrency=1,
+                **server.client_kwargs("realtime"),
+            )
+            response = client.serp.google.scrape_search(
+                "shoes", start_page=3, pages=4, parallel_pages=True
+            )
+            payloads = [payload for _, _, payload in server.history]
+            responses = client.map(
+                [
+                    {
+                        "source": "amazon_search",
+                        "query": "shoes",
+                        "pages": 3,
+                        "parallel_pages": True,
+                    }
+                ]
+                * 2,
+                max_workers=2,
+            )
+
+        self.assertEqual([r.page for r in response.results], [3, 4, 5, 6])
+        self.assertEqual(response.job.pages, 4)
+        self.assertEqual(
+            sorted(p["start_page"] for p in payloads), [3, 4, 5, 6]
+        )
+        self.assertTrue(all(p["pages"] == 1 for p in payloads))
+        for item in responses:
+            self.assertEqual([r.page for r in item.results], [1, 2, 3])
+        self.assertEqual(server.counts["realtime"], 10)
+
+    def test_batch_max_concurrency(self):
+        """
+        Tests that the page jobs of the jobs of a batch stay within the
+        `max_concurrency` of the client.
+        """
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def submitted(span, **details):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+
+        def done(span, **details):
+            with lock:
+                in_flight[0] -= 1
+
+        hooks = Hooks(on_submit=submitted, on_done=done)
+        with MockServer(latency=0.02) as server:
+            client = RealtimeClient(
+                "user",
+                "pass",
+                hooks=hooks,
+                max_concurrency=3,
+                **server.client_kwargs("realtime"),
+            )
+            spec = {
+                "source": "google_search",
+                "query": "shoes",
+                "pages": 4,
+                "parallel_pages": True,
+            }
+            responses = client.map([spec] * 6, max_workers=3)
+
+        for response in responses:
+            self.assertEqual([r.page for r in response.results], [1, 2, 3, 4])
+        self.assertEqual(server.counts["realtime"], 24)
+        self.assertLessEqual(in_flight[1], 3)
+
+
+class TestParallelPagesAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_push_pull(self):
+        async with MockServer(job_duration=0.05) as server:
+            client = AsyncClient("user", "pass", **server.client_kwargs())
+            response = await client.ecommerce.wayfair.scrape_search(
+                "sofa", pages=3, parallel_pages=True, poll_interval=0.05
+            )
+            single = await client.scrape(
+                "bing_search", query="shoes", pages=2, poll_interval=0.05
+            )
+
+        self.assertEqual([r.page for r in response.results], [1, 2, 3])
+        self.assertEqual(response.job.pages, 3)
+        self.assertEqual([r.page for r in single.results], [1, 2])
+        self.assertEqual(server.counts["submit"], 4)
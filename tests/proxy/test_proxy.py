@@ -1,6 +1,16 @@
+import asyncio
+import io
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, Mock
-from oxylabs.proxy import ProxyClient
+
+import requests
+from aiohttp import web
+
+from oxylabs import CredentialPool
+from oxylabs.proxy import AsyncProxyClient, ProxyClient
 
 class TestProxyGet(unittest.TestCase):
     @patch('requests.Session')
@@ -55,3 +65,300 @@ class TestProxyGet(unittest.TestCase):
             "https://www.example.com", timeout=10
         )
         self.assertEqual(result.text, "Mock response content")
+
+
+class TestProxyOptions(unittest.TestCase):
+    @patch('requests.Session')
+    def test_per_request_options(self, MockSession):
+        """
+        Tests that per-request options are sent as request headers without
+        changing the session headers.
+        """
+        session_instance = MockSession.return_value
+        session_instance.headers = {}
+        session_instance.get.return_value = Mock(status_code=200)
+
+        proxy = ProxyClient("CHANGEME", "CHANGEME")
+        proxy.get(
+            "https://www.amazon.com/dp/B07FZ8S74R",
+            request_timeout=10,
+            geo_location="Germany",
+            render="html",
+            parse=True,
+        )
+
+        session_instance.get.assert_called_with(
+            "https://www.amazon.com/dp/B07FZ8S74R",
+            timeout=10,
+            headers={
+                "x-oxylabs-render": "html",
+                "x-oxylabs-geo-location": "Germany",
+                "x-oxylabs-parse": "1",
+                "x-oxylabs-parser-type": None,
+            },
+        )
+        self.assertNotIn("x-oxylabs-geo-location", session_instance.headers)
+
+    @patch('requests.Session')
+    def test_session_parse_header(self, MockSession):
+        """
+        Tests that the parser type of a client parsing every request is
+        chosen from the URL of each request.
+        """
+        session_instance = MockSession.return_value
+        session_instance.headers = {}
+        session_instance.get.return_value = Mock(status_code=200)
+
+        proxy = ProxyClient("CHANGEME", "CHANGEME")
+        proxy.add_parse_header(True)
+        self.assertNotIn("x-oxylabs-parser-type", session_instance.headers)
+
+        parser_types = {}
+        for url in (
+            "https://www.amazon.in/dp/B07FZ8S74R",
+            "https://www.google.com/search?q=nike",
+            "https://www.bing.com/search?q=nike",
+            "https://www.example.com/",
+        ):
+            proxy.get(url)
+            headers = session_instance.get.call_args.kwargs["headers"]
+            parser_types[url] = headers["x-oxylabs-parser-type"]
+        self.assertEqual(
+            list(parser_types.values()),
+            [None, None, None, "universal_ecommerce"],
+        )
+
+        proxy.get("https://www.example.com/", parse=False)
+        self.assertEqual(
+            session_instance.get.call_args.kwargs["headers"],
+            {"x-oxylabs-parse": None, "x-oxylabs-parser-type": None},
+        )
+
+    @patch('requests.Session')
+    def test_get_many(self, MockSession):
+        """
+        Tests that get_many returns the responses in the order of the URLs.
+        """
+        session_instance = MockSession.return_value
+        session_instance.get.side_effect = lambda url, **kwargs: Mock(
+            status_code=200, text=url
+        )
+
+        proxy = ProxyClient("CHANGEME", "CHANGEME")
+        urls = [f"https://www.example.com/{i}" for i in range(20)]
+        results = proxy.get_many(urls, max_workers=4, render="html")
+
+        self.assertEqual([r.text for r in results], urls)
+        self.assertEqual(session_instance.get.call_count, 20)
+
+    @patch('requests.Session')
+    def test_profile_sessions(self, MockSession):
+        """
+        Tests that each geo location and user agent profile gets a session
+        of its own, evicting the least recently used one beyond the limit.
+        """
+        MockSession.side_effect = lambda: Mock(headers={})
+
+        proxy = ProxyClient("CHANGEME", "CHANGEME", max_profiles=2)
+        default = proxy._session
+        germany = proxy._session_for("Germany")
+        mobile = proxy._session_for("Germany", "mobile")
+
+        self.assertIs(proxy._session_for(), default)
+        self.assertIsNot(germany, default)
+        self.assertIsNot(mobile, germany)
+        self.assertIs(germany.headers, default.headers)
+
+        proxy.get("https://www.example.com", geo_location="Germany")
+        germany.get.assert_called_once()
+        default.get.assert_not_called()
+
+        # Germany was used last, so the mobile profile is evicted.
+        france = proxy._session_for("France")
+        mobile.close.assert_called_once()
+        self.assertEqual(
+            list(proxy._profiles),
+            [("Germany", None), ("France", None)],
+        )
+
+        proxy.close()
+        for session in (default, germany, france):
+            session.close.assert_called_once()
+
+
+class TestProxyStream(unittest.TestCase):
+    @patch('requests.Session')
+    def test_stream_and_download(self, MockSession):
+        """
+        Tests that stream sends the request lazily with a streamed body and
+        download writes the chunks to a path or buffer.
+        """
+        session_instance = MockSession.return_value
+        session_instance.headers = {}
+        session_instance.get.side_effect = lambda url, **kwargs: Mock(
+            iter_content=Mock(return_value=iter([b"ab", b"cd", b"e"]))
+        )
+
+        proxy = ProxyClient("CHANGEME", "CHANGEME")
+        stream = proxy.stream(
+            "https://example.com/a.png", request_timeout=30, chunk_size=2
+        )
+        session_instance.get.assert_not_called()
+        self.assertEqual(list(stream), [b"ab", b"cd", b"e"])
+        session_instance.get.assert_called_with(
+            "https://example.com/a.png", timeout=30, stream=True
+        )
+        stream.response.iter_content.assert_called_with(2)
+        stream.response.close.assert_called_once()
+        self.assertEqual(stream.stats.bytes, 5)
+
+        buffer = io.BytesIO()
+        stats = proxy.download("https://example.com/a.png", buffer)
+        self.assertEqual(buffer.getvalue(), b"abcde")
+        self.assertEqual(stats.bytes, 5)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "a.png")
+            proxy.download("https://example.com/a.png", path, render="png")
+            with open(path, "rb") as file:
+                self.assertEqual(file.read(), b"abcde")
+
+    @patch('requests.Session')
+    def test_failed_download(self, MockSession):
+        """
+        Tests that a failed download returns None and removes the partially
+        written file.
+        """
+        session_instance = MockSession.return_value
+        session_instance.headers = {}
+        response = Mock()
+        response.raise_for_status.side_effect = requests.HTTPError("502")
+        session_instance.get.return_value = response
+
+        proxy = ProxyClient("CHANGEME", "CHANGEME")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "a.png")
+            self.assertIsNone(proxy.download("https://example.com/", path))
+            self.assertFalse(os.path.exists(path))
+
+
+class TestAsyncProxyClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        """
+        Starts a local server standing in for the proxy endpoint, echoing
+        the requested URL and the Oxylabs headers.
+        """
+
+        self.in_flight = []
+
+        async def handler(request):
+            if self.pool is not None:
+                self.in_flight.append(
+                    sum(c.in_flight for c in self.pool.credentials)
+                )
+            return web.json_response(
+                {
+                    "url": str(request.url),
+                    "geo_location": request.headers.get(
+                        "x-oxylabs-geo-location"
+                    ),
+                    "render": request.headers.get("x-oxylabs-render"),
+                }
+            )
+
+        app = web.Application()
+        app.router.add_route("GET", "/{tail:.*}", handler)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.endpoint = f"127.0.0.1:{port}"
+        self.pool = None
+
+        with patch("oxylabs.proxy.proxy.PROXY_BASE_URL", "127.0.0.1"), patch(
+            "oxylabs.proxy.proxy.PROXY_PORT", port
+        ):
+            self.proxy = AsyncProxyClient("user", "pass", max_concurrency=3)
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_get_with_options(self):
+        """
+        Tests that client headers and per-request options are sent, and
+        that the session is closed once no request is in flight.
+        """
+        self.proxy.add_render_header("html")
+        response = await self.proxy.get(
+            "http://example.test/a", geo_location="Germany"
+        )
+
+        self.assertEqual(
+            await response.json(),
+            {
+                "url": "http://example.test/a",
+                "geo_location": "Germany",
+                "render": "html",
+            },
+        )
+        self.assertIsNone(self.proxy._session)
+
+    async def test_pooled_credentials(self):
+        """
+        Tests that requests waiting for a slot do not hold a pooled
+        credential.
+        """
+        self.pool = CredentialPool([("a", "x"), ("b", "y")])
+        proxy = AsyncProxyClient(
+            credential_pool=self.pool,
+            max_concurrency=2,
+            endpoint=self.endpoint,
+        )
+        urls = [f"http://example.test/{i}" for i in range(8)]
+        responses = await asyncio.gather(*(proxy.get(url) for url in urls))
+
+        self.assertTrue(all(response.status == 200 for response in responses))
+        self.assertEqual(len(self.in_flight), 8)
+        self.assertLessEqual(max(self.in_flight), 2)
+        self.assertEqual([c.in_flight for c in self.pool.credentials], [0, 0])
+
+    async def test_get_many_and_iter_get(self):
+        """
+        Tests that get_many keeps the order of the URLs and iter_get yields
+        every URL while reusing one session.
+        """
+        urls = [f"http://example.test/{i}" for i in range(10)]
+        async with self.proxy:
+            responses = await self.proxy.get_many(urls)
+            session = self.proxy._session
+            seen = set()
+            async for url, response in self.proxy.iter_get(urls):
+                seen.add(url)
+                self.assertEqual(response.status, 200)
+            self.assertIs(self.proxy._session, session)
+
+        self.assertEqual(
+            [(await r.json())["url"] for r in responses], urls
+        )
+        self.assertEqual(seen, set(urls))
+        self.assertTrue(session.closed)
+
+    async def test_stream_and_download(self):
+        """
+        Tests that stream yields the body in chunks and download writes it
+        to a buffer, reporting the transferred bytes.
+        """
+        async with self.proxy:
+            stream = self.proxy.stream("http://example.test/a", chunk_size=8)
+            chunks = [chunk async for chunk in stream]
+            buffer = io.BytesIO()
+            stats = await self.proxy.download("http://example.test/a", buffer)
+
+        body = b"".join(chunks)
+        self.assertEqual(json.loads(body)["url"], "http://example.test/a")
+        self.assertTrue(all(len(chunk) <= 8 for chunk in chunks))
+        self.assertEqual(stream.stats.bytes, len(body))
+        self.assertEqual(buffer.getvalue(), body)
+        self.assertEqual(stats.bytes, len(body))
+        self.assertEqual(self.proxy._requests, 0)
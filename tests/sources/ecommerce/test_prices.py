@@ -0,0 +1,110 @@
+import math
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from oxylabs.sources.ecommerce.prices import normalize_prices
+from oxylabs.sources.ecommerce.response import EcommerceResponse
+
+
+def search(url: str, organic: list, currency: str = None) -> dict:
+    return {
+        "results": [
+            {
+                "url": url,
+                "content_parsed": {
+                    "currency": currency,
+                    "results": {"organic": organic},
+                },
+            }
+        ],
+        "job": {"source": "amazon_search"},
+    }
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestNormalizePrices(unittest.TestCase):
+    def test_search_rows(self):
+        """
+        Tests that numeric and string prices of several domains are
+        normalized into float arrays with ISO currencies and masks.
+        """
+        responses = [
+            EcommerceResponse(
+                search(
+                    "https://www.amazon.de/s?k=tv",
+                    [
+                        {"price": "1.299,99 €", "price_upper": "1.399 €"},
+                        {"price": 12.5, "currency": "EUR"},
+                        {"price": None},
+                        {"price": "10,99 – 12,99 €"},
+                    ],
+                )
+            ),
+            search(
+                "https://www.amazon.com/s?k=tv",
+                [{"price": "$1,299.99"}, {"price": 7}, {"price": "n/a"}],
+                currency="$",
+            ),
+            search("https://www.amazon.ca/s?k=tv", [{"price": "$5.00"}]),
+        ]
+
+        batch = normalize_prices(responses)
+
+        self.assertEqual(len(batch), 8)
+        expected = [1299.99, 12.5, math.nan, 10.99, 1299.99, 7, math.nan, 5]
+        numpy.testing.assert_allclose(batch.price, expected)
+        self.assertEqual(batch.price_upper[0], 1399)
+        self.assertEqual(
+            batch.currency.tolist(),
+            ["EUR"] * 4 + ["USD"] * 3 + ["CAD"],
+        )
+        self.assertEqual(
+            batch.response_index.tolist(), [0] * 4 + [1] * 3 + [2]
+        )
+        self.assertEqual(
+            batch.mask["price"].tolist(),
+            [False, False, True, False, False, False, True, False],
+        )
+        self.assertTrue(batch.mask["price_strikethrough"].all())
+
+    def test_product_rows(self):
+        """
+        Tests that product pages yield one row each.
+        """
+        data = {
+            "results": [
+                {
+                    "url": "https://www.amazon.co.uk/dp/B07FZ8S74R",
+                    "content_parsed": {"price": "£12.00"},
+                }
+            ]
+        }
+        batch = normalize_prices([data], rows="product")
+        self.assertEqual(batch.price.tolist(), [12.0])
+        self.assertEqual(batch.currency.tolist(), ["GBP"])
+
+    def test_missing_amount(self):
+        """
+        Tests that rows whose price strings hold no amount get the currency
+        of the domain.
+        """
+        data = search(
+            "https://www.amazon.de/s?k=tv",
+            [{"price": "N/A"}, {"price": "N/A", "price_upper": "12 $"}],
+        )
+        batch = normalize_prices([data])
+        self.assertTrue(math.isnan(batch.price[0]))
+        self.assertEqual(batch.currency.tolist(), ["EUR", "USD"])
+
+    def test_empty_and_invalid(self):
+        """
+        Tests that an empty batch yields empty arrays and unknown rows are
+        rejected.
+        """
+        self.assertEqual(len(normalize_prices([])), 0)
+        with self.assertRaises(ValueError):
+            normalize_prices([], rows="unknown")
@@ -0,0 +1,131 @@
+import itertools
+import tracemalloc
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from oxylabs import AsyncClient, RealtimeClient
+from oxylabs.sources.ecommerce import EcommerceAsync
+from oxylabs.sources.fanout import Cell, cells, check_axes
+from oxylabs.testing import MockServer
+from oxylabs.utils.defaults import DEFAULT_REQUEST_TIMEOUT_ASYNC
+
+
+class TestFanOut(unittest.TestCase):
+    def test_cells(self):
+        result = list(
+            cells(
+                ["shoes", "boots", "shoes"],
+                geo_locations=["Berlin,Germany", "Berlin,Germany"],
+                domains=["de", "com"],
+            )
+        )
+        self.assertEqual(
+            result,
+            [
+                Cell("shoes", "Berlin,Germany", "de"),
+                Cell("shoes", "Berlin,Germany", "com"),
+                Cell("boots", "Berlin,Germany", "de"),
+                Cell("boots", "Berlin,Germany", "com"),
+            ],
+        )
+        self.assertEqual(
+            result[0].params(),
+            {
+                "query": "shoes",
+                "geo_location": "Berlin,Germany",
+                "domain": "de",
+            },
+        )
+
+        check_axes("google_search", ["Berlin,Germany"], ["de"], ["de-de"])
+        with self.assertRaises(ValueError):
+            check_axes("google_trends_explore", domains=["de"])
+        with self.assertRaises(ValueError):
+            check_axes("google", geo_locations=["Berlin,Germany"])
+
+    def test_bounded_memory(self):
+        """
+        Tests that a matrix of a million cells is generated without holding
+        its cells in memory.
+        """
+        geo_locations = [f"location {i}" for i in range(1000)]
+        queries = (f"query {i}" for i in range(1000))
+        tracemalloc.start()
+        try:
+            count = sum(1 for _ in cells(queries, geo_locations))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(count, 10**6)
+        self.assertLess(peak, 1024**2)
+
+    def test_realtime(self):
+        with MockServer(record=True) as server:
+            client = RealtimeClient(
+                "user", "pass", **server.client_kwargs("realtime")
+            )
+            results = dict(
+                client.fan_out(
+                    "google_search",
+                    ["shoes", "boots"],
+                    geo_locations=["Berlin,Germany", "Paris,France"],
+                    domains=["de", "fr"],
+                    max_workers=4,
+                    parse=True,
+                )
+            )
+
+            consumed = []
+            queries = (
+                consumed.append(i) or f"query {i}" for i in range(10**6)
+            )
+            lazy = client.fan_out("bing_search", queries, max_workers=2)
+            first = [next(lazy) for _ in range(3)]
+            lazy.close()
+
+        self.assertEqual(len(results), 8)
+        response = results[Cell("boots", "Paris,France", "fr")]
+        self.assertEqual(response.job.query, "boots")
+        self.assertEqual(response.job.domain, "fr")
+        self.assertEqual(response.job.geo_location, "Paris,France")
+        self.assertTrue(all(p["parse"] for _, _, p in server.history[:8]))
+        self.assertEqual(len(first), 3)
+        self.assertLessEqual(len(consumed), 8)
+
+
+class TestFanOutAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_push_pull(self):
+        async with MockServer(job_duration=0.02) as server:
+            client = AsyncClient("user", "pass", **server.client_kwargs())
+            results = {
+                cell: response
+                async for cell, response in client.fan_out(
+                    "amazon_search",
+                    itertools.chain(["shoes", "boots"], ["shoes"]),
+                    domains=["de", "com", "co.uk"],
+                    concurrency=2,
+                    poll_interval=0.05,
+                )
+            }
+
+        self.assertEqual(len(results), 6)
+        self.assertEqual(server.counts["submit"], 6)
+        self.assertEqual(
+            results[Cell("shoes", domain="co.uk")].job.domain, "co.uk"
+        )
+        with self.assertRaises(ValueError):
+            async for _ in client.fan_out("wayfair_search", ["sofa"], ["DE"]):
+                pass
+
+    async def test_request_timeout(self):
+        client = AsyncClient("user", "pass")
+        with patch.object(
+            EcommerceAsync, "_get_resp", AsyncMock()
+        ) as get_resp:
+            async for _ in client.fan_out("amazon_search", ["shoes"]):
+                pass
+
+        _, config = get_resp.call_args.args
+        self.assertEqual(
+            config["request_timeout"], DEFAULT_REQUEST_TIMEOUT_ASYNC
+        )
@@ -0,0 +1,154 @@
+import inspect
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from oxylabs import AsyncClient, RealtimeClient
+from oxylabs.sources import registry
+from oxylabs.sources.ecommerce.amazon.response import AmazonProductResponse
+from oxylabs.sources.ecommerce.response import EcommerceResponse
+from oxylabs.sources.serp import SERPAsync
+from oxylabs.sources.serp.google.google import Google, GoogleAsync
+from oxylabs.sources.serp.google.response import GoogleSearchResponse
+from oxylabs.sources.serp.response import SERPResponse
+from oxylabs.testing import MockServer
+from oxylabs.utils.defaults import DEFAULT_REQUEST_TIMEOUT_ASYNC
+
+
+class TestRegistry(unittest.TestCase):
+    def test_generated_methods(self):
+        """
+        Tests that the generated scrape methods keep the signatures of the
+        hand-written ones and build the same payloads.
+        """
+        parameters = list(inspect.signature(Google.scrape_ads).parameters)
+        self.assertEqual(parameters[:3], ["self", "query", "domain"])
+        self.assertEqual(
+            parameters[-3:], ["request_timeout", "parallel_pages", "kwargs"]
+        )
+        self.assertEqual(
+            list(inspect.signature(GoogleAsync.scrape_ads).parameters)[-4:],
+            [
+                "job_completion_timeout",
+                "poll_interval",
+                "parallel_pages",
+                "kwargs",
+            ],
+        )
+        self.assertEqual(
+            list(inspect.signature(GoogleAsync.scrape_url).parameters)[:5],
+            [
+                "self",
+                "url",
+                "request_timeout",
+                "job_completion_timeout",
+                "poll_interval",
+            ],
+        )
+        self.assertEqual(Google.scrape_ads.__qualname__, "Google.scrape_ads")
+        self.assertIn("locale (Optional[str])", Google.scrape_ads.__doc__)
+        self.assertTrue(inspect.iscoroutinefunction(GoogleAsync.scrape_url))
+
+        calls = []
+        client = RealtimeClient("user", "pass")
+        client.serp._get_resp = lambda payload, config: calls.append(
+            (payload, config)
+        )
+        client.serp.google.scrape_images("shoes", "de", pages=2, foo="bar")
+        payload, config = calls[0]
+        self.assertEqual(
+            {k: v for k, v in payload.items() if v is not None},
+            {
+                "source": "google_search",
+                "query": "shoes",
+                "domain": "de",
+                "pages": 2,
+                "context": [{"key": "tbm", "value": "isch"}],
+                "foo": "bar",
+            },
+        )
+        self.assertEqual(config["request_timeout"], 165)
+
+        context = [{"key": "filter", "value": 0}, {"key": "tbm"}]
+        client.serp.google.scrape_images("shoes", context=context)
+        self.assertEqual(
+            calls[1][0]["context"],
+            [{"key": "filter", "value": 0}, {"key": "tbm", "value": "isch"}],
+        )
+        self.assertEqual(context[1], {"key": "tbm"})
+        client.serp.google.scrape_images(
+            "shoes", context=[{"key": "tbm", "value": "nws"}]
+        )
+        self.assertEqual(
+            calls[2][0]["context"], [{"key": "tbm", "value": "nws"}]
+        )
+
+        with self.assertRaises(Exception):
+            client.serp.google.scrape_search(
+                "shoes", parsing_instructions={"title": "invalid"}
+            )
+
+    def test_register(self):
+        spec = registry.get("amazon_product")
+        self.assertEqual(spec.api, "ecommerce")
+        self.assertEqual(spec.response, "AmazonProductResponse")
+        self.assertEqual(
+            registry.get("amazon_search").response, "EcommerceResponse"
+        )
+        self.assertEqual(
+            spec.payload({"query": "B07FZ8S74R", "domain": None}),
+            {"source": "amazon_product", "query": "B07FZ8S74R"},
+        )
+        with self.assertRaises(ValueError):
+            registry.get("missing")
+        with self.assertRaises(ValueError):
+            registry.register("missing", "serp", ("query", "colour"))
+        with self.assertRaises(ValueError):
+            registry.method("universal_ecommerce")
+
+    def test_scrape(self):
+        with MockServer(record=True) as server:
+            client = RealtimeClient(
+                "user", "pass", **server.client_kwargs("realtime")
+            )
+            serp = client.scrape("bing_search", query="shoes", pages=2)
+            ecommerce = client.scrape(
+                "amazon_product", query="B07FZ8S74R", domain=None
+            )
+
+        self.assertIsInstance(serp, SERPResponse)
+        self.assertEqual(len(serp.results), 2)
+        self.assertIsInstance(ecommerce, AmazonProductResponse)
+        self.assertIsInstance(ecommerce, EcommerceResponse)
+        self.assertEqual(
+            server.history[1][2],
+            {"source": "amazon_product", "query": "B07FZ8S74R"},
+        )
+        with self.assertRaises(ValueError):
+            client.scrape("missing", query="shoes")
+
+
+class TestRegistryAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_scrape(self):
+        async with MockServer(job_duration=0.02) as server:
+            client = AsyncClient("user", "pass", **server.client_kwargs())
+            response = await client.scrape(
+                "google_search", query="shoes", poll_interval=0.05
+            )
+
+        self.assertIsInstance(response, GoogleSearchResponse)
+        self.assertIsInstance(response, SERPResponse)
+        self.assertEqual(response.job.query, "shoes")
+
+    async def test_scrape_timeout(self):
+        """
+        Tests that jobs default to the request timeout of the push-pull
+        integration.
+        """
+        client = AsyncClient("user", "pass")
+        with patch.object(SERPAsync, "_get_resp", AsyncMock()) as get_resp:
+            await client.scrape("google_search", query="shoes")
+
+        _, config = get_resp.call_args.args
+        self.assertEqual(
+            config["request_timeout"], DEFAULT_REQUEST_TIMEOUT_ASYNC
+        )
@@ -0,0 +1,107 @@
+import unittest
+
+from oxylabs.sources.ecommerce.amazon.response import AmazonProductResponse
+from oxylabs.sources.ecommerce.response import Content, EcommerceResponse
+from oxylabs.sources.serp.google.response import GoogleSearchResponse
+from oxylabs.sources.serp.response import Result, SERPResponse
+
+
+class TestResponseModels(unittest.TestCase):
+    def test_serp_response_model(self):
+        """
+        Tests that SERPResponse builds nested models, coerces typed fields
+        and falls back to empty models for missing sections.
+        """
+        data = {
+            "results": [
+                {
+                    "page": "2",
+                    "content_parsed": {
+                        "results": {
+                            "organic": [
+                                {
+                                    "pos": 1.0,
+                                    "title": "adidas",
+                                    "desc": 2024,
+                                    "url_shown": 7,
+                                    "sitelinks": {
+                                        "expanded": [{"url": "https://a"}]
+                                    },
+                                }
+                            ],
+                            "paid": None,
+                        }
+                    },
+                }
+            ],
+            "job": {"id": "1", "parse": "true", "_links": [{"rel": "self"}]},
+        }
+
+        response = SERPResponse(data)
+        result = response.results[0]
+        organic = result.content_parsed.results.organic[0]
+
+        self.assertIs(response.raw, data)
+        self.assertEqual(result.page, 2)
+        self.assertEqual(organic.pos, 1)
+        self.assertIsInstance(organic.pos, int)
+        self.assertEqual(organic.desc, "2024")
+        self.assertEqual(organic.url_shown, "7")
+        self.assertEqual(organic.site_links.expanded[0].url, "https://a")
+        self.assertEqual(organic.site_links.inline, [])
+        self.assertEqual(result.content_parsed.results.paid, [])
+        self.assertEqual(result.content_parsed.results.pla.items, [])
+        self.assertIs(response.job.parse, True)
+        self.assertEqual(response.job.links[0].rel, "self")
+        self.assertFalse(hasattr(organic, "__dict__"))
+
+    def test_empty_response_model(self):
+        """
+        Tests that a missing response builds an empty model.
+        """
+        response = EcommerceResponse(None)
+
+        self.assertEqual(response.raw, {})
+        self.assertEqual(response.results, [])
+        self.assertIsNone(response.job.id)
+
+    def test_per_source_response_model(self):
+        """
+        Tests that per-source models keep uncoercible values as they are.
+        """
+        response = AmazonProductResponse(
+            {"results": [{"content_parsed": {"price": 10, "rating": "n/a"}}]}
+        )
+        product = response.results[0].content_parsed
+
+        self.assertIsInstance(response, EcommerceResponse)
+        self.assertEqual(product.price, 10.0)
+        self.assertIsInstance(product.price, float)
+        self.assertEqual(product.rating, "n/a")
+        self.assertEqual(product.category, [])
+
+    def test_per_source_models_extend_generic(self):
+        """
+        Tests that per-source models keep every field of the generic models
+        they are returned in place of.
+        """
+        search = GoogleSearchResponse(
+            {"results": [{"content_parsed": {"results": {}}}]}
+        )
+        product = AmazonProductResponse(
+            {"results": [{"content_parsed": {"max_quantity": "3"}}]}
+        )
+        result = search.results[0].content_parsed.results
+        content = product.results[0].content_parsed
+
+        self.assertIsInstance(result, Result)
+        self.assertEqual(result.popular_products, [])
+        self.assertEqual(result.twitter.items, [])
+        self.assertEqual(result.hotels.results, [])
+        self.assertIsInstance(content, Content)
+        self.assertEqual(content.max_quantity, 3)
+        self.assertEqual(content.pricing, [])
+        self.assertEqual(content.specifications.items, [])
+        self.assertIsNone(content.errors)
+        for field in ("warnings", "top_review", "lightning_deal", "variants"):
+            self.assertTrue(hasattr(content, field))
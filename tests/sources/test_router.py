@@ -0,0 +1,93 @@
+import unittest
+from unittest.mock import Mock
+
+from oxylabs.sources.ecommerce import Ecommerce
+from oxylabs.sources.router import Route, route_url, route_urls
+
+
+class TestRouter(unittest.TestCase):
+    def test_route_urls(self):
+        """
+        Tests that URLs of dedicated sources are routed with the parameters
+        extracted from them and other URLs stay universal.
+        """
+        urls = [
+            "https://www.amazon.de/Echo-Dot/dp/B07FZ8S74R/ref=sr_1_1",
+            "https://www.amazon.co.uk/s?k=echo",
+            "https://www.google.com/search?q=nike&tbm=shop",
+            "https://shopping.google.com/?q=nike",
+            "https://www.google.fr/shopping/product/5069837012853468127",
+            "https://www.google.com/search?q=nike",
+            "https://www.bing.com/search?q=nike",
+            "https://www.wayfair.com/furniture/sb0/sofas-c413892.html",
+            "https://www.example.com/dp/B07FZ8S74R",
+        ]
+
+        routes = route_urls(urls)
+
+        self.assertEqual(
+            routes[0],
+            Route("amazon_product", {"query": "B07FZ8S74R", "domain": "de"}),
+        )
+        self.assertEqual(
+            routes[4],
+            Route(
+                "google_shopping_product",
+                {"query": "5069837012853468127", "domain": "fr"},
+            ),
+        )
+        self.assertEqual(
+            [route.source for route in routes],
+            [
+                "amazon_product",
+                "amazon",
+                "google_shopping",
+                "google_shopping",
+                "google_shopping_product",
+                "universal_ecommerce",
+                "bing",
+                "wayfair",
+                "universal_ecommerce",
+            ],
+        )
+        self.assertEqual(routes[-1].params, {"url": urls[-1]})
+
+        for tld in ("in", "sa", "sg", "com.be", "eg"):
+            self.assertEqual(
+                route_url(f"https://www.amazon.{tld}/dp/B07FZ8S74R"),
+                Route(
+                    "amazon_product", {"query": "B07FZ8S74R", "domain": tld}
+                ),
+            )
+
+    def test_unsupported_params(self):
+        """
+        Tests that a URL stays universal when its dedicated source doesn't
+        accept one of the parameters.
+        """
+        url = "https://www.wayfair.com/furniture/sb0/sofas-c413892.html"
+        self.assertEqual(route_url(url, render=None).source, "wayfair")
+        self.assertEqual(
+            route_url(url, render="html").source, "universal_ecommerce"
+        )
+
+    def test_scrape_url_route(self):
+        """
+        Tests that Universal.scrape_url sends routed URLs to the dedicated
+        source only when routing is enabled.
+        """
+        ecommerce = Ecommerce(Mock())
+        ecommerce._get_resp = Mock()
+        url = "https://www.amazon.de/dp/B07FZ8S74R"
+
+        ecommerce.universal.scrape_url(url, parse=True, route=True)
+        payload = ecommerce._get_resp.call_args[0][0]
+        self.assertEqual(payload["source"], "amazon_product")
+        self.assertEqual(payload["query"], "B07FZ8S74R")
+        self.assertEqual(payload["domain"], "de")
+        self.assertNotIn("url", payload)
+
+        ecommerce.universal.scrape_url(url, parse=True)
+        payload = ecommerce._get_resp.call_args[0][0]
+        self.assertEqual(payload["source"], "universal_ecommerce")
+        self.assertEqual(payload["url"], url)
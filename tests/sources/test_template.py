@@ -0,0 +1,199 @@
+import json
+import unittest
+
+from oxylabs import AsyncClient, PayloadTemplate, RealtimeClient
+from oxylabs.sources import registry
+from oxylabs.sources.template import Payload, request_body
+from oxylabs.testing import MockServer
+
+
+class TestPayloadTemplate(unittest.TestCase):
+    def test_stamp(self):
+        template = PayloadTemplate(
+            "google_search", domain="de", pages=2, locale=None
+        )
+        self.assertEqual(
+            template.common,
+            {"source": "google_search", "domain": "de", "pages": 2},
+        )
+
+        payload = template.stamp(query='"shoes" ünd boots', start_page=None)
+        self.assertIsInstance(payload, Payload)
+        self.assertEqual(
+            payload,
+            {
+                "source": "google_search",
+                "domain": "de",
+                "pages": 2,
+                "query": '"shoes" ünd boots',
+            },
+        )
+        self.assertEqual(json.loads(payload.body), payload)
+        self.assertEqual(
+            template.encode(query='"shoes" ünd boots'), payload.body
+        )
+        self.assertEqual(request_body(payload), {"data": payload.body})
+        self.assertEqual(request_body({"a": 1}), {"json": {"a": 1}})
+
+        # Fields overriding shared parameters are not encoded twice.
+        body = template.encode(query="shoes", domain="com")
+        self.assertEqual(body.count(b'"domain"'), 1)
+        self.assertEqual(json.loads(body)["domain"], "com")
+        self.assertEqual(json.loads(PayloadTemplate().encode()), {})
+
+        with self.assertRaises(Exception):
+            PayloadTemplate(
+                "google_search", parsing_instructions={"title": "invalid"}
+            )
+        with self.assertRaises(Exception):
+            template.stamp(
+                query="shoes", parsing_instructions={"title": "invalid"}
+            )
+
+    def test_context(self):
+        """
+        Tests that the context of a job is merged into the context of the
+        template, including the default entries of its source.
+        """
+        template = PayloadTemplate(
+            registry.GOOGLE_IMAGES_SEARCH,
+            context=[{"key": "filter", "value": 1}],
+        )
+        payload = template.stamp(
+            query="shoes", context=[{"key": "nfpr", "value": True}]
+        )
+
+        self.assertEqual(payload["source"], "google_search")
+        self.assertEqual(
+            payload["context"],
+            [
+                {"key": "nfpr", "value": True},
+                {"key": "filter", "value": 1},
+                {"key": "tbm", "value": "isch"},
+            ],
+        )
+        self.assertEqual(json.loads(payload.body), payload)
+
+        # Jobs stamping their own source get its context the same way.
+        template = PayloadTemplate(context=[{"key": "filter", "value": 1}])
+        payload = template.stamp(
+            source="google_search",
+            query="shoes",
+            context=[{"key": "filter", "value": 0}],
+        )
+        self.assertEqual(payload["context"], [{"key": "filter", "value": 0}])
+
+    def test_unknown_fields(self):
+        template = PayloadTemplate("google_search")
+        with self.assertRaises(ValueError):
+            template.stamp(query="shoes", bogus_typo=1)
+        with self.assertRaises(ValueError):
+            template.stamp(source="bing_search", query="shoes")
+        with self.assertRaises(ValueError):
+            PayloadTemplate().stamp(source="google_search", bogus_typo=1)
+        with self.assertRaises(ValueError):
+            PayloadTemplate("google_search", bogus_typo=1)
+        self.assertEqual(
+            template.stamp(source="google_search", query="shoes"),
+            {"source": "google_search", "query": "shoes"},
+        )
+
+    def test_many(self):
+        with MockServer(record=True) as server:
+            client = RealtimeClient(
+                "user", "pass", **server.client_kwargs("realtime")
+            )
+            responses = client.serp.google.scrape_search_many(
+                ["shoes", {"query": "boots", "domain": "com"}],
+                domain="de",
+                parse=True,
+            )
+
+        self.assertEqual(
+            [response.job.query for response in responses],
+            ["shoes", "boots"],
+        )
+        self.assertEqual(
+            sorted(
+                (payload["query"], payload["domain"])
+                for _, _, payload in server.history
+            ),
+            [("boots", "com"), ("shoes", "de")],
+        )
+        for _, _, payload in server.history:
+            self.assertEqual(payload["source"], "google_search")
+            self.assertTrue(payload["parse"])
+
+    def test_many_variant(self):
+        """
+        Tests that batches of a variant send its context entries.
+        """
+        with MockServer(record=True) as server:
+            client = RealtimeClient(
+                "user", "pass", **server.client_kwargs("realtime")
+            )
+            client.serp.google.scrape_images_many(
+                ["shoes", {"query": "boots", "foo": "bar"}],
+                context=[{"key": "filter", "value": 1}],
+            )
+
+        for _, _, payload in server.history:
+            self.assertEqual(payload["source"], "google_search")
+            self.assertEqual(
+                payload["context"],
+                [
+                    {"key": "filter", "value": 1},
+                    {"key": "tbm", "value": "isch"},
+                ],
+            )
+        self.assertEqual(
+            sorted(payload.get("foo", "") for _, _, payload in server.history),
+            ["", "bar"],
+        )
+
+    def test_fan_out(self):
+        with MockServer(record=True) as server:
+            client = RealtimeClient(
+                "user", "pass", **server.client_kwargs("realtime")
+            )
+            results = dict(
+                client.fan_out(
+                    "google_search",
+                    ["shoes"],
+                    domains=["de", "com"],
+                    pages=1,
+                )
+            )
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(
+            sorted(payload["domain"] for _, _, payload in server.history),
+            ["com", "de"],
+        )
+
+
+class TestPayloadTemplateAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_fan_out(self):
+        async with MockServer(job_duration=0.02, record=True) as server:
+            client = AsyncClient("user", "pass", **server.client_kwargs())
+            results = [
+                cell
+                async for cell, _ in client.fan_out(
+                    "bing_search",
+                    ["shoes", "boots"],
+                    poll_interval=0.05,
+                )
+            ]
+
+        self.assertEqual(
+            sorted(cell.query for cell in results), ["boots", "shoes"]
+        )
+        submitted = [
+            payload
+            for endpoint, _, payload in server.history
+            if endpoint == "submit"
+        ]
+        self.assertEqual(
+            sorted(payload["query"] for payload in submitted),
+            ["boots", "shoes"],
+        )
@@ -0,0 +1,229 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from oxylabs.cli import (
+    Checkpoint,
+    InvalidInput,
+    JsonlWriter,
+    main,
+    read_inputs,
+)
+from oxylabs.testing import MockServer
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+def run(server: MockServer, *args: str) -> int:
+    with contextlib.redirect_stderr(io.StringIO()):
+        return main(
+            [
+                "run",
+                "--username",
+                "user",
+                "--password",
+                "pass",
+                "--base-url",
+                server.push_pull_url,
+                "--poll-interval",
+                "0.01",
+                "--progress",
+                "0",
+                *args,
+            ]
+        )
+
+
+class TestCLI(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = tmp.name
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.tmp, name)
+
+    def test_read_inputs(self):
+        with open(self.path("queries.csv"), "w") as file:
+            file.write('query,pages,parse,context\n123,2,true,"[]"\nabc,,,\n')
+        with open(self.path("queries.jsonl"), "w") as file:
+            file.write(
+                '"shoes"\n\n{"url": "https://example.com", "x": null}\n'
+            )
+
+        self.assertEqual(
+            list(read_inputs(self.path("queries.csv"))),
+            [
+                {"query": "123", "pages": 2, "parse": True, "context": []},
+                {"query": "abc"},
+            ],
+        )
+        self.assertEqual(
+            list(read_inputs(self.path("queries.jsonl"))),
+            [{"query": "shoes"}, {"url": "https://example.com"}],
+        )
+
+    def test_invalid_inputs(self):
+        """
+        Tests that inputs that cannot be read fail their own job only.
+        """
+        with open(self.path("queries.csv"), "w") as file:
+            file.write("query,pages\nshoes,two\nboots,1\n")
+        with open(self.path("queries.jsonl"), "w") as file:
+            file.write('[1]\n{"query": \n"shoes"\n')
+
+        rows = list(read_inputs(self.path("queries.csv")))
+        self.assertIsInstance(rows[0], InvalidInput)
+        self.assertIsInstance(rows[0].error, ValueError)
+        self.assertEqual(rows[1], {"query": "boots", "pages": 1})
+        lines = list(read_inputs(self.path("queries.jsonl")))
+        self.assertEqual(
+            [type(line) for line in lines[:2]], [InvalidInput] * 2
+        )
+        self.assertEqual(lines[2], {"query": "shoes"})
+
+        for name, index in (("queries.csv", 1), ("queries.jsonl", 2)):
+            with MockServer() as server:
+                code = run(
+                    server,
+                    "--source",
+                    "google_search",
+                    "--input",
+                    self.path(name),
+                    "--out",
+                    self.path(f"{name}.out.jsonl"),
+                )
+            self.assertEqual(code, 1)
+            self.assertEqual(server.counts["submit"], 1)
+            with open(self.path(f"{name}.out.jsonl")) as file:
+                (record,) = [json.loads(line) for line in file]
+            self.assertEqual(record["index"], index)
+
+    def test_run_and_resume(self):
+        """
+        Tests that a rerun submits only the jobs that failed, and that every
+        input ends up in the output once.
+        """
+        with open(self.path("queries.jsonl"), "w") as file:
+            for i in range(20):
+                file.write(json.dumps({"query": f"query {i}"}) + "\n")
+        args = (
+            "--source",
+            "google_search",
+            "--input",
+            self.path("queries.jsonl"),
+            "--out",
+            self.path("results.jsonl"),
+            "--concurrency",
+            "4",
+            "-p",
+            "parse=true",
+        )
+
+        with MockServer(errors={500: 0.3}, seed=3) as server:
+            self.assertEqual(run(server, *args), 1)
+        failed = server.counts[500]
+        self.assertGreater(failed, 0)
+        with MockServer() as server:
+            self.assertEqual(run(server, *args), 0)
+        self.assertEqual(server.counts["submit"], failed)
+
+        with open(self.path("results.jsonl")) as file:
+            records = [json.loads(line) for line in file]
+        self.assertEqual(
+            sorted(record["index"] for record in records), list(range(20))
+        )
+        record = records[0]
+        self.assertEqual(
+            record["input"], {"query": f"query {record['index']}"}
+        )
+        self.assertEqual(record["response"]["job"]["source"], "google_search")
+        self.assertTrue(record["response"]["job"]["parse"])
+
+    def test_checkpoint_recovery(self):
+        """
+        Tests that results written after the last flush are dropped on
+        resume, along with their part of the output.
+        """
+        checkpoint = Checkpoint(self.path("results.checkpoint"))
+        writer = JsonlWriter(self.path("results.jsonl"), checkpoint.position)
+        writer.write(0, {"index": 0})
+        checkpoint.commit(*writer.flush())
+        writer.write(1, {"index": 1})
+        writer.flush()
+        checkpoint._file.write(b"1\n")
+        checkpoint.close()
+        writer.close()
+
+        checkpoint = Checkpoint(self.path("results.checkpoint"))
+        writer = JsonlWriter(self.path("results.jsonl"), checkpoint.position)
+        writer.write(2, {"index": 2})
+        checkpoint.commit(*writer.flush())
+        checkpoint.close()
+        writer.close()
+
+        self.assertEqual(checkpoint.done, {0, 2})
+        with open(self.path("results.jsonl")) as file:
+            self.assertEqual(file.read(), '{"index": 0}\n{"index": 2}\n')
+        with open(self.path("results.checkpoint")) as file:
+            self.assertEqual(file.read(), "0\n@13\n2\n@26\n")
+
+    def test_processes(self):
+        """
+        Tests that sharded runs write every result once and aggregate the
+        metrics of their workers.
+        """
+        with open(self.path("queries.jsonl"), "w") as file:
+            file.write("".join(f'"query {i}"\n' for i in range(30)))
+        with MockServer() as server:
+            code = run(
+                server,
+                "--source",
+                "google_search",
+                "--input",
+                self.path("queries.jsonl"),
+                "--out",
+                self.path("results.jsonl"),
+                "--processes",
+                "2",
+                "--metrics",
+                self.path("metrics.prom"),
+            )
+        self.assertEqual(code, 0)
+        with open(self.path("results.jsonl")) as file:
+            indices = sorted(json.loads(line)["index"] for line in file)
+        self.assertEqual(indices, list(range(30)))
+        with open(self.path("metrics.prom")) as file:
+            self.assertIn(
+                'oxylabs_requests_total{integration="push_pull",'
+                'source="google_search",outcome="ok"} 30',
+                file.read(),
+            )
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_parquet(self):
+        with open(self.path("queries.csv"), "w") as file:
+            file.write("query\n" + "".join(f"q{i}\n" for i in range(5)))
+        with MockServer() as server:
+            code = run(
+                server,
+                "--source",
+                "google_search",
+                "--input",
+                self.path("queries.csv"),
+                "--out",
+                self.path("results.parquet"),
+                "--parquet-rows",
+                "2",
+            )
+        self.assertEqual(code, 0)
+        table = pyarrow.parquet.read_table(self.path("results.parquet"))
+        self.assertEqual(
+            sorted(table.column("index").to_pylist()), [0, 1, 2, 3, 4]
+        )
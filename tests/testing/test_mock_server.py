@@ -0,0 +1,115 @@
+import unittest
+
+import aiohttp
+
+from oxylabs import AsyncClient, AsyncProxyClient, ProxyClient, RealtimeClient
+from oxylabs.testing import MockServer, html_fixture
+
+
+class TestMockServerSync(unittest.TestCase):
+    def test_realtime_and_proxy(self):
+        """
+        Tests that the realtime and proxy clients go through their real I/O
+        paths against the mock server.
+        """
+        with MockServer(fixture=html_fixture(1024), record=True) as server:
+            client = RealtimeClient(
+                "user", "pass", **server.client_kwargs("realtime")
+            )
+            response = client.ecommerce.universal.scrape_url(
+                "https://www.example.com", pages=2
+            )
+            parsed = client.ecommerce.universal.scrape_url(
+                "https://www.example.com", parse=True
+            )
+
+            proxy = ProxyClient(
+                "user", "pass", **server.client_kwargs("proxy")
+            )
+            result = proxy.get("http://www.example.com/", render="html")
+
+        self.assertEqual([r.page for r in response.results], [1, 2])
+        self.assertIn("<html>", response.results[0].content)
+        self.assertEqual(response.job.status, "done")
+        self.assertEqual(
+            len(parsed.raw["results"][0]["content"]["results"]["organic"]), 48
+        )
+        self.assertEqual(result.status_code, 200)
+        self.assertGreater(len(result.text), 900)
+
+        endpoint, headers, payload = server.history[0]
+        self.assertEqual(endpoint, "realtime")
+        self.assertTrue(headers["Authorization"].startswith("Basic "))
+        self.assertEqual(payload["source"], "universal_ecommerce")
+        self.assertEqual(server.history[-1][1]["x-oxylabs-render"], "html")
+
+    def test_error_injection(self):
+        """
+        Tests that injected errors are returned to the clients.
+        """
+        with MockServer(errors={429: 1.0}) as server:
+            client = RealtimeClient(
+                "user", "pass", **server.client_kwargs("realtime")
+            )
+            self.assertIsNone(client._req({}, "POST", {"request_timeout": 5}))
+            proxy = ProxyClient(
+                "user", "pass", **server.client_kwargs("proxy")
+            )
+            self.assertIsNone(proxy.get("http://www.example.com/"))
+        self.assertEqual(server.counts[429], 2)
+
+
+class TestMockServerAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_push_pull(self):
+        """
+        Tests that push-pull jobs are submitted, polled until done and
+        fetched.
+        """
+        async with MockServer(job_duration=0.05) as server:
+            client = AsyncClient("user", "pass", **server.client_kwargs())
+            response = await client.ecommerce.universal.scrape_url(
+                "https://www.example.com", poll_interval=0.02
+            )
+
+        self.assertEqual(response.job.status, "done")
+        self.assertEqual(len(response.results), 1)
+        self.assertGreater(server.counts["status"], 1)
+        self.assertEqual(server.counts["results"], 1)
+
+    async def test_faulted_job_and_batch(self):
+        """
+        Tests that faulted jobs fail and that batches submit one job per URL.
+        """
+        async with MockServer(job_fault_rate=1.0) as server:
+            client = AsyncClient("user", "pass", **server.client_kwargs())
+            response = await client.ecommerce.universal.scrape_url(
+                "https://www.example.com", poll_interval=0
+            )
+            self.assertEqual(len(response.results), 0)
+            self.assertEqual(server.counts["results"], 1)
+
+            async with aiohttp.ClientSession() as session:
+                async with session.post(
+                    f"{server.push_pull_url}/batch",
+                    json={
+                        "url": ["http://a", "http://b"],
+                        "source": "universal",
+                    },
+                ) as batch:
+                    jobs = (await batch.json())["queries"]
+
+        self.assertEqual(
+            [job["url"] for job in jobs], ["http://a", "http://b"]
+        )
+        self.assertEqual({job["source"] for job in jobs}, {"universal"})
+
+    async def test_async_proxy(self):
+        async with MockServer() as server:
+            async with AsyncProxyClient(
+                "user", "pass", **server.client_kwargs("proxy")
+            ) as proxy:
+                responses = await proxy.get_many(
+                    [f"http://www.example.com/{i}" for i in range(5)]
+                )
+        self.assertTrue(all(r.status == 200 for r in responses))
+        self.assertEqual(server.counts["proxy"], 5)
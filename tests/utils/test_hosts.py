@@ -0,0 +1,53 @@
+import unittest
+
+from oxylabs.utils.hosts import HostIndex, HostMatch, classify_url
+
+
+class TestHostIndex(unittest.TestCase):
+    def test_classify_url(self):
+        """
+        Tests that hosts of dedicated sources are matched with their domain,
+        including subdomains, and other hosts are left to the universal
+        source.
+        """
+        self.assertEqual(
+            classify_url("https://www.amazon.co.uk/dp/B07FZ8S74R"),
+            HostMatch("amazon", "co.uk"),
+        )
+        self.assertEqual(
+            classify_url("http://WWW.Google.COM:443/search?q=nike"),
+            HostMatch("google", "com"),
+        )
+        self.assertEqual(
+            classify_url("https://smile.amazon.de/"),
+            HostMatch("amazon", "de"),
+        )
+        for tld in ("in", "sa", "sg", "com.be", "eg"):
+            self.assertEqual(
+                classify_url(f"https://www.amazon.{tld}/dp/B07FZ8S74R"),
+                HostMatch("amazon", tld),
+            )
+        for url in (
+            "https://www.example.com/",
+            "https://lh3.googleusercontent.com/a.png",
+            "https://amazon.de.example.com/",
+            "https://co.uk/",
+            "",
+            None,
+        ):
+            self.assertIsNone(classify_url(url), url)
+
+    def test_longest_suffix_wins(self):
+        """
+        Tests that the longest registered suffix of a host is matched.
+        """
+        index = HostIndex()
+        index.add("google.com", HostMatch("google", "com"))
+        index.add("shopping.google.com", HostMatch("google_shopping", "com"))
+
+        self.assertEqual(index.match("google.com").source, "google")
+        self.assertEqual(index.match("www.google.com").source, "google")
+        self.assertEqual(
+            index.match("shopping.google.com.").source, "google_shopping"
+        )
+        self.assertIsNone(index.match("com"))
@@ -0,0 +1,138 @@
+import json
+import threading
+import unittest
+
+from oxylabs import RealtimeClient
+from oxylabs.sources.ecommerce.response import EcommerceResponse
+from oxylabs.testing import MockServer
+from oxylabs.utils.intern import InternPool, current_pool
+from oxylabs.utils.schema import Field
+
+BODY = json.dumps(
+    {
+        "results": [
+            {
+                "parser_type": "amazon_search",
+                "content_parsed": {
+                    "currency": "EUR",
+                    "category": [
+                        {"ladder": [{"url": "/e", "name": "Electronics"}]}
+                    ],
+                },
+            }
+        ],
+        "job": {"source": "amazon_search", "status": "done"},
+    }
+)
+
+
+class TestInternPool(unittest.TestCase):
+    def test_interns_flagged_fields(self):
+        """
+        Tests that equal strings of flagged fields are shared across
+        responses, both on the models and in their raw data.
+        """
+        pool = InternPool()
+        with pool:
+            first, second = (
+                EcommerceResponse(json.loads(BODY)) for _ in range(2)
+            )
+
+        self.assertIs(first.job.status, second.job.status)
+        self.assertIs(first.raw["job"]["status"], second.job.status)
+        content = (
+            first.results[0].content_parsed,
+            second.results[0].content_parsed,
+        )
+        self.assertIs(content[0].currency, content[1].currency)
+        self.assertIs(
+            content[0].category[0].ladder[0]["name"],
+            content[1].category[0].ladder[0]["name"],
+        )
+        self.assertIsNone(current_pool())
+
+    def test_inactive_pool(self):
+        """
+        Tests that strings are left alone when no pool is active.
+        """
+        first, second = (EcommerceResponse(json.loads(BODY)) for _ in range(2))
+        self.assertEqual(first.job.status, second.job.status)
+        self.assertIsNot(first.job.status, second.job.status)
+
+    def test_nested_pools(self):
+        """
+        Tests that the innermost active pool is used and the outer one is
+        restored on exit.
+        """
+        outer, inner = InternPool(), InternPool()
+        with outer:
+            with inner:
+                EcommerceResponse(json.loads(BODY))
+            self.assertIs(current_pool(), outer)
+        self.assertGreater(len(inner), 0)
+        self.assertEqual(len(outer), 0)
+
+    def test_shared_across_threads(self):
+        """
+        Tests that threads entering the same pool each restore their own
+        pool on exit, whatever order they exit in.
+        """
+        pool, outer = InternPool(), InternPool()
+        first_in, second_in, first_out = (threading.Event() for _ in range(3))
+        restored = {}
+
+        def first():
+            with pool:
+                first_in.set()
+                second_in.wait(5)
+            restored["first"] = current_pool()
+            first_out.set()
+
+        def second():
+            first_in.wait(5)
+            with outer:
+                with pool:
+                    second_in.set()
+                    first_out.wait(5)
+                    restored["inner"] = current_pool()
+                restored["second"] = current_pool()
+
+        threads = [threading.Thread(target=f) for f in (first, second)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(
+            restored, {"first": None, "inner": pool, "second": outer}
+        )
+
+    def test_client_batch(self):
+        """
+        Tests that a pool scoped to a client is shared by the parallel calls
+        of a batch.
+        """
+        pool = InternPool()
+        specs = [
+            {"source": "amazon_search", "query": f"query {i}"}
+            for i in range(400)
+        ]
+        with MockServer() as server:
+            client = RealtimeClient(
+                "user",
+                "pass",
+                intern_pool=pool,
+                **server.client_kwargs("realtime"),
+            )
+            responses = client.map(specs, max_workers=16)
+
+        self.assertEqual(len(responses), 400)
+        self.assertIs(responses[0].job.status, responses[-1].job.status)
+        self.assertIsNone(current_pool())
+
+    def test_invalid_field(self):
+        """
+        Tests that only fields holding strings can be interned.
+        """
+        with self.assertRaises(TypeError):
+            Field(int, intern=True)
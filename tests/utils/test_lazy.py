@@ -0,0 +1,48 @@
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+from oxylabs.utils.lazy import LazyModule
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_is_lazy(self):
+        """
+        Tests that importing the package and creating a realtime client does
+        not import the HTTP libraries or the source modules.
+        """
+        code = (
+            "import sys\n"
+            "from oxylabs import RealtimeClient\n"
+            "client = RealtimeClient('user', 'pass')\n"
+            "print(sorted(m for m in ('aiohttp', 'requests', 'asyncio', "
+            "'oxylabs.sources.serp.serp') if m in sys.modules))\n"
+            "client.serp\n"
+            "print('oxylabs.sources.serp.serp' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.split("\n")[:2], ["[]", "True"])
+
+    def test_lazy_module(self):
+        """
+        Tests that a lazy module imports on first use and sees patches of
+        the real module.
+        """
+        module = LazyModule("json")
+        self.assertIn("not loaded", repr(module))
+        self.assertEqual(module.loads("[1]"), [1])
+        with patch("json.loads", return_value="patched"):
+            self.assertEqual(module.loads("[1]"), "patched")
+        self.assertEqual(module.loads("[1]"), [1])
+
+        import oxylabs
+
+        with self.assertRaises(AttributeError):
+            oxylabs.Missing
+        self.assertIn("RealtimeClient", dir(oxylabs))
@@ -0,0 +1,70 @@
+import logging
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+from oxylabs.utils.log import Body, RateLimitedLogger
+
+
+class TestLogging(unittest.TestCase):
+    def test_body_truncation(self):
+        self.assertEqual(str(Body("short")), "short")
+        self.assertEqual(str(Body(None)), "<empty>")
+        self.assertEqual(
+            str(Body(b"x" * 5000, limit=4)), "xxxx... (5000 bytes, truncated)"
+        )
+
+    def test_rate_limit(self):
+        """
+        Tests that repeated events are suppressed beyond the burst and that
+        the next message reports how many were.
+        """
+        logger = RateLimitedLogger("oxylabs.test", burst=2, interval=60)
+        with self.assertLogs("oxylabs.test", "ERROR") as logs:
+            for i in range(5):
+                logger.error("http_error", "HTTP error %s", i, source="amazon")
+            logger.error("timeout", "Timed out")
+            with patch("time.monotonic", return_value=1e12):
+                logger.error("http_error", "HTTP error %s", 5)
+
+        self.assertEqual(
+            logs.output,
+            [
+                "ERROR:oxylabs.test:HTTP error 0 source=amazon",
+                "ERROR:oxylabs.test:HTTP error 1 source=amazon",
+                "ERROR:oxylabs.test:Timed out",
+                "ERROR:oxylabs.test:HTTP error 5 suppressed=3",
+            ],
+        )
+        self.assertEqual(logs.records[0].oxylabs_event, "http_error")
+        self.assertEqual(logs.records[0].oxylabs_fields, {"source": "amazon"})
+
+    def test_lazy_formatting(self):
+        """
+        Tests that disabled messages are neither counted nor formatted.
+        """
+        logger = RateLimitedLogger("oxylabs.test.lazy", burst=1)
+        logger.logger.setLevel(logging.CRITICAL)
+        with patch.object(Body, "__str__") as format_body:
+            logger.error("http_error", "HTTP error", body=Body("text"))
+        format_body.assert_not_called()
+        self.assertEqual(logger._windows, {})
+
+    def test_import_leaves_logging_alone(self):
+        code = (
+            "import logging\n"
+            "from oxylabs import AsyncClient, ProxyClient, RealtimeClient\n"
+            "RealtimeClient('user', 'pass').serp\n"
+            "AsyncClient('user', 'pass').ecommerce\n"
+            "ProxyClient('user', 'pass')\n"
+            "root = logging.getLogger()\n"
+            "print(len(root.handlers), logging.getLevelName(root.level))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "0 WARNING")
@@ -0,0 +1,180 @@
+import pickle
+import unittest
+from unittest.mock import Mock, patch
+
+from oxylabs import AsyncClient, MetricsRegistry, RealtimeClient
+from oxylabs.testing import MockServer
+from oxylabs.utils.metrics import Histogram
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_prometheus_text(self):
+        """
+        Tests that counters and histograms are exposed in the Prometheus text
+        format with cumulative buckets.
+        """
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests.", ("source",))
+        latency = registry.histogram(
+            "latency_seconds", "Latency.", ("source",), buckets=(0.1, 1)
+        )
+        requests.inc("amazon")
+        requests.inc("amazon", amount=2)
+        for value in (0.05, 0.5, 5):
+            latency.observe(value, 'a"b')
+
+        self.assertIs(
+            registry.counter("requests_total", "Requests."), requests
+        )
+        self.assertEqual(requests.get("amazon"), 3)
+        self.assertEqual(latency.count('a"b'), 3)
+        self.assertEqual(
+            registry.to_prometheus(),
+            "# HELP requests_total Requests.\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{source="amazon"} 3\n'
+            "# HELP latency_seconds Latency.\n"
+            "# TYPE latency_seconds histogram\n"
+            'latency_seconds_bucket{source="a\\"b",le="0.1"} 1\n'
+            'latency_seconds_bucket{source="a\\"b",le="1"} 2\n'
+            'latency_seconds_bucket{source="a\\"b",le="+Inf"} 3\n'
+            'latency_seconds_sum{source="a\\"b"} 5.55\n'
+            'latency_seconds_count{source="a\\"b"} 3\n',
+        )
+
+    def test_invalid(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests.", ("source",))
+        with self.assertRaises(ValueError):
+            requests.inc("amazon", "extra")
+        with self.assertRaises(ValueError):
+            registry.histogram("requests_total", "Requests.")
+        self.assertIsInstance(
+            registry.histogram("latency_seconds", "Latency."), Histogram
+        )
+
+    def test_merge(self):
+        """
+        Tests that registries pickled in other processes are merged into
+        one.
+        """
+        shards = []
+        for source in ("amazon", "amazon", "bing"):
+            registry = MetricsRegistry()
+            registry.counter("requests_total", "Requests.", ("source",)).inc(
+                source
+            )
+            registry.histogram("latency_seconds", "Latency.").observe(0.2)
+            shards.append(pickle.loads(pickle.dumps(registry)))
+
+        merged = MetricsRegistry()
+        for registry in shards:
+            merged.merge(registry)
+        self.assertEqual(merged["requests_total"].get("amazon"), 2)
+        self.assertEqual(merged["requests_total"].get("bing"), 1)
+        self.assertEqual(merged["latency_seconds"].count(), 3)
+        self.assertAlmostEqual(merged["latency_seconds"].sum(), 0.6)
+
+        other = MetricsRegistry()
+        other.histogram("latency_seconds", "Latency.", buckets=(1,))
+        with self.assertRaises(ValueError):
+            merged.merge(other)
+
+
+class TestClientMetrics(unittest.IsolatedAsyncioTestCase):
+    def test_realtime(self):
+        """
+        Tests that realtime jobs record their latency, result size and
+        decode and model build times.
+        """
+        metrics = MetricsRegistry()
+        with MockServer() as server:
+            client = RealtimeClient(
+                "user",
+                "pass",
+                metrics=metrics,
+                **server.client_kwargs("realtime"),
+            )
+            client.ecommerce.universal.scrape_url("https://www.example.com")
+
+        source = "universal_ecommerce"
+        collected = metrics.collect()
+        self.assertEqual(
+            collected["oxylabs_requests_total"],
+            {("realtime", source, "ok"): 1},
+        )
+        for name in ("oxylabs_submit_seconds",):
+            self.assertEqual(
+                collected[name][("realtime", source, "ok")]["count"], 1
+            )
+        for name in ("oxylabs_result_bytes", "oxylabs_json_decode_seconds"):
+            self.assertEqual(collected[name][("realtime", source)]["count"], 1)
+        self.assertGreater(
+            metrics["oxylabs_result_bytes"].sum("realtime", source), 1000
+        )
+        self.assertEqual(
+            metrics["oxylabs_model_build_seconds"].count(source), 1
+        )
+
+    @patch("oxylabs.internal.internal.requests.post")
+    def test_realtime_invalid_json(self, post):
+        """
+        Tests that a realtime job answered with a body that is not JSON
+        returns an empty response and is recorded as an error.
+        """
+        post.return_value = Mock(
+            status_code=200, headers={}, content=b"<html></html>"
+        )
+        metrics = MetricsRegistry()
+        client = RealtimeClient("user", "pass", metrics=metrics)
+
+        response = client.ecommerce.universal.scrape_url(
+            "https://www.example.com"
+        )
+
+        self.assertEqual(response.raw, {})
+        self.assertEqual(
+            metrics["oxylabs_requests_total"].get(
+                "realtime", "universal_ecommerce", "error"
+            ),
+            1,
+        )
+
+    async def test_push_pull(self):
+        """
+        Tests that push-pull jobs record every phase, including the polls
+        sent until the job is done.
+        """
+        metrics = MetricsRegistry()
+        async with MockServer(job_duration=0.05) as server:
+            client = AsyncClient(
+                "user", "pass", metrics=metrics, **server.client_kwargs()
+            )
+            await client.ecommerce.universal.scrape_url(
+                "https://www.example.com", poll_interval=0.02
+            )
+
+        source = "universal_ecommerce"
+        self.assertEqual(
+            metrics["oxylabs_requests_total"].get("push_pull", source, "ok"), 1
+        )
+        polls = metrics["oxylabs_polls_per_job"]
+        self.assertEqual(polls.count(source, "done"), 1)
+        self.assertEqual(polls.sum(source, "done"), server.counts["status"])
+        self.assertGreater(
+            metrics["oxylabs_wasted_poll_seconds"].sum(source), 0.01
+        )
+        self.assertGreaterEqual(
+            metrics["oxylabs_time_to_done_seconds"].sum(source, "done"), 0.05
+        )
+        self.assertEqual(
+            metrics["oxylabs_results_seconds"].count(source, "ok"), 1
+        )
+        self.assertEqual(
+            metrics["oxylabs_result_bytes"].count("push_pull", source), 1
+        )
+        self.assertIn(
+            'oxylabs_polls_per_job_count{source="universal_ecommerce",'
+            'outcome="done"} 1',
+            metrics.to_prometheus(),
+        )
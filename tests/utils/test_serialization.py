@@ -0,0 +1,86 @@
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+from oxylabs.sources.ecommerce.amazon.response import AmazonProductResponse
+from oxylabs.sources.serp.response import SERPResponse
+from oxylabs.utils import serialization
+
+DATA = {
+    "results": [
+        {
+            "page": 1,
+            "url": "https://www.google.com/search?q=adidas",
+            "content_parsed": {
+                "results": {"organic": [{"pos": 1, "title": "adidas"}]}
+            },
+        }
+    ],
+    "job": {"id": "1", "source": "google_search", "_links": []},
+}
+
+
+class TestSerialization(unittest.TestCase):
+    def test_round_trip(self):
+        """
+        Tests that a response survives serialization with and without
+        compression.
+        """
+        response = SERPResponse(DATA)
+        for compress in (False, True):
+            restored = SERPResponse.from_bytes(response.to_bytes(compress))
+            self.assertEqual(restored.raw, DATA)
+            self.assertEqual(
+                restored.results[0].content_parsed.results.organic[0].title,
+                "adidas",
+            )
+            self.assertEqual(restored.job.source, "google_search")
+
+    def test_json_fallback(self):
+        """
+        Tests that compact JSON is used when msgpack is not installed.
+        """
+        with patch.object(serialization, "_msgpack", return_value=None):
+            blob = serialization.dumps(DATA)
+            self.assertEqual(blob[:2], b"\x00{")
+            self.assertEqual(serialization.loads(blob), DATA)
+
+    def test_invalid_blob(self):
+        """
+        Tests that empty and unknown blobs are rejected.
+        """
+        with self.assertRaises(ValueError):
+            serialization.loads(b"")
+        with self.assertRaises(ValueError):
+            serialization.loads(b"\x7f{}")
+
+    def test_shared_memory(self):
+        """
+        Tests that a response is passed through shared memory into the
+        model class it is read with.
+        """
+        handle = SERPResponse(DATA).to_shared_memory(compress=True)
+        restored = AmazonProductResponse.from_shared_memory(handle)
+        self.assertIsInstance(restored, AmazonProductResponse)
+        self.assertEqual(restored.raw, DATA)
+
+    def test_shared_memory_outlives_writer(self):
+        """
+        Tests that a block stays readable after the process that wrote it
+        exits, as its resource tracker no longer tracks the block.
+        """
+        writer = (
+            "from oxylabs.utils.serialization import to_shared_memory\n"
+            "print(to_shared_memory(b'blob').name)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", writer],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        handle = serialization.SharedBlob(result.stdout.strip(), 4)
+
+        self.assertEqual(serialization.from_shared_memory(handle), b"blob")
+        self.assertNotIn("leaked", result.stderr)
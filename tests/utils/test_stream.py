@@ -0,0 +1,74 @@
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+from oxylabs.internal import RealtimeClient
+from oxylabs.utils.stream import ResultsStreamParser
+
+DOCUMENT = {
+    "job": {"id": "1", "status": "done", "query": 'say "[hi]" {x}'},
+    "results": [
+        {"page": 1, "content": 'a "quoted" } ] string \\ with escapes'},
+        {"page": 2, "content": {"nested": [1, 2, {"deep": "]"}]}},
+        {"page": 3, "content": "üñî"},
+    ],
+    "total": 3,
+}
+
+
+class TestResultsStreamParser(unittest.TestCase):
+    def test_results_stream_parser_chunking(self):
+        """
+        Tests that the parser yields every result page and keeps the rest of
+        the document, no matter where the chunk boundaries fall.
+        """
+        body = json.dumps(DOCUMENT).encode()
+
+        for size in (1, 2, 3, 7, 64, len(body)):
+            parser = ResultsStreamParser()
+            items = []
+            for i in range(0, len(body), size):
+                items.extend(parser.feed(body[i : i + size]))
+            extra = parser.close()
+
+            self.assertEqual(items, DOCUMENT["results"])
+            self.assertEqual(extra["job"], DOCUMENT["job"])
+            self.assertEqual(extra["results"], [])
+            self.assertEqual(extra["total"], 3)
+
+    def test_results_stream_parser_incomplete(self):
+        """
+        Tests that a truncated document is reported on close.
+        """
+        parser = ResultsStreamParser()
+        parser.feed(b'{"results": [{"page": 1}, {"pa')
+        self.assertRaises(ValueError, parser.close)
+
+
+class TestRealtimeStream(unittest.TestCase):
+    @patch("requests.post")
+    def test_realtime_stream(self, mock_post):
+        """
+        Tests that RealtimeClient._req returns an iterator over the result
+        pages when streaming is requested.
+        """
+        body = json.dumps(DOCUMENT).encode()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [
+            body[i : i + 5] for i in range(0, len(body), 5)
+        ]
+        mock_post.return_value = mock_response
+
+        client = RealtimeClient("user", "pass")
+        pages = list(
+            client.serp.iter_results("google_search", query="nike", pages=3)
+        )
+
+        self.assertEqual([page.page for page in pages], [1, 2, 3])
+        self.assertTrue(mock_post.call_args.kwargs["stream"])
+        self.assertEqual(
+            mock_post.call_args.kwargs["json"],
+            {"query": "nike", "pages": 3, "source": "google_search"},
+        )
+        mock_response.close.assert_called_once()
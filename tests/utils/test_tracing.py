@@ -0,0 +1,245 @@
+import json
+import os
+import tempfile
+import unittest
+
+from oxylabs import (
+    AsyncClient,
+    Hooks,
+    InMemoryExporter,
+    ProxyClient,
+    RealtimeClient,
+)
+from oxylabs.testing import MockServer
+from oxylabs.utils.tracing import current_span
+
+
+def event_names(span) -> list:
+    return [name for name, _, _ in span.events]
+
+
+class TestHooks(unittest.TestCase):
+    def test_nested_spans(self):
+        """
+        Tests that nested layers join the span of the job, which is exported
+        once the outermost layer ends it.
+        """
+        exporter = InMemoryExporter()
+        hooks = Hooks(exporter=exporter)
+
+        outer = hooks.begin("job", source="amazon")
+        inner = hooks.begin("request", url="https://www.example.com")
+        self.assertIs(inner, outer)
+        self.assertIs(current_span(), outer)
+        hooks.end(inner)
+        self.assertEqual(exporter.spans, [])
+        hooks.end(outer)
+
+        self.assertIsNone(current_span())
+        self.assertEqual(exporter.spans, [outer])
+        self.assertEqual(outer.name, "job")
+        self.assertEqual(
+            outer.attributes,
+            {"source": "amazon", "url": "https://www.example.com"},
+        )
+        self.assertEqual(outer.status, "ok")
+        self.assertGreaterEqual(outer.duration, 0)
+
+    def test_callbacks(self):
+        """
+        Tests that callbacks receive the span and details, and that failing
+        callbacks do not propagate.
+        """
+        calls = []
+
+        def fail(span, **details):
+            raise RuntimeError("broken hook")
+
+        hooks = Hooks(
+            on_poll=lambda span, **details: calls.append(details),
+            on_error=fail,
+        )
+        span = hooks.begin("job")
+        hooks.emit("on_poll", span, status="pending")
+        with self.assertLogs("oxylabs.utils.tracing", "ERROR"):
+            hooks.emit("on_error", span, error="timeout")
+        hooks.end(span)
+
+        self.assertEqual(calls, [{"status": "pending"}])
+        self.assertEqual(event_names(span), ["poll", "error"])
+        self.assertEqual(span.status, "error")
+        with self.assertRaises(ValueError):
+            hooks.add("on_unknown", print)
+
+    def test_dump(self):
+        exporter = InMemoryExporter()
+        hooks = Hooks(exporter=exporter)
+        span = hooks.begin("job")
+        hooks.emit("on_fetch", span, bytes=10)
+        hooks.end(span)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "spans.jsonl")
+            exporter.dump(path)
+            with open(path) as file:
+                spans = [json.loads(line) for line in file]
+
+        self.assertEqual(len(spans), 1)
+        self.assertEqual(spans[0]["events"][0]["name"], "fetch")
+        self.assertEqual(spans[0]["events"][0]["attributes"], {"bytes": 10})
+        self.assertEqual(len(spans[0]["trace_id"]), 32)
+
+
+class TestClientHooks(unittest.IsolatedAsyncioTestCase):
+    def test_realtime_and_proxy(self):
+        """
+        Tests that realtime jobs and proxy requests record one span each,
+        with their lifecycle events and attributes.
+        """
+        exporter = InMemoryExporter()
+        hooks = Hooks(exporter=exporter)
+        with MockServer() as server:
+            client = RealtimeClient(
+                "user", "pass", hooks=hooks, **server.client_kwargs("realtime")
+            )
+            client.ecommerce.universal.scrape_url("https://www.example.com")
+            proxy = ProxyClient(
+                "user", "pass", hooks=hooks, **server.client_kwargs("proxy")
+            )
+            proxy.get("http://www.example.com/")
+
+        realtime, proxied = exporter.spans
+        self.assertEqual(realtime.name, "oxylabs.realtime")
+        self.assertEqual(event_names(realtime), ["submit", "done", "fetch"])
+        self.assertEqual(
+            realtime.attributes["oxylabs.source"], "universal_ecommerce"
+        )
+        self.assertIn("oxylabs.model_build.duration_s", realtime.attributes)
+        self.assertGreater(realtime.attributes["http.response.body.size"], 0)
+
+        self.assertEqual(proxied.name, "oxylabs.proxy")
+        self.assertEqual(event_names(proxied), ["submit", "done", "fetch"])
+        self.assertEqual(
+            proxied.attributes["url.full"], "http://www.example.com/"
+        )
+
+    def test_realtime_parallel_pages(self):
+        """
+        Tests that the page jobs of a multi-page job record onto its span,
+        while the jobs of a batch keep a span each.
+        """
+        exporter = InMemoryExporter()
+        hooks = Hooks(exporter=exporter)
+        with MockServer() as server:
+            client = RealtimeClient(
+                "user", "pass", hooks=hooks, **server.client_kwargs("realtime")
+            )
+            client.serp.google.scrape_search(
+                "shoes", pages=3, parallel_pages=True
+            )
+            (span,) = exporter.spans
+            client.map(
+                [
+                    {"source": "bing_search", "query": "shoes"},
+                    {"source": "bing_search", "query": "boots"},
+                ]
+            )
+
+        self.assertEqual(span.status, "ok")
+        self.assertEqual(event_names(span).count("submit"), 3)
+        self.assertEqual(event_names(span).count("fetch"), 3)
+        self.assertEqual(len(exporter.spans), 3)
+        self.assertIsNone(current_span())
+
+    def test_realtime_stream(self):
+        """
+        Tests that a streamed realtime job records its fetch on its span,
+        which is ended once its results are read and is never current.
+        """
+        exporter = InMemoryExporter()
+        hooks = Hooks(exporter=exporter)
+        with MockServer() as server:
+            client = RealtimeClient(
+                "user", "pass", hooks=hooks, **server.client_kwargs("realtime")
+            )
+            pages = client.serp.iter_results(
+                "google_search", query="shoes", pages=2
+            )
+            next(pages)
+            self.assertIsNone(current_span())
+            self.assertEqual(exporter.spans, [])
+            list(pages)
+
+        (span,) = exporter.spans
+        self.assertEqual(event_names(span), ["submit", "done", "fetch"])
+        self.assertEqual(span.status, "ok")
+
+    def test_errors(self):
+        errors = []
+        hooks = Hooks(on_error=lambda span, error: errors.append(error))
+        with MockServer(errors={500: 1.0}) as server:
+            client = RealtimeClient(
+                "user", "pass", hooks=hooks, **server.client_kwargs("realtime")
+            )
+            client.ecommerce.universal.scrape_url("https://www.example.com")
+        self.assertEqual(len(errors), 1)
+
+    async def test_push_pull(self):
+        """
+        Tests that the polls of push-pull jobs are recorded on their span.
+        """
+        exporter = InMemoryExporter()
+        polls = []
+        hooks = Hooks(
+            on_poll=lambda span, status, poll: polls.append(status),
+            exporter=exporter,
+        )
+        async with MockServer(job_duration=0.05) as server:
+            client = AsyncClient(
+                "user", "pass", hooks=hooks, **server.client_kwargs()
+            )
+            await client.ecommerce.universal.scrape_url(
+                "https://www.example.com", poll_interval=0.02
+            )
+
+        (span,) = exporter.spans
+        self.assertEqual(span.name, "oxylabs.push_pull")
+        names = event_names(span)
+        self.assertEqual(names[0], "submit")
+        self.assertEqual(names[-2:], ["done", "fetch"])
+        self.assertEqual(names.count("poll"), server.counts["status"])
+        self.assertEqual(polls[-1], "done")
+        self.assertEqual(span.attributes["oxylabs.polls"], len(polls))
+        for phase in ("submit", "queue", "fetch", "model_build"):
+            self.assertIn(f"oxylabs.{phase}.duration_s", span.attributes)
+        self.assertIn("oxylabs.job_id", span.attributes)
+
+    async def test_push_pull_stream(self):
+        """
+        Tests that jobs run after breaking out of a stream keep spans of
+        their own instead of joining the span of the stream.
+        """
+        exporter = InMemoryExporter()
+        hooks = Hooks(exporter=exporter)
+        async with MockServer(job_duration=0.02) as server:
+            client = AsyncClient(
+                "user", "pass", hooks=hooks, **server.client_kwargs()
+            )
+            pages = client.serp.iter_results(
+                "google_search", query="shoes", pages=2, poll_interval=0.01
+            )
+            async for _ in pages:
+                break
+            self.assertIsNone(current_span())
+            for query in ("a", "b", "c"):
+                await client.serp.google.scrape_search(
+                    query, poll_interval=0.01
+                )
+            self.assertEqual(len(exporter.spans), 3)
+            await pages.aclose()
+
+        *jobs, stream = exporter.spans
+        for span in jobs:
+            self.assertEqual(event_names(span).count("submit"), 1)
+        self.assertEqual(event_names(stream).count("submit"), 1)
+        self.assertIsNotNone(stream.end_time)